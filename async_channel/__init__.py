@@ -21,18 +21,45 @@ from async_channel import constants
 from async_channel.constants import (
     CHANNEL_WILDCARD,
     DEFAULT_QUEUE_SIZE,
+    DEFAULT_MAX_BATCH,
+    DEFAULT_RING_BUFFER_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_SHARED_MEMORY_THRESHOLD,
+    DEFAULT_THREADSAFE_BUFFER_SIZE,
+    DEFAULT_SHARED_MEMORY_RING_SIZE,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_REMOTE_HIGH_WATER_MARK,
+    DEFAULT_REMOTE_MAX_FRAME_SIZE,
+    DEFAULT_RECONNECT_DELAY,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PARTITIONS_COUNT,
+    DEFAULT_DISPATCHER_MAX_RUNNING,
+    DEFAULT_DISPATCHER_WEIGHTS,
+    DEFAULT_QUEUE_HIGH_WATERMARK,
+    DEFAULT_QUEUE_LOW_WATERMARK,
+    DEFAULT_CHANNEL_CREATION_CONCURRENCY,
+    DEFAULT_JOURNAL_SEGMENT_SIZE,
+    DEFAULT_SPILL_QUEUE_MEMORY_SIZE,
+    DEFAULT_SPILL_BATCH_SIZE,
 )
 
 from async_channel import enums
-from async_channel.enums import ChannelConsumerPriorityLevels
+from async_channel.enums import (
+    ChannelConsumerPriorityLevels,
+    SlowConsumerPolicies,
+    QueueOverflowPolicies,
+)
 
 from async_channel import producer
 from async_channel.producer import Producer
 
 from async_channel import consumer
 from async_channel.consumer import (
+    BaseConsumer,
     Consumer,
     InternalConsumer,
+    BaseSupervisedConsumer,
     SupervisedConsumer,
 )
 
@@ -42,10 +69,35 @@ VERSION = "2.2.2"  # major.minor.revision
 __all__ = [
     "CHANNEL_WILDCARD",
     "DEFAULT_QUEUE_SIZE",
+    "DEFAULT_MAX_BATCH",
+    "DEFAULT_RING_BUFFER_SIZE",
+    "DEFAULT_MAX_IN_FLIGHT",
+    "DEFAULT_SHARED_MEMORY_THRESHOLD",
+    "DEFAULT_THREADSAFE_BUFFER_SIZE",
+    "DEFAULT_SHARED_MEMORY_RING_SIZE",
+    "DEFAULT_MIN_POLLING_INTERVAL",
+    "DEFAULT_MAX_POLLING_INTERVAL",
+    "DEFAULT_REMOTE_HIGH_WATER_MARK",
+    "DEFAULT_REMOTE_MAX_FRAME_SIZE",
+    "DEFAULT_RECONNECT_DELAY",
+    "DEFAULT_MAX_CONCURRENCY",
+    "DEFAULT_PARTITIONS_COUNT",
+    "DEFAULT_DISPATCHER_MAX_RUNNING",
+    "DEFAULT_DISPATCHER_WEIGHTS",
+    "DEFAULT_QUEUE_HIGH_WATERMARK",
+    "DEFAULT_QUEUE_LOW_WATERMARK",
+    "DEFAULT_CHANNEL_CREATION_CONCURRENCY",
+    "DEFAULT_JOURNAL_SEGMENT_SIZE",
+    "DEFAULT_SPILL_QUEUE_MEMORY_SIZE",
+    "DEFAULT_SPILL_BATCH_SIZE",
     "ChannelConsumerPriorityLevels",
+    "SlowConsumerPolicies",
+    "QueueOverflowPolicies",
     "Producer",
+    "BaseConsumer",
     "Consumer",
     "InternalConsumer",
+    "BaseSupervisedConsumer",
     "SupervisedConsumer",
     "PROJECT_NAME",
     "VERSION",
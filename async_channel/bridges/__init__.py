@@ -0,0 +1,67 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define bridges connecting channels of different processes
+"""
+from async_channel.bridges import framing
+from async_channel.bridges import shared_memory_ring
+from async_channel.bridges import shared_memory_bridge
+from async_channel.bridges import remote_channel
+from async_channel.bridges import journal_replay
+
+from async_channel.bridges.framing import (
+    encode_frame,
+    decode_payload,
+    encode_json_frame,
+    decode_json_payload,
+    FrameDecoder,
+)
+from async_channel.bridges.shared_memory_ring import (
+    SharedMemoryRing,
+)
+from async_channel.bridges.shared_memory_bridge import (
+    PollingBackoff,
+    SharedMemoryBridgeConsumer,
+    SharedMemoryBridgeProducer,
+)
+from async_channel.bridges.remote_channel import (
+    FramedConnection,
+    RemoteSubscriptionConsumer,
+    ChannelServer,
+    RemoteProducer,
+    RemoteChannel,
+)
+from async_channel.bridges.journal_replay import (
+    JournalReplayProducer,
+)
+
+__all__ = [
+    "encode_frame",
+    "decode_payload",
+    "encode_json_frame",
+    "decode_json_payload",
+    "FrameDecoder",
+    "SharedMemoryRing",
+    "PollingBackoff",
+    "SharedMemoryBridgeConsumer",
+    "SharedMemoryBridgeProducer",
+    "FramedConnection",
+    "RemoteSubscriptionConsumer",
+    "ChannelServer",
+    "RemoteProducer",
+    "RemoteChannel",
+    "JournalReplayProducer",
+]
@@ -0,0 +1,106 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the compact frames format used to send data between processes
+A frame is a 4 bytes little endian payload length followed by the payload: the pickled data.
+Pickled data should only be exchanged between trusted local processes,
+JSON frames are used to receive data from untrusted processes.
+"""
+import json
+import pickle
+import struct
+import typing
+
+# Frame header: the payload length
+FRAME_HEADER = struct.Struct("<I")
+
+
+def encode_frame(data: typing.Any) -> bytes:
+    """
+    :param data: the data to encode
+    :return: the data frame
+    """
+    payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_payload(payload: typing.Union[bytes, memoryview]) -> typing.Any:
+    """
+    :param payload: a frame payload
+    :return: the decoded data
+    """
+    return pickle.loads(payload)
+
+
+def encode_json_frame(data: typing.Any) -> bytes:
+    """
+    :param data: the JSON serializable data to encode
+    :return: the data frame with a JSON payload
+    """
+    payload = json.dumps(data, separators=(",", ":")).encode()
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_json_payload(payload: typing.Union[bytes, memoryview]) -> typing.Any:
+    """
+    Can't execute code: raises ValueError on invalid payloads
+    :param payload: a JSON frame payload
+    :return: the decoded data
+    """
+    return json.loads(bytes(payload))
+
+
+class FrameDecoder:
+    """
+    Splits a bytes stream into frames payloads
+    """
+
+    def __init__(self, max_frame_size: typing.Optional[int] = None):
+        # Max payload bytes count of a frame, unbounded when None
+        self.max_frame_size: typing.Optional[int] = max_frame_size
+
+        self._buffer: bytearray = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        :param chunk: the received bytes
+        :return: the payloads of the frames completed by chunk
+        :raise ValueError: when a frame is larger than max_frame_size
+        """
+        self._buffer += chunk
+        payloads = []
+        offset = 0
+        buffer_size = len(self._buffer)
+        while buffer_size - offset >= FRAME_HEADER.size:
+            (payload_size,) = FRAME_HEADER.unpack_from(self._buffer, offset)
+            if self.max_frame_size is not None and payload_size > self.max_frame_size:
+                raise ValueError(
+                    f"Frame of {payload_size} bytes exceeds {self.max_frame_size} bytes"
+                )
+            frame_end = offset + FRAME_HEADER.size + payload_size
+            if frame_end > buffer_size:
+                break
+            payloads.append(bytes(self._buffer[offset + FRAME_HEADER.size : frame_end]))
+            offset = frame_end
+        if offset:
+            del self._buffer[:offset]
+        return payloads
+
+    def get_pending_size(self) -> int:
+        """
+        :return: the count of buffered bytes of incomplete frames
+        """
+        return len(self._buffer)
@@ -0,0 +1,114 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define JournalReplayProducer replaying a recorded journal into a channel
+"""
+import asyncio
+import typing
+
+import async_channel.enums
+import async_channel.producer as producer
+import async_channel.util.journal as journal
+
+if typing.TYPE_CHECKING:
+    import async_channel.channels.channel
+
+
+class JournalReplayProducer(producer.Producer):
+    """
+    A JournalReplayProducer sends the data recorded in a journal by the channel recorder to its channel consumers.
+    Recorded send arguments are replayed through the channel internal producer send method,
+    the internal producer isn't recorded while replaying: replayed data are not recorded again.
+    Records are replayed at full speed when speed is None, otherwise their recorded delays are divided by speed.
+    When the channel is synchronized, consumers queues are performed after each replayed data:
+    consumers perform data in the recorded order.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        channel: "async_channel.channels.channel.Channel",
+        reader: journal.JournalReader,
+        speed: typing.Optional[float] = None,
+        channel_name: typing.Optional[str] = None,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.OPTIONAL.value,
+    ):
+        super().__init__(channel)
+        self.reader: journal.JournalReader = reader
+
+        # Replay speed multiplier, None to replay at full speed
+        self.speed: typing.Optional[float] = speed
+
+        # The recorded channel name, the channel name when None
+        self.channel_name: str = channel_name or channel.get_name()
+
+        # Minimal priority level of the consumers performed after each replayed data
+        self.priority_level: int = priority_level
+
+        # Count of replayed data
+        self.replayed_count: int = 0
+
+    async def replay(self) -> int:
+        """
+        Sends every recorded data of the channel, in order
+        Can be called directly when the channel is synchronized
+        :return: the count of replayed data
+        """
+        sender = self.channel.get_internal_producer()
+        recorder = self.channel.recorder
+        is_recorded = recorder is not None and sender in recorder.producers
+        if is_recorded:
+            recorder.untrack_producer(sender)  # type: ignore
+        try:
+            return await self._replay(sender)
+        finally:
+            if is_recorded and self.channel.recorder is recorder:
+                recorder.track_producer(sender)  # type: ignore
+
+    async def _replay(self, sender: producer.Producer) -> int:
+        """
+        Sends every recorded data of the channel through sender, in order
+        :param sender: the producer to send data with
+        :return: the count of replayed data
+        """
+        loop = asyncio.get_running_loop()
+        first_timestamp = started_at = None
+        replayed_count = 0
+        for record in self.reader.read(channel_names=(self.channel_name,)):
+            if self.should_stop:
+                break
+            if self.speed is not None:
+                if first_timestamp is None:
+                    first_timestamp, started_at = record.timestamp, loop.time()
+                delay = (record.timestamp - first_timestamp) / self.speed - (
+                    loop.time() - started_at  # type: ignore
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            args, kwargs = record.data
+            await sender.send(*args, **kwargs)
+            if self.channel.is_synchronized:
+                await self.synchronized_perform_consumers_queue(
+                    self.priority_level, False, 0
+                )
+            replayed_count += 1
+            self.replayed_count += 1
+        return replayed_count
+
+    async def start(self) -> None:
+        """
+        Replays the journal
+        """
+        await self.replay()
@@ -0,0 +1,564 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the Unix domain socket ChannelServer and its client side RemoteChannel proxy
+Messages are frames of tuples:
+- ("subscribe", subscription_id, channel_name, consumer_filters) sent by clients
+- ("unsubscribe", subscription_id) sent by clients
+- ("data", subscription_ids, data) sent by the server
+- ("error", subscription_id, message) sent by the server
+Clients messages are JSON encoded: the server never unpickles data received from its socket,
+consumer filters sent upstream should be JSON serializable. Server messages are pickled.
+"""
+import asyncio
+import os
+import socket
+import stat
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.consumer as channel_consumer
+import async_channel.producer as producer
+import async_channel.channels.channel as channel_module
+import async_channel.channels.channel_instances as channel_instances
+import async_channel.util.logging_util as logging
+import async_channel.bridges.framing as framing
+
+SUBSCRIBE = "subscribe"
+UNSUBSCRIBE = "unsubscribe"
+DATA = "data"
+ERROR = "error"
+
+# Size of the socket reads
+READ_SIZE = 64 * 1024
+
+# Umask of the server socket creation: only its owner user can connect, from the socket creation
+SOCKET_UMASK = 0o177
+
+
+class FramedConnection:
+    """
+    A FramedConnection writes messages to a stream as frames.
+    Messages sent during an event loop tick are coalesced into a single write at the end of the tick.
+    The same data sent for several subscriptions during a tick is written once.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        high_water_mark: int = async_channel.constants.DEFAULT_REMOTE_HIGH_WATER_MARK,
+        encode_frame: typing.Callable[[typing.Any], bytes] = framing.encode_frame,
+    ):
+        self.writer: asyncio.StreamWriter = writer
+
+        # Function encoding a message into a frame
+        self.encode_frame: typing.Callable[[typing.Any], bytes] = encode_frame
+
+        # Buffered bytes count above which senders should wait for the stream to be drained
+        self.high_water_mark: int = high_water_mark
+
+        self._pending_messages: list[tuple] = []
+        self._pending_data_subscriptions: dict[int, list[int]] = {}
+        self._is_flush_scheduled: bool = False
+
+    def send(self, message: tuple) -> None:
+        """
+        Sends message at the end of the current event loop tick
+        :param message: the message to send
+        """
+        self._pending_messages.append(message)
+        self._schedule_flush()
+
+    def send_data(self, subscription_id: int, data: typing.Any) -> None:
+        """
+        Sends data to a subscription at the end of the current event loop tick
+        :param subscription_id: the data recipient subscription
+        :param data: the data to send
+        """
+        subscription_ids = self._pending_data_subscriptions.get(id(data))
+        if subscription_ids is None:
+            subscription_ids = [subscription_id]
+            self._pending_data_subscriptions[id(data)] = subscription_ids
+            self._pending_messages.append((DATA, subscription_ids, data))
+            self._schedule_flush()
+        else:
+            subscription_ids.append(subscription_id)
+
+    def is_congested(self) -> bool:
+        """
+        :return: True when the stream buffered bytes count is above the high water mark
+        """
+        return self.writer.transport.get_write_buffer_size() > self.high_water_mark
+
+    async def drain(self) -> None:
+        """
+        Waits for the stream buffer to be drained
+        """
+        await self.writer.drain()
+
+    def is_closing(self) -> bool:
+        """
+        :return: True if the stream is closed or being closed
+        """
+        return self.writer.is_closing()
+
+    def _schedule_flush(self) -> None:
+        """
+        Schedules a flush at the end of the current tick
+        """
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """
+        Writes the pending messages in a single write
+        """
+        self._is_flush_scheduled = False
+        messages = self._pending_messages
+        self._pending_messages = []
+        self._pending_data_subscriptions = {}
+        if messages and not self.writer.is_closing():
+            self.writer.write(
+                b"".join(self.encode_frame(message) for message in messages)
+            )
+
+    async def close(self) -> None:
+        """
+        Closes the stream
+        """
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def read_messages(
+    reader: asyncio.StreamReader,
+    decode_payload: typing.Callable[
+        [typing.Union[bytes, memoryview]], typing.Any
+    ] = framing.decode_payload,
+    max_frame_size: typing.Optional[int] = None,
+) -> typing.AsyncIterator[list]:
+    """
+    Reads the stream messages until it is closed
+    :param reader: the stream reader
+    :param decode_payload: the function decoding a frame payload into a message
+    :param max_frame_size: the max payload bytes count of a frame, unbounded when None
+    :return: an async iterator of the messages received by each read, raises ValueError on too large frames
+    """
+    decoder = framing.FrameDecoder(max_frame_size)
+    while True:
+        chunk = await reader.read(READ_SIZE)
+        if not chunk:
+            return
+        payloads = decoder.feed(chunk)
+        if payloads:
+            yield [decode_payload(payload) for payload in payloads]
+
+
+class RemoteSubscriptionConsumer(channel_consumer.Consumer):
+    """
+    A RemoteSubscriptionConsumer is registered by the ChannelServer on an exposed channel for each client subscription,
+    with the subscription consumer filters. It sends its data to the subscription client.
+    It waits for the client connection to be drained when it is congested, leaving data in its queue.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Optional[typing.Callable] = None,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        queue: typing.Optional[asyncio.Queue] = None,
+        connection: typing.Optional[FramedConnection] = None,
+        subscription_id: int = 0,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+        self.connection: typing.Optional[FramedConnection] = connection
+        self.subscription_id: int = subscription_id
+
+    async def perform(self, kwargs) -> None:
+        """
+        Sends data to the subscription client
+        :param kwargs: queue get content
+        """
+        self.connection.send_data(self.subscription_id, kwargs)  # type: ignore
+        if self.connection.is_congested():  # type: ignore
+            await self.connection.drain()  # type: ignore
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__} for subscription: {self.subscription_id}"
+
+
+class ChannelServer:
+    """
+    A ChannelServer exposes channels of the ChannelInstances registry over a Unix domain socket.
+    Clients subscribe to an exposed channel with consumer filters: the server registers a RemoteSubscriptionConsumer
+    with these filters on the channel, so the channel producers only send matching data to the client.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        channel_names: typing.Iterable[str],
+        chan_id: typing.Optional[str] = None,
+        high_water_mark: int = async_channel.constants.DEFAULT_REMOTE_HIGH_WATER_MARK,
+        max_frame_size: int = async_channel.constants.DEFAULT_REMOTE_MAX_FRAME_SIZE,
+    ):
+        self.logger = logging.get_logger(self.__class__.__name__)
+
+        # Unix domain socket path
+        self.path: str = path
+
+        # Names of the channels clients can subscribe to
+        self.channel_names: set[str] = set(channel_names)
+
+        # Channels id in the registry, None when channels are registered by name only
+        self.chan_id: typing.Optional[str] = chan_id
+
+        self.high_water_mark: int = high_water_mark
+
+        # Max bytes count of a client message, larger messages close the client connection
+        self.max_frame_size: int = max_frame_size
+
+        self.server: typing.Optional[asyncio.AbstractServer] = None
+        self._connections: set[FramedConnection] = set()
+
+    async def start(self) -> None:
+        """
+        Starts accepting clients, the socket is only accessible to its owner user
+        """
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            _remove_stale_socket(self.path)
+            previous_umask = os.umask(SOCKET_UMASK)
+            try:
+                server_socket.bind(self.path)
+            finally:
+                os.umask(previous_umask)
+            self.server = await asyncio.start_unix_server(
+                self._on_connection, sock=server_socket
+            )
+        except BaseException:
+            server_socket.close()
+            raise
+
+    async def stop(self) -> None:
+        """
+        Stops accepting clients and closes the clients connections
+        """
+        if self.server is not None:
+            self.server.close()
+        for connection in list(self._connections):
+            await connection.close()
+        if self.server is not None:
+            await self.server.wait_closed()
+            self.server = None
+
+    def get_channel(self, channel_name: str) -> channel_module.Channel:
+        """
+        :param channel_name: the exposed channel name
+        :return: the exposed channel instance, raises KeyError when not exposed
+        """
+        if channel_name not in self.channel_names:
+            raise KeyError(f"Channel {channel_name} is not exposed")
+        if self.chan_id is None:
+            return channel_module.get_chan(channel_name)
+        return channel_instances.get_chan_at_id(channel_name, self.chan_id)
+
+    async def _on_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Handles a client connection until it is closed
+        """
+        connection = FramedConnection(writer, self.high_water_mark)
+        self._connections.add(connection)
+        subscriptions: dict[
+            int, tuple[channel_module.Channel, RemoteSubscriptionConsumer]
+        ] = {}
+        try:
+            async for messages in read_messages(
+                reader, framing.decode_json_payload, self.max_frame_size
+            ):
+                for message in messages:
+                    await self._handle_message(connection, subscriptions, message)
+        except (ConnectionError, OSError) as error:
+            self.logger.debug(f"Client connection lost: {error}")
+        except (ValueError, TypeError) as error:
+            self.logger.error(f"Closing client connection on invalid message: {error}")
+        finally:
+            self._connections.discard(connection)
+            for channel, subscription_consumer in subscriptions.values():
+                await channel.remove_consumer(subscription_consumer)
+            await connection.close()
+
+    async def _handle_message(
+        self,
+        connection: FramedConnection,
+        subscriptions: dict,
+        message: list,
+    ) -> None:
+        """
+        Handles a client message, raises ValueError or TypeError on invalid messages
+        """
+        if not isinstance(message, list) or not message:
+            raise ValueError(f"Invalid message: {message}")
+        if message[0] == SUBSCRIBE:
+            _, subscription_id, channel_name, consumer_filters = message
+            if not (
+                isinstance(subscription_id, int)
+                and isinstance(channel_name, str)
+                and isinstance(consumer_filters, dict)
+            ):
+                raise ValueError(f"Invalid subscription: {message}")
+            try:
+                channel = self.get_channel(channel_name)
+            except KeyError as error:
+                connection.send((ERROR, subscription_id, str(error)))
+                return
+            renewed_subscription = subscriptions.pop(subscription_id, None)
+            if renewed_subscription is not None:
+                await renewed_subscription[0].remove_consumer(renewed_subscription[1])
+            subscriptions[subscription_id] = (
+                channel,
+                await channel.new_consumer(
+                    consumer_filters=consumer_filters,
+                    consumer_class=RemoteSubscriptionConsumer,
+                    connection=connection,
+                    subscription_id=subscription_id,
+                ),
+            )
+        elif message[0] == UNSUBSCRIBE:
+            subscription = subscriptions.pop(message[1], None)
+            if subscription is not None:
+                await subscription[0].remove_consumer(subscription[1])
+        else:
+            self.logger.error(f"Unknown message: {message[0]}")
+
+
+class RemoteProducer(producer.Producer):
+    """
+    A RemoteProducer maintains its RemoteChannel connection to the ChannelServer and
+    sends the received data to its channel consumers.
+    When the connection is lost, the producer is paused until it is connected again and its subscriptions are renewed.
+    """
+
+    def __init__(self, channel: "RemoteChannel"):
+        super().__init__(channel)
+        self.connection: typing.Optional[FramedConnection] = None
+        self.is_connected: bool = False
+
+    async def start(self) -> None:
+        """
+        Connects to the server and reads its messages, reconnects when the connection is lost
+        """
+        while not self.should_stop:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.channel.path)
+            except (ConnectionError, OSError) as error:
+                self.logger.debug(f"Can't connect to {self.channel.path}: {error}")
+            else:
+                await self._on_connection(reader, writer)
+            await asyncio.sleep(self.channel.reconnect_delay)
+
+    async def _on_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Renews the subscriptions and reads messages until the connection is lost
+        """
+        self.connection = FramedConnection(
+            writer, encode_frame=framing.encode_json_frame
+        )
+        self.is_connected = True
+        try:
+            for subscription_id, consumer_filters in list(
+                self.channel.subscriptions_filters.items()
+            ):
+                self.subscribe(subscription_id, consumer_filters)
+            await self.channel.on_connection_change()
+            async for messages in read_messages(reader):
+                for message in messages:
+                    await self._handle_message(message)
+        except (ConnectionError, OSError) as error:
+            self.logger.debug(f"Connection lost: {error}")
+        finally:
+            self.is_connected = False
+            connection = self.connection
+            self.connection = None
+            await connection.close()
+            if not self.should_stop:
+                await self.pause()
+
+    async def _handle_message(self, message: tuple) -> None:
+        """
+        Handles a server message
+        """
+        if message[0] == DATA:
+            _, subscription_ids, data = message
+            await self.send(data, subscription_ids=subscription_ids)
+        elif message[0] == ERROR:
+            self.logger.error(f"Subscription {message[1]} error: {message[2]}")
+        else:
+            self.logger.error(f"Unknown message: {message[0]}")
+
+    async def send(
+        self,
+        data: typing.Any,
+        subscription_ids: typing.Optional[typing.Iterable[int]] = None,
+    ) -> None:
+        """
+        Send data to the consumers of the given subscriptions
+        :param data: data to be put into consumers queues
+        :param subscription_ids: the data recipient subscriptions, every consumer when None
+        """
+        if subscription_ids is None:
+            await super().send(data)
+            return
+        for subscription_id in subscription_ids:
+            subscription_consumer = self.channel.subscriptions_consumers.get(
+                subscription_id
+            )
+            if subscription_consumer is not None:
+                await self.send_to_consumer(subscription_consumer, data)
+
+    def subscribe(self, subscription_id: int, consumer_filters: dict) -> None:
+        """
+        Sends a subscription to the server when connected
+        """
+        if self.connection is not None:
+            self.connection.send(
+                (SUBSCRIBE, subscription_id, self.channel.remote_name, consumer_filters)
+            )
+
+    def unsubscribe(self, subscription_id: int) -> None:
+        """
+        Sends a subscription removal to the server when connected
+        """
+        if self.connection is not None:
+            self.connection.send((UNSUBSCRIBE, subscription_id))
+
+    async def stop(self) -> None:
+        """
+        Stops reconnecting and closes the connection
+        """
+        await super().stop()
+        if self.connection is not None:
+            await self.connection.close()
+
+
+class RemoteChannel(channel_module.Channel):
+    """
+    A RemoteChannel is a local proxy of a channel exposed by a ChannelServer.
+    Its consumers are registered as usual with new_consumer: their consumer filters are sent upstream
+    and only data matching these filters are received.
+    Its producers are paused while it is disconnected from the server.
+    Should be connected with
+        >>> await remote_channel.connect()
+    """
+
+    PRODUCER_CLASS = RemoteProducer
+    CONSUMER_CLASS = channel_consumer.Consumer
+
+    def __init__(
+        self,
+        path: str,
+        remote_name: str,
+        reconnect_delay: float = async_channel.constants.DEFAULT_RECONNECT_DELAY,
+    ):
+        super().__init__()
+        # ChannelServer Unix domain socket path
+        self.path: str = path
+
+        # Remote channel name
+        self.remote_name: str = remote_name
+
+        # Time to wait between connection attempts
+        self.reconnect_delay: float = reconnect_delay
+
+        # Subscriptions by id
+        self.subscriptions_filters: dict[int, dict] = {}
+        self.subscriptions_consumers: dict[int, "channel_consumer.Consumer"] = {}
+        self._subscription_ids: dict["channel_consumer.Consumer", int] = {}
+        self._next_subscription_id: int = 0
+
+    async def connect(self) -> None:
+        """
+        Starts the internal producer that connects to the server
+        """
+        await self.get_internal_producer().run()
+
+    def add_new_consumer(
+        self, consumer: "channel_consumer.Consumer", consumer_filters: dict
+    ) -> None:
+        """
+        Add a new consumer to consumer list and subscribes to the remote channel with its filters
+        :param consumer: the consumer to add
+        :param consumer_filters: the consumer selection filters
+        """
+        subscription_id = self._next_subscription_id
+        self._next_subscription_id += 1
+        remote_filters = dict(consumer_filters)
+        remote_filters.pop(self.INSTANCE_KEY, None)
+        self.subscriptions_filters[subscription_id] = remote_filters
+        self.subscriptions_consumers[subscription_id] = consumer
+        self._subscription_ids[consumer] = subscription_id
+        super().add_new_consumer(consumer, consumer_filters)
+        self.get_internal_producer().subscribe(subscription_id, remote_filters)
+
+    def on_consumer_removed(self, consumer: "channel_consumer.Consumer") -> None:
+        """
+        Removes the removed consumer subscription
+        :param consumer: the removed consumer
+        """
+        subscription_id = self._subscription_ids.pop(consumer, None)
+        if subscription_id is not None:
+            self.subscriptions_filters.pop(subscription_id, None)
+            self.subscriptions_consumers.pop(subscription_id, None)
+            self.get_internal_producer().unsubscribe(subscription_id)
+        super().on_consumer_removed(consumer)
+
+    async def on_connection_change(self) -> None:
+        """
+        Called when the connection to the server is established
+        """
+        await self._check_producers_state()
+
+    def _should_resume_producers(self) -> bool:
+        """
+        Producers are only resumed when connected
+        :return: True if channel producers should be resumed
+        """
+        return (
+            self.get_internal_producer().is_connected  # type: ignore
+            and super()._should_resume_producers()
+        )
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Removes the socket file left at path by a previous server, like asyncio.start_unix_server does
+    """
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+    except FileNotFoundError:
+        pass
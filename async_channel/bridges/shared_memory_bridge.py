@@ -0,0 +1,155 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the shared memory bridge classes mirroring a channel into another local process
+"""
+import asyncio
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.producer as producer
+import async_channel.consumers.batch_consumer as batch_consumer
+import async_channel.bridges.framing as framing
+import async_channel.bridges.shared_memory_ring as shared_memory_ring
+
+if typing.TYPE_CHECKING:
+    import async_channel.channels.channel
+
+
+class PollingBackoff:
+    """
+    Exponential waiting time used to poll a shared memory ring without busy looping when it is idle
+    """
+
+    def __init__(self, min_interval: float, max_interval: float):
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.interval: float = 0
+
+    async def wait(self) -> None:
+        """
+        Waits for the current interval then increases it
+        """
+        await asyncio.sleep(self.interval)
+        self.interval = min(
+            self.max_interval, max(self.min_interval, self.interval * 2)
+        )
+
+    def reset(self) -> None:
+        """
+        Resets the interval after a successful poll
+        """
+        self.interval = 0
+
+
+class SharedMemoryBridgeConsumer(batch_consumer.BatchConsumer):
+    """
+    A SharedMemoryBridgeConsumer writes the data of its channel into a SharedMemoryRing read by another process.
+    Queued data are written by batches: the ring write position is published once per batch.
+    When the ring is full, it waits for the reader process, leaving data in its queue.
+    Should be created with its ring
+        >>> await channel.new_consumer(consumer_class=SharedMemoryBridgeConsumer, ring=ring)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Optional[typing.Callable] = None,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        max_batch: int = async_channel.constants.DEFAULT_MAX_BATCH,
+        max_wait: float = 0,
+        queue: typing.Optional[asyncio.Queue] = None,
+        ring: typing.Optional[shared_memory_ring.SharedMemoryRing] = None,
+        max_polling_interval: float = async_channel.constants.DEFAULT_MAX_POLLING_INTERVAL,
+    ):
+        super().__init__(
+            callback,
+            size=size,
+            priority_level=priority_level,
+            max_batch=max_batch,
+            max_wait=max_wait,
+            queue=queue,
+        )
+        if ring is None:
+            raise ValueError("A SharedMemoryBridgeConsumer requires a ring")
+        self.ring: shared_memory_ring.SharedMemoryRing = ring
+        self.backoff: PollingBackoff = PollingBackoff(
+            async_channel.constants.DEFAULT_MIN_POLLING_INTERVAL, max_polling_interval
+        )
+
+        # Count of data written into the ring
+        self.written_count: int = 0
+
+    async def perform_batch(self, batch: list) -> None:
+        """
+        Writes the batch data frames into the ring, waits for free space when the ring is full
+        :param batch: the queue get contents
+        """
+        frames = [framing.encode_frame(data) for data in batch]
+        while frames:
+            written_count = self.ring.write(frames)
+            if written_count:
+                frames = frames[written_count:]
+                self.written_count += written_count
+                self.backoff.reset()
+            else:
+                await self.backoff.wait()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__} writing to ring: {self.ring.name}"
+
+
+class SharedMemoryBridgeProducer(producer.Producer):
+    """
+    A SharedMemoryBridgeProducer sends the data read from a SharedMemoryRing written by another process
+    to its channel consumers.
+    Every available data is read at each poll, an idle ring is polled with an exponential backoff.
+    While the channel is paused, the ring isn't read: the writer process waits for free space.
+    """
+
+    def __init__(
+        self,
+        channel: "async_channel.channels.channel.Channel",
+        ring: shared_memory_ring.SharedMemoryRing,
+        max_polling_interval: float = async_channel.constants.DEFAULT_MAX_POLLING_INTERVAL,
+    ):
+        super().__init__(channel)
+        self.ring: shared_memory_ring.SharedMemoryRing = ring
+        self.backoff: PollingBackoff = PollingBackoff(
+            async_channel.constants.DEFAULT_MIN_POLLING_INTERVAL, max_polling_interval
+        )
+
+    async def receive(self) -> int:
+        """
+        Sends every data available in the ring
+        Can be called directly when the channel is synchronized
+        :return: the count of sent data
+        """
+        payloads = self.ring.read()
+        for payload in payloads:
+            await self.send(framing.decode_payload(payload))
+        return len(payloads)
+
+    async def start(self) -> None:
+        """
+        Polls the ring until stopped
+        """
+        while not self.should_stop:
+            if not self.channel.is_paused and await self.receive():
+                self.backoff.reset()
+            else:
+                await self.backoff.wait()
@@ -0,0 +1,183 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define SharedMemoryRing: a single producer single consumer frames ring buffer in shared memory
+"""
+import multiprocessing.resource_tracker as resource_tracker
+import multiprocessing.shared_memory as shared_memory
+import os
+import struct
+import sys
+import typing
+
+import async_channel.constants
+import async_channel.bridges.framing as framing
+
+
+class SharedMemoryRing:
+    """
+    A SharedMemoryRing is a bytes ring buffer stored in a shared memory block, used to send frames
+    from a single writer process to a single reader process without any system call.
+    The block starts with a header containing the total written and read bytes counts and the ring capacity.
+    Positions are only published once per written or read frames batch.
+    """
+
+    # write position, read position, capacity
+    HEADER = struct.Struct("<QQQ")
+    HEADER_SIZE = 64
+
+    def __init__(self, block: shared_memory.SharedMemory, is_owner: bool):
+        self.block: shared_memory.SharedMemory = block
+
+        # The owner unlinks the shared memory block when closed
+        self.is_owner: bool = is_owner
+
+        self.capacity: int = self.HEADER.unpack_from(block.buf, 0)[2]
+        self._data: memoryview = block.buf[
+            self.HEADER_SIZE : self.HEADER_SIZE + self.capacity
+        ]
+
+    @classmethod
+    def create(
+        cls,
+        capacity: int = async_channel.constants.DEFAULT_SHARED_MEMORY_RING_SIZE,
+        name: typing.Optional[str] = None,
+    ) -> "SharedMemoryRing":
+        """
+        Creates a new ring and its shared memory block
+        :param capacity: the ring data bytes count
+        :param name: the shared memory block name, generated when None
+        :return: the created ring
+        """
+        block = shared_memory.SharedMemory(
+            name=name, create=True, size=cls.HEADER_SIZE + capacity
+        )
+        cls.HEADER.pack_into(block.buf, 0, 0, 0, capacity)
+        return cls(block, True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        """
+        Attaches to an existing ring
+        :param name: the ring shared memory block name
+        :return: the attached ring
+        """
+        if sys.version_info >= (3, 13):
+            return cls(
+                shared_memory.SharedMemory(  # pylint: disable=unexpected-keyword-arg
+                    name=name, track=False
+                ),
+                False,
+            )
+        block = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            # the attaching process resource tracker would unlink the owner block when this process exits
+            block_name = block._name  # pylint: disable=protected-access
+            resource_tracker.unregister(block_name, "shared_memory")
+        return cls(block, False)
+
+    @property
+    def name(self) -> str:
+        """
+        :return: the shared memory block name, used to attach the ring from another process
+        """
+        return self.block.name
+
+    def get_used_size(self) -> int:
+        """
+        :return: the count of written bytes that are not read yet
+        """
+        write_position, read_position, _ = self.HEADER.unpack_from(self.block.buf, 0)
+        return write_position - read_position
+
+    def write(self, frames: typing.Sequence[bytes]) -> int:
+        """
+        Writes as many of the given frames as the ring free space allows, in order
+        Should only be called by the ring writer
+        :param frames: encoded frames
+        :return: the count of written frames
+        """
+        write_position, read_position, _ = self.HEADER.unpack_from(self.block.buf, 0)
+        free_size = self.capacity - (write_position - read_position)
+        written_count = 0
+        for frame in frames:
+            frame_size = len(frame)
+            if frame_size > self.capacity:
+                raise ValueError(
+                    f"Frame of {frame_size} bytes is larger than the ring capacity ({self.capacity} bytes)"
+                )
+            if frame_size > free_size:
+                break
+            self._copy_in(write_position, frame)
+            write_position += frame_size
+            free_size -= frame_size
+            written_count += 1
+        if written_count:
+            struct.pack_into("<Q", self.block.buf, 0, write_position)
+        return written_count
+
+    def read(self) -> list[bytes]:
+        """
+        Reads every available frame
+        Should only be called by the ring reader
+        :return: the read frames payloads
+        """
+        write_position, read_position, _ = self.HEADER.unpack_from(self.block.buf, 0)
+        payloads = []
+        while read_position < write_position:
+            (payload_size,) = framing.FRAME_HEADER.unpack(
+                self._copy_out(read_position, framing.FRAME_HEADER.size)
+            )
+            read_position += framing.FRAME_HEADER.size
+            payloads.append(self._copy_out(read_position, payload_size))
+            read_position += payload_size
+        if payloads:
+            struct.pack_into("<Q", self.block.buf, 8, read_position)
+        return payloads
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        """
+        Copies data in the ring at position, wrapping around the ring end
+        """
+        offset = position % self.capacity
+        first_part_size = min(len(data), self.capacity - offset)
+        self._data[offset : offset + first_part_size] = data[:first_part_size]
+        if first_part_size < len(data):
+            self._data[: len(data) - first_part_size] = data[first_part_size:]
+
+    def _copy_out(self, position: int, size: int) -> bytes:
+        """
+        :return: size bytes of the ring from position, wrapping around the ring end
+        """
+        offset = position % self.capacity
+        first_part_size = min(size, self.capacity - offset)
+        data = self._data[offset : offset + first_part_size].tobytes()
+        if first_part_size < size:
+            data += self._data[: size - first_part_size].tobytes()
+        return data
+
+    def close(self) -> None:
+        """
+        Closes the ring, the owner also destroys its shared memory block
+        """
+        self._data.release()
+        self.block.close()
+        if self.is_owner:
+            if sys.version_info < (3, 13) and os.name == "posix":
+                # restores the registration removed by a ring attached with the same resource tracker
+                block_name = self.block._name  # pylint: disable=protected-access
+                resource_tracker.register(block_name, "shared_memory")
+            self.block.unlink()
@@ -16,16 +16,43 @@
 """
 Define async_channel implementation and usage
 """
+from async_channel.channels import backpressure
 from async_channel.channels import channel_instances
+from async_channel.channels import compact_filters
+from async_channel.channels import consumers_list
+from async_channel.channels import dirty_consumers_tracker
+from async_channel.channels import priority_dispatcher
 from async_channel.channels import channel
+from async_channel.channels import broadcast_channel
 
+from async_channel.channels.backpressure import (
+    QueueWatermarks,
+    BackpressureController,
+    get_default_watermarks,
+)
 from async_channel.channels.channel_instances import (
     ChannelInstances,
+    LazyChannel,
     set_chan_at_id,
     get_channels,
     del_channel_container,
     get_chan_at_id,
     del_chan_at_id,
+    get_channels_by_name,
+    get_channels_by_class,
+    get_channels_snapshot,
+)
+from async_channel.channels.compact_filters import (
+    CompactFilters,
+)
+from async_channel.channels.consumers_list import (
+    ConsumersList,
+)
+from async_channel.channels.dirty_consumers_tracker import (
+    DirtyConsumersTracker,
+)
+from async_channel.channels.priority_dispatcher import (
+    PriorityDispatcher,
 )
 from async_channel.channels.channel import (
     Channel,
@@ -33,16 +60,33 @@ from async_channel.channels.channel import (
     del_chan,
     get_chan,
 )
+from async_channel.channels.broadcast_channel import (
+    BroadcastChannel,
+    BroadcastProducer,
+)
 
 __all__ = [
+    "QueueWatermarks",
+    "BackpressureController",
+    "get_default_watermarks",
     "ChannelInstances",
+    "LazyChannel",
     "set_chan_at_id",
     "get_channels",
     "del_channel_container",
     "get_chan_at_id",
     "del_chan_at_id",
+    "get_channels_by_name",
+    "get_channels_by_class",
+    "get_channels_snapshot",
+    "CompactFilters",
+    "ConsumersList",
+    "DirtyConsumersTracker",
+    "PriorityDispatcher",
     "Channel",
     "set_chan",
     "del_chan",
     "get_chan",
+    "BroadcastChannel",
+    "BroadcastProducer",
 ]
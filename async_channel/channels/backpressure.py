@@ -0,0 +1,185 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define queue watermarks based backpressure from slow consumers to channel producers
+"""
+import asyncio
+import functools
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.queues.observed_queue as observed_queue
+import async_channel.util.logging_util as logging
+
+if typing.TYPE_CHECKING:
+    import async_channel.consumer
+
+
+class QueueWatermarks:
+    """
+    A consumer queue is congested when its size reaches high and is drained when its size is back to low
+    """
+
+    def __init__(self, high: int, low: int):
+        if not 0 <= low < high:
+            raise ValueError(
+                f"Invalid watermarks: low ({low}) should be lower than high ({high})"
+            )
+        self.high: int = high
+        self.low: int = low
+
+
+def get_default_watermarks() -> dict[int, QueueWatermarks]:
+    """
+    :return: the default watermarks: OPTIONAL consumers never pause producers as they don't keep them running
+    """
+    return {
+        priority_level.value: QueueWatermarks(
+            async_channel.constants.DEFAULT_QUEUE_HIGH_WATERMARK,
+            async_channel.constants.DEFAULT_QUEUE_LOW_WATERMARK,
+        )
+        for priority_level in async_channel.enums.ChannelConsumerPriorityLevels
+        if priority_level
+        is not async_channel.enums.ChannelConsumerPriorityLevels.OPTIONAL
+    }
+
+
+class BackpressureController:
+    """
+    Calls on_congestion_change when a consumer queue gets congested and once every queue is drained:
+    channels use it to pause their producers while a consumer queue is congested.
+    Queues sizes are only checked when data is put in them and, while congested, when data is got from them.
+    Consumers which priority level has no watermarks and queues that are not asyncio.Queue are not tracked.
+    """
+
+    def __init__(
+        self,
+        watermarks: dict[int, QueueWatermarks],
+        on_congestion_change: typing.Callable[[], typing.Awaitable],
+    ):
+        self.logger = logging.get_logger(self.__class__.__name__)
+
+        # Watermarks by consumer priority level
+        self.watermarks: dict[int, QueueWatermarks] = watermarks
+
+        # Coroutine function called from the event loop when is_congested changes
+        self.on_congestion_change: typing.Callable[[], typing.Awaitable] = (
+            on_congestion_change
+        )
+
+        # Consumers which queue reached their high watermark and is not drained yet
+        self.congested_consumers: set["async_channel.consumer.Consumer"] = set()
+
+        # Tracked consumers queue observers
+        self._put_observers: dict[
+            "async_channel.consumer.Consumer", typing.Callable[[], None]
+        ] = {}
+        self._get_observers: dict[
+            "async_channel.consumer.Consumer", typing.Callable[[], None]
+        ] = {}
+
+        self._congestion_change_tasks: set[asyncio.Task] = set()
+
+    def is_congested(self) -> bool:
+        """
+        :return: True if a consumer queue is congested
+        """
+        return bool(self.congested_consumers)
+
+    def track(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Starts checking consumer queue size when its priority level has watermarks
+        :param consumer: the consumer to track
+        """
+        watermarks = self.watermarks.get(consumer.priority_level)
+        if watermarks is None or consumer in self._put_observers:
+            return
+        observer = functools.partial(self._on_put, consumer, watermarks)
+        if observed_queue.observe_put(consumer.queue, observer):
+            self._put_observers[consumer] = observer
+            observer()
+
+    def untrack(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Stops checking consumer queue size, producers are resumed if it was the last congested consumer
+        :param consumer: the tracked consumer
+        """
+        put_observer = self._put_observers.pop(consumer, None)
+        if put_observer is None:
+            return
+        observed_queue.unobserve_put(consumer.queue, put_observer)
+        self._set_drained(consumer)
+
+    def untrack_all(self) -> None:
+        """
+        Stops checking every consumer queue size
+        """
+        for consumer in list(self._put_observers):
+            self.untrack(consumer)
+
+    def _on_put(
+        self,
+        consumer: "async_channel.consumer.Consumer",
+        watermarks: QueueWatermarks,
+    ) -> None:
+        """
+        Marks consumer as congested when its queue reaches the high watermark
+        """
+        if (
+            consumer.queue.qsize() < watermarks.high
+            or consumer in self.congested_consumers
+        ):
+            return
+        get_observer = functools.partial(self._on_get, consumer, watermarks)
+        self._get_observers[consumer] = get_observer
+        observed_queue.observe_get(consumer.queue, get_observer)
+        self.congested_consumers.add(consumer)
+        if len(self.congested_consumers) == 1:
+            self.logger.debug(f"{consumer} queue is congested")
+            self._notify_congestion_change()
+
+    def _on_get(
+        self,
+        consumer: "async_channel.consumer.Consumer",
+        watermarks: QueueWatermarks,
+    ) -> None:
+        """
+        Marks consumer as drained when its queue is back to the low watermark
+        """
+        if consumer.queue.qsize() <= watermarks.low:
+            self._set_drained(consumer)
+
+    def _set_drained(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Removes consumer from congested consumers, producers are resumed when no consumer is congested anymore
+        """
+        get_observer = self._get_observers.pop(consumer, None)
+        if get_observer is None:
+            return
+        observed_queue.unobserve_get(consumer.queue, get_observer)
+        self.congested_consumers.discard(consumer)
+        if not self.congested_consumers:
+            self.logger.debug("Consumers queues are drained")
+            self._notify_congestion_change()
+
+    def _notify_congestion_change(self) -> None:
+        """
+        Calls on_congestion_change from the event loop
+        """
+        task = asyncio.get_running_loop().create_task(self.on_congestion_change())
+        self._congestion_change_tasks.add(task)
+        task.add_done_callback(self._congestion_change_tasks.discard)
@@ -0,0 +1,102 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Defines the broadcast channel classes: BroadcastChannel and BroadcastProducer
+"""
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.producer as producer
+import async_channel.queues.ring_buffer as ring_buffer
+import async_channel.channels.channel as channel
+
+if typing.TYPE_CHECKING:
+    import async_channel.consumer
+
+
+class BroadcastProducer(producer.Producer):
+    """
+    A BroadcastProducer writes each sent data once in its BroadcastChannel ring buffer
+    instead of putting it in every consumer queue
+    """
+
+    async def send(self, data: typing.Any) -> None:
+        """
+        Write data in the channel ring buffer, read by each consumer from its own cursor
+        :param data: data to be read by consumers
+        """
+        await self.channel.broadcast(data)  # type: ignore
+
+
+class BroadcastChannel(channel.Channel):
+    """
+    A BroadcastChannel is a Channel backed by a single bounded ring buffer:
+    each sent data is written once and each consumer reads it from its own cursor.
+    Each consumer queue is replaced by a reader of the channel ring buffer.
+    Consumers that are too late to read are handled according to SLOW_CONSUMER_POLICY.
+    Data are broadcast to every consumer: consumer filters are not used to select recipients.
+    """
+
+    PRODUCER_CLASS = BroadcastProducer
+
+    # Maximum count of data kept in the ring buffer
+    RING_BUFFER_SIZE = async_channel.constants.DEFAULT_RING_BUFFER_SIZE
+
+    # Policy applied to consumers that are too late to read the ring buffer
+    SLOW_CONSUMER_POLICY = async_channel.enums.SlowConsumerPolicies.BLOCK
+
+    def __init__(self):
+        super().__init__()
+        self.ring_buffer: ring_buffer.RingBuffer = ring_buffer.RingBuffer(
+            self.RING_BUFFER_SIZE, self.SLOW_CONSUMER_POLICY
+        )
+        self._consumers_by_reader: dict[
+            ring_buffer.RingBufferReader, "async_channel.consumer.Consumer"
+        ] = {}
+
+    def add_new_consumer(
+        self, consumer: "async_channel.consumer.Consumer", consumer_filters: dict
+    ) -> None:
+        """
+        Replace the consumer queue by a ring buffer reader and add it to consumer list
+        :param consumer: the consumer to add
+        :param consumer_filters: the consumer selection filters
+        """
+        reader = self.ring_buffer.create_reader()
+        consumer.queue = reader  # type: ignore
+        self._consumers_by_reader[reader] = consumer
+        super().add_new_consumer(consumer, consumer_filters)
+
+    def on_consumer_removed(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Remove the removed consumer ring buffer reader
+        :param consumer: the removed consumer
+        """
+        if self._consumers_by_reader.pop(consumer.queue, None) is not None:  # type: ignore
+            self.ring_buffer.remove_reader(consumer.queue)  # type: ignore
+        super().on_consumer_removed(consumer)
+
+    async def broadcast(self, data: typing.Any) -> None:
+        """
+        Write data in the ring buffer and remove consumers disconnected by the DISCONNECT policy
+        :param data: the data to broadcast
+        """
+        for reader in await self.ring_buffer.put(data):
+            consumer = self._consumers_by_reader.get(reader)
+            if consumer is not None:
+                self.logger.warning(f"Disconnecting slow consumer: {consumer}")
+                await self.remove_consumer(consumer)
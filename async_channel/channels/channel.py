@@ -20,14 +20,22 @@ Defines the channel core class : Channel
 import typing
 
 import async_channel.util.logging_util as logging
+import async_channel.util.journal as journal
+import async_channel.util.metrics as metrics
 import async_channel.enums
+import async_channel.channels.backpressure as backpressure
 import async_channel.channels.channel_instances as channel_instances
+import async_channel.channels.compact_filters as compact_filters
+import async_channel.channels.consumers_list as consumers_list
+import async_channel.channels.consumer_filters_index as consumer_filters_index
+import async_channel.channels.dirty_consumers_tracker as dirty_consumers_tracker
+import async_channel.channels.priority_dispatcher as priority_dispatcher
 
 if typing.TYPE_CHECKING:
     import async_channel.producer
 
 
-# pylint: disable=undefined-variable, not-callable
+# pylint: disable=undefined-variable, not-callable, too-many-instance-attributes, too-many-public-methods
 class Channel:
     """
     A Channel is the object to connect a producer / producers class(es) to a consumer / consumers class(es)
@@ -54,6 +62,12 @@ class Channel:
         async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value
     )
 
+    # When True, consumer filter values also have to share the same type to match (1 won't match True)
+    STRICT_CONSUMER_FILTERS = False
+
+    # When True, consumer filters are stored as read only CompactFilters to reduce each subscription memory
+    COMPACT_CONSUMER_FILTERS = False
+
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
 
@@ -66,7 +80,28 @@ class Channel:
         # Channel subscribed consumers list: list dicts of dicts containing:
         # - At least a consumer instance under the INSTANCE_KEY key
         # - Possibly other filters under other keys and values
-        self.consumers: list[dict[str, typing.Any]] = []
+        # Should be updated using 'add_new_consumer' and 'remove_consumer', direct updates are counted by its version
+        self.consumers = consumers_list.ConsumersList()
+
+        # Cached consumers views and the self.consumers version they are computed from
+        self._consumers_views_version: int = -1
+        self._consumers_view: typing.Optional[
+            tuple["async_channel.consumer.Consumer", ...]
+        ] = None
+        self._prioritized_consumers_views: dict[
+            int, tuple["async_channel.consumer.Consumer", ...]
+        ] = {}
+        self._non_optional_consumers_count: int = 0
+
+        # Version of self.consumers indexed by self.consumer_filters_index
+        self._consumer_filters_index_version: int = 0
+
+        # Inverted index of self.consumers filters, used to select consumers from filters
+        self.consumer_filters_index: consumer_filters_index.ConsumerFiltersIndex = (
+            consumer_filters_index.ConsumerFiltersIndex(
+                strict=self.STRICT_CONSUMER_FILTERS
+            )
+        )
 
         # Used to perform global send from non-producer context
         self.internal_producer: typing.Optional["async_channel.producer.Producer"] = (
@@ -76,8 +111,50 @@ class Channel:
         # Used to save producers state (paused or not)
         self.is_paused: bool = True
 
+        # Consumers with pending work, only tracked when the channel is synchronized
+        self.dirty_consumers_tracker: typing.Optional[
+            dirty_consumers_tracker.DirtyConsumersTracker
+        ] = None
+
         # Used to synchronize producers and consumer
-        self.is_synchronized: bool = False
+        self.is_synchronized = False
+
+        # Channel metrics, None when metrics are disabled
+        self.metrics: typing.Optional[metrics.ChannelMetrics] = None
+
+        # Channel producers journal recorder, None when recording is disabled
+        self.recorder: typing.Optional[journal.JournalRecorder] = None
+
+        # Gives consumers perform turns by priority level, None when disabled
+        self.dispatcher: typing.Optional[priority_dispatcher.PriorityDispatcher] = None
+
+        # Pauses producers while a consumer queue is congested, None when disabled
+        self.backpressure: typing.Optional[backpressure.BackpressureController] = None
+
+    @property
+    def is_synchronized(self) -> bool:
+        """
+        :return: True if producers and consumers are synchronized
+        """
+        return self.dirty_consumers_tracker is not None
+
+    @is_synchronized.setter
+    def is_synchronized(self, is_synchronized: bool) -> None:
+        """
+        Starts or stops tracking dirty consumers
+        :param is_synchronized: True to synchronize producers and consumers
+        """
+        if is_synchronized == self.is_synchronized:
+            return
+        if is_synchronized:
+            self.dirty_consumers_tracker = (
+                dirty_consumers_tracker.DirtyConsumersTracker()
+            )
+            for consumer in self.get_consumers():
+                self.dirty_consumers_tracker.track(consumer)
+        else:
+            self.dirty_consumers_tracker.untrack_all()  # type: ignore
+            self.dirty_consumers_tracker = None
 
     @classmethod
     def get_name(cls) -> str:
@@ -95,6 +172,10 @@ class Channel:
         internal_consumer: typing.Optional["async_channel.consumer.Consumer"] = None,
         size: int = 0,
         priority_level: int = DEFAULT_PRIORITY_LEVEL,
+        consumer_class: typing.Optional[
+            typing.Type["async_channel.consumer.Consumer"]
+        ] = None,
+        **kwargs,
     ) -> "async_channel.consumer.Consumer":
         """
         Create an appropriate consumer instance for this async_channel and add it to the consumer list
@@ -104,18 +185,74 @@ class Channel:
         :param size: queue size, default 0
         :param priority_level: used by Producers the lowest level has the highest priority
         :param internal_consumer: internal consumer instance to use if specified
+        :param consumer_class: consumer class to instantiate instead of CONSUMER_CLASS if specified
+        :param kwargs: additional params passed to the consumer class constructor
         :return: consumer instance created
         """
-        consumer = (
-            internal_consumer
-            if internal_consumer
-            else self.CONSUMER_CLASS(callback, size=size, priority_level=priority_level)  # type: ignore
+        consumer = self._create_consumer(
+            callback=callback,
+            internal_consumer=internal_consumer,
+            size=size,
+            priority_level=priority_level,
+            consumer_class=consumer_class,
+            **kwargs,
         )
         await self._add_new_consumer_and_run(consumer, consumer_filters)
         await self._check_producers_state()
         return consumer
 
-    # pylint: disable=unused-argument
+    async def new_consumers(
+        self, consumers_kwargs: typing.Iterable[dict]
+    ) -> list["async_channel.consumer.Consumer"]:
+        """
+        Create consumers in bulk: consumers are all added to the consumer list before being run
+        and producers state is only checked once, after every consumer is running
+        Consumers are created one by one with 'new_consumer' when 'new_consumer' or '_add_new_consumer_and_run'
+        are overwritten: only '_add_new_consumer' and '_run_new_consumer' overwrites support bulk creation
+        :param consumers_kwargs: the 'new_consumer' arguments of each consumer to create
+        :return: the created consumers, in consumers_kwargs order
+        """
+        if (
+            self.__class__.new_consumer is not Channel.new_consumer
+            or self.__class__._add_new_consumer_and_run
+            is not Channel._add_new_consumer_and_run
+        ):
+            return [
+                await self.new_consumer(**consumer_kwargs)
+                for consumer_kwargs in consumers_kwargs
+            ]
+        consumers = []
+        for consumer_kwargs in consumers_kwargs:
+            consumer_kwargs = dict(consumer_kwargs)
+            consumer_filters = consumer_kwargs.pop("consumer_filters", None)
+            consumer = self._create_consumer(**consumer_kwargs)
+            await self._add_new_consumer(consumer, consumer_filters)
+            consumers.append(consumer)
+        for consumer in consumers:
+            await self._run_new_consumer(consumer)
+        await self._check_producers_state()
+        return consumers
+
+    def _create_consumer(
+        self,
+        callback: object = None,
+        internal_consumer: typing.Optional["async_channel.consumer.Consumer"] = None,
+        size: int = 0,
+        priority_level: int = DEFAULT_PRIORITY_LEVEL,
+        consumer_class: typing.Optional[
+            typing.Type["async_channel.consumer.Consumer"]
+        ] = None,
+        **kwargs,
+    ) -> "async_channel.consumer.Consumer":
+        """
+        :return: internal_consumer if specified, otherwise a new consumer_class or CONSUMER_CLASS instance
+        """
+        if internal_consumer:
+            return internal_consumer
+        return (consumer_class or self.CONSUMER_CLASS)(  # type: ignore
+            callback, size=size, priority_level=priority_level, **kwargs
+        )
+
     async def _add_new_consumer_and_run(
         self,
         consumer: "async_channel.consumer.Consumer",
@@ -128,12 +265,57 @@ class Channel:
         :param kwargs: additional params for consumer list
         :return: None
         """
+        await self._add_new_consumer(consumer, consumer_filters, **kwargs)
+        await self._run_new_consumer(consumer)
+
+    # pylint: disable=unused-argument
+    async def _add_new_consumer(
+        self,
+        consumer: "async_channel.consumer.Consumer",
+        consumer_filters: typing.Optional[dict],
+        **kwargs,
+    ) -> None:
+        """
+        Adds the consumer to self.consumers, called by '_add_new_consumer_and_run' and 'new_consumers'
+        Can be overwritten to build the consumer filters
+        :param consumer: the consumer to add
+        :param consumer_filters: the consumer selection filters
+        :param kwargs: additional params for consumer list
+        :return: None
+        """
         if consumer_filters is None:
             consumer_filters = {}
-
         self.add_new_consumer(consumer, consumer_filters)
+
+    async def _run_new_consumer(
+        self, consumer: "async_channel.consumer.Consumer"
+    ) -> None:
+        """
+        Runs the added consumer, called by '_add_new_consumer_and_run' and 'new_consumers'
+        :param consumer: the added consumer
+        :return: None
+        """
         await consumer.run(with_task=not self.is_synchronized)
 
+    @property
+    def consumers(self) -> consumers_list.ConsumersList:
+        """
+        :return: the subscribed consumers filters list
+        """
+        return self._consumers
+
+    @consumers.setter
+    def consumers(self, consumers: typing.Iterable[dict]) -> None:
+        """
+        Replaces the subscribed consumers filters list, its version is increased
+        :param consumers: the consumers filters
+        """
+        previous_consumers = self.__dict__.get("_consumers")
+        self._consumers: consumers_list.ConsumersList = consumers_list.ConsumersList(
+            consumers,
+            version=0 if previous_consumers is None else previous_consumers.version + 1,
+        )
+
     def add_new_consumer(
         self, consumer: "async_channel.consumer.Consumer", consumer_filters: dict
     ) -> None:
@@ -144,7 +326,22 @@ class Channel:
         :return: None
         """
         consumer_filters[self.INSTANCE_KEY] = consumer
+        if self.COMPACT_CONSUMER_FILTERS:
+            consumer_filters = compact_filters.CompactFilters(consumer_filters)
+        is_index_up_to_date = self._is_consumer_filters_index_up_to_date()
         self.consumers.append(consumer_filters)
+        self.consumer_filters_index.add(consumer_filters)
+        if is_index_up_to_date:
+            self._consumer_filters_index_version = self._consumers.version
+        self._reset_consumers_views()
+        if self.metrics is not None:
+            self.metrics.track_consumer(consumer)
+        if self.dirty_consumers_tracker is not None:
+            self.dirty_consumers_tracker.track(consumer)
+        if self.dispatcher is not None:
+            consumer.dispatcher = self.dispatcher
+        if self.backpressure is not None:
+            self.backpressure.track(consumer)
 
     def get_consumer_from_filters(
         self, consumer_filters: dict
@@ -154,32 +351,67 @@ class Channel:
         WARNING:
             >>> get_consumer_from_filters({"A": 1})
             Can return a consumer described by {"A": True} because in python 1 == True
+            unless STRICT_CONSUMER_FILTERS is True
         :param consumer_filters: The consumer filters dict
         :return: the filtered consumer list
         """
         return self._filter_consumers(consumer_filters)
 
-    def get_consumers(self) -> list["async_channel.consumer.Consumer"]:
+    def get_consumers(self) -> tuple["async_channel.consumer.Consumer", ...]:
         """
         Returns all consumers instance
         Can be overwritten according to the class needs
-        :return: the subscribed consumers list
+        :return: the subscribed consumers tuple
         """
-        return [consumer[self.INSTANCE_KEY] for consumer in self.consumers]
+        if self._consumers_views_version != self._consumers.version:
+            self._update_consumers_views()
+        return self._consumers_view  # type: ignore
 
     def get_prioritized_consumers(
         self, priority_level: int
-    ) -> list["async_channel.consumer.Consumer"]:
+    ) -> tuple["async_channel.consumer.Consumer", ...]:
         """
         Returns all consumers instance
         Can be overwritten according to the class needs
-        :return: the subscribed consumers list
+        :return: the subscribed consumers tuple
+        """
+        if self._consumers_views_version != self._consumers.version:
+            self._update_consumers_views()
+        try:
+            return self._prioritized_consumers_views[priority_level]
+        except KeyError:
+            prioritized_consumers = tuple(
+                consumer
+                for consumer in self.get_consumers()
+                if consumer.priority_level <= priority_level
+            )
+            self._prioritized_consumers_views[priority_level] = prioritized_consumers
+            return prioritized_consumers
+
+    def _update_consumers_views(self) -> None:
+        """
+        Computes consumers views from self.consumers
+        """
+        self._consumers_views_version = self._consumers.version
+        self._consumers_view = tuple(
+            consumer[self.INSTANCE_KEY] for consumer in self.consumers
+        )
+        self._prioritized_consumers_views = {}
+        self._non_optional_consumers_count = sum(
+            1
+            for consumer in self._consumers_view
+            if consumer.priority_level
+            < async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
+        )
+
+    def _reset_consumers_views(self) -> None:
         """
-        return [
-            consumer[self.INSTANCE_KEY]
-            for consumer in self.consumers
-            if consumer[self.INSTANCE_KEY].priority_level <= priority_level
-        ]
+        Resets consumers views, they will be computed again when requested
+        Should be called when self.consumers is updated
+        """
+        self._consumers_views_version = -1
+        self._consumers_view = None
+        self._prioritized_consumers_views = {}
 
     def _filter_consumers(
         self, consumer_filters: dict
@@ -190,25 +422,109 @@ class Channel:
         :param consumer_filters: listed consumer filters
         :return: the list of the filtered consumers
         """
+        if not self._is_consumer_filters_index_up_to_date():
+            # self.consumers has been updated without add_new_consumer or remove_consumer
+            self._rebuild_consumer_filters_index()
+        matching_consumers_filters = self.consumer_filters_index.select(
+            consumer_filters
+        )
+        if matching_consumers_filters is not None:
+            return [
+                matching_consumer_filters[self.INSTANCE_KEY]
+                for matching_consumer_filters in matching_consumers_filters
+            ]
+        # unhashable selection value: fallback to a full scan
         return [
             consumer[self.INSTANCE_KEY]
             for consumer in self.consumers
-            if _check_filters(consumer, consumer_filters)
+            if _check_filters(
+                consumer, consumer_filters, strict=self.consumer_filters_index.strict
+            )
         ]
 
+    def _rebuild_consumer_filters_index(self) -> None:
+        """
+        Index self.consumers filters from scratch
+        """
+        self.consumer_filters_index.clear()
+        for consumer_filters in self.consumers:
+            self.consumer_filters_index.add(consumer_filters)
+        self._consumer_filters_index_version = self._consumers.version
+
+    def _is_consumer_filters_index_up_to_date(self) -> bool:
+        """
+        :return: True if self.consumer_filters_index indexes the current self.consumers
+        """
+        return self._consumer_filters_index_version == self._consumers.version
+
     async def remove_consumer(
         self, consumer: "async_channel.consumer.Consumer"
     ) -> None:
         """
-        Should be overwritten according to the class needs
-        Should end by calling '_check_producers_state' and then 'consumer.stop'
+        Remove the consumer from consumers list, see 'remove_consumers'
         :param consumer: consumer instance to remove from consumers list
         """
-        for consumer_candidate in self.consumers:
-            if consumer == consumer_candidate[self.INSTANCE_KEY]:
-                self.consumers.remove(consumer_candidate)
-                await self._check_producers_state()
-                await consumer.stop()
+        await self._remove_consumers((consumer,))
+
+    async def remove_consumers(
+        self, consumers: typing.Iterable["async_channel.consumer.Consumer"]
+    ) -> None:
+        """
+        Remove consumers in bulk: consumers list is updated in a single pass and producers state is only checked once
+        Consumers are removed one by one with 'remove_consumer' when 'remove_consumer' is overwritten
+        Consumer specific cleanups should be implemented in 'on_consumer_removed'
+        :param consumers: consumer instances to remove from consumers list
+        """
+        if self.__class__.remove_consumer is not Channel.remove_consumer:
+            for consumer in list(consumers):
+                await self.remove_consumer(consumer)
+            return
+        await self._remove_consumers(consumers)
+
+    async def _remove_consumers(
+        self, consumers: typing.Iterable["async_channel.consumer.Consumer"]
+    ) -> None:
+        """
+        Remove consumers from consumers list in a single pass
+        Should end by calling '_check_producers_state' and then each removed consumer 'stop'
+        :param consumers: consumer instances to remove from consumers list
+        """
+        removed_consumers = set(consumers)
+        removed_consumers_filters = []
+        remaining_consumers_filters = []
+        for consumer_filters in self.consumers:
+            if consumer_filters[self.INSTANCE_KEY] in removed_consumers:
+                removed_consumers_filters.append(consumer_filters)
+            else:
+                remaining_consumers_filters.append(consumer_filters)
+        if not removed_consumers_filters:
+            return
+        is_index_up_to_date = self._is_consumer_filters_index_up_to_date()
+        self.consumers[:] = remaining_consumers_filters
+        self._reset_consumers_views()
+        for consumer_filters in removed_consumers_filters:
+            self.consumer_filters_index.remove(consumer_filters)
+            self.on_consumer_removed(consumer_filters[self.INSTANCE_KEY])
+        if is_index_up_to_date:
+            self._consumer_filters_index_version = self._consumers.version
+        await self._check_producers_state()
+        for consumer_filters in removed_consumers_filters:
+            await consumer_filters[self.INSTANCE_KEY].stop()
+
+    def on_consumer_removed(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Called when a consumer has been removed from consumers list, before it is stopped
+        Can be overwritten to perform additional cleanups
+        :param consumer: the removed consumer
+        """
+        if self.metrics is not None:
+            self.metrics.untrack_consumer(consumer)
+        if self.dirty_consumers_tracker is not None:
+            self.dirty_consumers_tracker.untrack(consumer)
+        if consumer.dispatcher is self.dispatcher:
+            consumer.dispatcher = None
+        if self.backpressure is not None:
+            self.backpressure.untrack(consumer)
 
     async def _check_producers_state(self) -> None:
         """
@@ -231,15 +547,7 @@ class Channel:
         """
         if self.is_paused:
             return False
-        if not self.get_consumers():
-            return True
-        for consumer in self.get_consumers():
-            if (
-                consumer.priority_level
-                < async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
-            ):
-                return False
-        return True
+        return not self._get_non_optional_consumers_count() or self._is_congested()
 
     def _should_resume_producers(self) -> bool:
         """
@@ -248,15 +556,21 @@ class Channel:
         """
         if not self.is_paused:
             return False
-        if not self.get_consumers():
-            return False
-        for consumer in self.get_consumers():
-            if (
-                consumer.priority_level
-                < async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
-            ):
-                return True
-        return False
+        return self._get_non_optional_consumers_count() > 0 and not self._is_congested()
+
+    def _is_congested(self) -> bool:
+        """
+        :return: True if a consumer queue reached its high watermark and is not drained yet
+        """
+        return self.backpressure is not None and self.backpressure.is_congested()
+
+    def _get_non_optional_consumers_count(self) -> int:
+        """
+        :return: the count of subscribed consumers with a higher priority than OPTIONAL
+        """
+        if self._consumers_views_version != self._consumers.version:
+            self._update_consumers_views()
+        return self._non_optional_consumers_count
 
     async def register_producer(
         self, producer: "async_channel.producer.Producer"
@@ -269,6 +583,10 @@ class Channel:
         """
         if producer not in self.producers:
             self.producers.append(producer)
+            if self.metrics is not None:
+                self.metrics.track_producer(producer)
+            if self.recorder is not None:
+                self.recorder.track_producer(producer)
 
         if self.is_paused:
             await producer.pause()
@@ -281,6 +599,10 @@ class Channel:
         """
         if producer in self.producers:
             self.producers.remove(producer)
+            if self.metrics is not None:
+                self.metrics.untrack_producer(producer)
+            if self.recorder is not None:
+                self.recorder.untrack_producer(producer)
 
     def get_producers(self) -> typing.Iterable["async_channel.producer.Producer"]:
         """
@@ -344,8 +666,160 @@ class Channel:
             except TypeError:
                 self.logger.exception("PRODUCER_CLASS not defined")
                 raise
+            if self.metrics is not None:
+                self.metrics.track_producer(self.internal_producer)
+            if self.recorder is not None:
+                self.recorder.track_producer(self.internal_producer)
         return self.internal_producer
 
+    def enable_metrics(self) -> metrics.ChannelMetrics:
+        """
+        Starts recording the channel producers, consumers and consumer queues metrics
+        Metered elements classes are swapped with metered subclasses: when disabled, metrics cost nothing
+        :return: the channel metrics
+        """
+        if self.metrics is None:
+            self.metrics = metrics.ChannelMetrics()
+            for producer in self._get_metered_producers():
+                self.metrics.track_producer(producer)
+            for consumer in self.get_consumers():
+                self.metrics.track_consumer(consumer)
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Stops recording metrics and restores the metered elements classes
+        """
+        if self.metrics is None:
+            return
+        for producer in self._get_metered_producers():
+            self.metrics.untrack_producer(producer)
+        for consumer in self.get_consumers():
+            self.metrics.untrack_consumer(consumer)
+        self.metrics = None
+
+    def enable_recording(
+        self,
+        writer: journal.JournalWriter,
+        channel_name: typing.Optional[str] = None,
+    ) -> journal.JournalRecorder:
+        """
+        Starts recording the data sent by the channel producers into a journal
+        Recorded producers class is swapped with a subclass recording sent data, like metered producers:
+        when disabled, producers get their original class back and recording costs nothing
+        :param writer: the journal writer, can be shared by several channels
+        :param channel_name: the recorded channel name, the channel name when None
+        :return: the channel recorder
+        """
+        if self.recorder is None:
+            self.recorder = journal.JournalRecorder(
+                writer, channel_name or self.get_name()
+            )
+            for producer in self._get_metered_producers():
+                self.recorder.track_producer(producer)
+        return self.recorder
+
+    def disable_recording(self) -> None:
+        """
+        Stops recording the channel producers sent data
+        """
+        if self.recorder is None:
+            return
+        for producer in self._get_metered_producers():
+            self.recorder.untrack_producer(producer)
+        self.recorder = None
+
+    def enable_priority_dispatch(
+        self,
+        dispatcher: typing.Optional[priority_dispatcher.PriorityDispatcher] = None,
+        max_running: int = async_channel.constants.DEFAULT_DISPATCHER_MAX_RUNNING,
+        weights: typing.Sequence[
+            int
+        ] = async_channel.constants.DEFAULT_DISPATCHER_WEIGHTS,
+    ) -> priority_dispatcher.PriorityDispatcher:
+        """
+        Runs the channel consumers perform calls through a PriorityDispatcher:
+        higher priority consumers pending work is performed first when max_running calls are already running
+        :param dispatcher: the dispatcher to use, can be shared with other channels, created if None
+        :param max_running: the created dispatcher maximum count of perform calls running at the same time
+        :param weights: the created dispatcher turns per round of each priority level
+        :return: the channel dispatcher
+        """
+        self.dispatcher = dispatcher or priority_dispatcher.PriorityDispatcher(
+            max_running=max_running, weights=weights
+        )
+        for consumer in self.get_consumers():
+            consumer.dispatcher = self.dispatcher
+        return self.dispatcher
+
+    def disable_priority_dispatch(self) -> None:
+        """
+        Stops dispatching consumers perform calls, they are performed as soon as their data is available
+        """
+        for consumer in self.get_consumers():
+            if consumer.dispatcher is self.dispatcher:
+                consumer.dispatcher = None
+        self.dispatcher = None
+
+    def enable_backpressure(
+        self,
+        watermarks: typing.Optional[dict[int, backpressure.QueueWatermarks]] = None,
+    ) -> backpressure.BackpressureController:
+        """
+        Pauses the channel producers while a consumer queue is above its high watermark
+        and resumes them once every consumer queue is back to its low watermark
+        :param watermarks: the queue watermarks by consumer priority level, consumers of levels without
+        watermarks are not checked. Defaults to DEFAULT_QUEUE_HIGH_WATERMARK and DEFAULT_QUEUE_LOW_WATERMARK
+        for non OPTIONAL consumers
+        :return: the channel backpressure controller
+        """
+        if self.backpressure is None:
+            self.backpressure = backpressure.BackpressureController(
+                (
+                    backpressure.get_default_watermarks()
+                    if watermarks is None
+                    else watermarks
+                ),
+                self._check_producers_state,
+            )
+            for consumer in self.get_consumers():
+                self.backpressure.track(consumer)
+        return self.backpressure
+
+    def disable_backpressure(self) -> None:
+        """
+        Stops checking consumers queues sizes, producers paused by congested queues are resumed
+        """
+        if self.backpressure is None:
+            return
+        self.backpressure.untrack_all()
+        self.backpressure = None
+
+    def get_metrics_snapshot(self) -> typing.Optional[dict]:
+        """
+        :return: the channel metrics summary, None when metrics are disabled
+        """
+        if self.metrics is None:
+            return None
+        return {
+            "name": self.get_name(),
+            "chan_id": self.chan_id,
+            "is_paused": self.is_paused,
+            **self.metrics.snapshot(),
+        }
+
+    def _get_metered_producers(self) -> list["async_channel.producer.Producer"]:
+        """
+        :return: the registered producers and the internal producer if any
+        """
+        producers = list(self.get_producers())
+        if (
+            self.internal_producer is not None
+            and self.internal_producer not in producers
+        ):
+            producers.append(self.internal_producer)
+        return producers
+
 
 def set_chan(chan: Channel, name: str) -> Channel:
     """
@@ -357,6 +831,7 @@ def set_chan(chan: Channel, name: str) -> Channel:
     chan_name = name if name else chan.get_name()
     if chan_name not in channel_instances.ChannelInstances.instance().channels:
         channel_instances.ChannelInstances.instance().channels[chan_name] = chan
+        channel_instances.ChannelInstances.instance().index_channel(chan, chan_name)
         return chan
     raise ValueError(f"Channel {chan_name} already exists.")
 
@@ -366,37 +841,59 @@ def del_chan(name: str) -> None:
     Delete a Channel instance from the channels list according to channel name
     :param name: name of the channel to delete
     """
-    if name in channel_instances.ChannelInstances.instance().channels:
-        channel_instances.ChannelInstances.instance().channels.pop(name, None)
+    channel_instances.ChannelInstances.instance().unindex_registered(
+        name, channel_instances.ChannelInstances.instance().channels.pop(name, None)
+    )
 
 
 def get_chan(chan_name: str) -> Channel:
     """
-    Return the channel instance from channel name
+    Return the channel instance from channel name, builds it when registered as a LazyChannel
     :param chan_name: the channel name
     :return: the Channel instance
     """
-    return channel_instances.ChannelInstances.instance().channels[chan_name]
+    chan = channel_instances.ChannelInstances.instance().channels[chan_name]
+    if isinstance(chan, channel_instances.LazyChannel):
+        return chan.build()
+    return chan
 
 
-def _check_filters(consumer_filters: dict, expected_filters: dict) -> bool:
+def _check_filters(
+    consumer_filters: dict, expected_filters: dict, strict: bool = False
+) -> bool:
     """
     Checks if the consumer match the specified filters
     Returns True if expected_filters is empty
     :param consumer_filters: consumer filters
     :param expected_filters: selected filters
+    :param strict: when True, filter values also have to share the same type to match (1 won't match True)
     :return: True if the consumer match the selection, else False
     """
     try:
         for key, value in expected_filters.items():
             if value == async_channel.CHANNEL_WILDCARD:
                 continue
-            if isinstance(consumer_filters[key], list):
-                if set(consumer_filters[key]) & {value, async_channel.CHANNEL_WILDCARD}:
-                    continue
-                return False
-            if consumer_filters[key] not in [value, async_channel.CHANNEL_WILDCARD]:
+            consumer_value = consumer_filters[key]
+            if not any(
+                _check_filter_value(item, value, strict)
+                for item in (
+                    consumer_value
+                    if isinstance(consumer_value, list)
+                    else (consumer_value,)
+                )
+            ):
                 return False
         return True
     except KeyError:
         return False
+
+
+def _check_filter_value(
+    consumer_value: typing.Any, value: typing.Any, strict: bool
+) -> bool:
+    """
+    :return: True if the consumer filter value is the wildcard or matches the selected value
+    """
+    if consumer_value == async_channel.CHANNEL_WILDCARD:
+        return True
+    return consumer_filters_index.are_equal_values(consumer_value, value, strict=strict)
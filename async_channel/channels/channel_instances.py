@@ -16,11 +16,13 @@
 """
 This module defines created Channels interaction methods
 """
+import types
 import typing
 import async_channel.util.logging_util as logging
 
 if typing.TYPE_CHECKING:
     import async_channel.channels.channel
+    import async_channel.consumer
 
 
 class ChannelInstances:
@@ -49,6 +51,224 @@ class ChannelInstances:
             str, dict[str, "async_channel.channels.channel.Channel"]
         ] = {}
 
+        # Secondary indexes of self.channels, kept in sync by the module registration functions
+        # Channels by name then by chan_id (None when registered without id)
+        self.channels_by_name: dict[
+            str, dict[typing.Optional[str], "async_channel.channels.channel.Channel"]
+        ] = {}
+        # Channels by class then by (chan_id, name), in registration order
+        # LazyChannel placeholders are indexed by the class of the channel to build
+        self.channels_by_class: dict[
+            type,
+            dict[
+                tuple[typing.Optional[str], str],
+                "async_channel.channels.channel.Channel",
+            ],
+        ] = {}
+
+        # Cached read only copy of self.channels, reset on registration changes
+        self._snapshot: typing.Optional[types.MappingProxyType] = None
+
+    def index_channel(
+        self,
+        chan: "async_channel.channels.channel.Channel",
+        chan_name: str,
+        chan_id: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Adds a registered channel to the secondary indexes
+        :param chan: the registered channel
+        :param chan_name: the channel registration name
+        :param chan_id: the channel registration id, None when registered without id
+        """
+        self.channels_by_name.setdefault(chan_name, {})[chan_id] = chan
+        self.channels_by_class.setdefault(_get_channel_class(chan), {})[
+            (chan_id, chan_name)
+        ] = chan
+        self._snapshot = None
+
+    def unindex_channel(
+        self,
+        chan: "async_channel.channels.channel.Channel",
+        chan_name: str,
+        chan_id: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Removes an unregistered channel from the secondary indexes
+        :param chan: the unregistered channel
+        :param chan_name: the channel registration name
+        :param chan_id: the channel registration id, None when registered without id
+        """
+        _pop_index_entry(self.channels_by_name, chan_name, chan_id)
+        _pop_index_entry(
+            self.channels_by_class, _get_channel_class(chan), (chan_id, chan_name)
+        )
+        self._snapshot = None
+
+    def replace_channel(
+        self,
+        registered_chan: typing.Any,
+        chan: "async_channel.channels.channel.Channel",
+    ) -> None:
+        """
+        Registers chan instead of registered_chan, under the same name and id
+        Does nothing when registered_chan is not registered anymore
+        :param registered_chan: the registered channel (or LazyChannel) to replace
+        :param chan: the channel to register
+        """
+        chan_name = registered_chan.get_name()
+        chan_id = registered_chan.chan_id
+        if self.channels.get(chan_name) is registered_chan:
+            registry, chan_id = self.channels, None
+        else:
+            registry = self.channels.get(chan_id)
+            if (
+                not isinstance(registry, dict)
+                or registry.get(chan_name) is not registered_chan
+            ):
+                return
+        registry[chan_name] = chan
+        self.unindex_channel(registered_chan, chan_name, chan_id)
+        self.index_channel(chan, chan_name, chan_id)
+
+    def unindex_registered(self, key: str, registered: typing.Any) -> None:
+        """
+        Removes a value popped from self.channels from the secondary indexes
+        :param key: the popped key
+        :param registered: the popped value: a channel registered without id or a chan_id channels container
+        """
+        if isinstance(registered, dict):
+            for chan_name, chan in registered.items():
+                self.unindex_channel(chan, chan_name, key)
+        elif registered is not None:
+            self.unindex_channel(registered, key)
+
+    def get_snapshot(self) -> types.MappingProxyType:
+        """
+        Returns a read only copy of the registered channels, it can be iterated while channels are (un)registered
+        Channels registered by id are grouped by id in read only mappings
+        :return: the registered channels by name or by id then name
+        """
+        if self._snapshot is None:
+            self._snapshot = types.MappingProxyType(
+                {
+                    key: (
+                        types.MappingProxyType(dict(registered))
+                        if isinstance(registered, dict)
+                        else registered
+                    )
+                    for key, registered in self.channels.items()
+                }
+            )
+        return self._snapshot
+
+    def get_metrics_snapshot(self) -> dict:
+        """
+        Returns the metrics summary of each channel with enabled metrics
+        Channels registered by id are grouped by id
+        :return: the channels metrics summaries by channel name
+        """
+        snapshot: dict = {}
+        for name, registered in self.channels.items():
+            if isinstance(registered, dict):
+                channels_snapshot = {
+                    chan_name: chan.get_metrics_snapshot()
+                    for chan_name, chan in registered.items()
+                    if chan.metrics is not None
+                }
+                if channels_snapshot:
+                    snapshot[name] = channels_snapshot
+            elif registered.metrics is not None:
+                snapshot[name] = registered.get_metrics_snapshot()
+        return snapshot
+
+
+class LazyChannel:
+    """
+    A LazyChannel is registered instead of a channel to only build it when it is first used:
+    by get_chan or get_chan_at_id, by new_consumer or by accessing any other channel attribute.
+    The built channel then replaces the LazyChannel in the channels registry.
+    Built channels are not started: Channel.start only starts consumers and a built channel has none,
+    channels overriding start can't be lazy, see channel_creator.create_lazy_channel_instance.
+    """
+
+    def __init__(
+        self,
+        channel_class: typing.Type["async_channel.channels.channel.Channel"],
+        name: str,
+        is_synchronized: bool = False,
+        chan_id: typing.Optional[str] = None,
+        **kwargs,
+    ):
+        # Class and constructor kwargs of the channel to build
+        self.channel_class: typing.Type["async_channel.channels.channel.Channel"] = (
+            channel_class
+        )
+        self.kwargs: dict = kwargs
+
+        # Registration name and id, used by set_chan and set_chan_at_id
+        self.name: str = name
+        self.chan_id: typing.Optional[str] = chan_id
+
+        # The built channel is_synchronized attribute
+        self.is_synchronized: bool = is_synchronized
+
+        # The built channel, None until first used
+        self.channel: typing.Optional["async_channel.channels.channel.Channel"] = None
+
+    def get_name(self) -> str:
+        """
+        :return: the channel registration name
+        """
+        return self.name
+
+    def build(self) -> "async_channel.channels.channel.Channel":
+        """
+        Builds the channel once and replaces the LazyChannel with it in the channels registry
+        :return: the built channel
+        """
+        if self.channel is None:
+            self.channel = self.channel_class(**self.kwargs)
+            self.channel.is_synchronized = self.is_synchronized
+            ChannelInstances.instance().replace_channel(self, self.channel)
+        return self.channel
+
+    @property
+    def metrics(self) -> typing.Any:
+        """
+        :return: the built channel metrics, None when not built: looking for metrics doesn't build the channel
+        """
+        return None if self.channel is None else self.channel.metrics
+
+    async def new_consumer(self, *args, **kwargs) -> "async_channel.consumer.Consumer":
+        """
+        Builds the channel and creates the consumer, see Channel.new_consumer
+        :return: the created consumer
+        """
+        return await self.build().new_consumer(*args, **kwargs)
+
+    async def start(self) -> None:
+        """
+        Builds and starts the channel
+        """
+        await self.build().start()
+
+    async def stop(self) -> None:
+        """
+        Stops the channel when it has been built
+        """
+        if self.channel is not None:
+            await self.channel.stop()
+
+    def __getattr__(self, attribute_name: str) -> typing.Any:
+        # private and special attributes are not forwarded: copying or inspecting the placeholder doesn't build it
+        if attribute_name.startswith("_"):
+            raise AttributeError(attribute_name)
+        return getattr(self.build(), attribute_name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.channel_class.__name__}, built: {self.channel is not None})"
+
 
 def set_chan_at_id(
     chan: "async_channel.channels.channel.Channel", name: str
@@ -68,6 +288,7 @@ def set_chan_at_id(
 
     if chan_name not in chan_instance:
         chan_instance[chan_name] = chan
+        ChannelInstances.instance().index_channel(chan, chan_name, chan.chan_id)
         return chan
     raise ValueError(f"Channel {chan_name} already exists.")
 
@@ -89,24 +310,29 @@ def del_channel_container(chan_id: str) -> None:
     Delete all async_channel id instances
     :param chan_id: the channel id
     """
-    ChannelInstances.instance().channels.pop(chan_id, None)
+    ChannelInstances.instance().unindex_registered(
+        chan_id, ChannelInstances.instance().channels.pop(chan_id, None)
+    )
 
 
 def get_chan_at_id(
     chan_name: str, chan_id: str
 ) -> "async_channel.channels.channel.Channel":
     """
-    Get the channel instance that matches the name and the id
+    Get the channel instance that matches the name and the id, builds it when registered as a LazyChannel
     :param chan_name: the channel name
     :param chan_id: the channel id
     :return: the channel instance if any
     """
     try:
-        return ChannelInstances.instance().channels[chan_id][chan_name]
+        chan = ChannelInstances.instance().channels[chan_id][chan_name]
     except KeyError as exception:
         raise KeyError(
             f"Channel {chan_name} not found with chan_id: {chan_id}"
         ) from exception
+    if isinstance(chan, LazyChannel):
+        return chan.build()
+    return chan
 
 
 def del_chan_at_id(chan_name: str, chan_id: str) -> None:
@@ -116,8 +342,68 @@ def del_chan_at_id(chan_name: str, chan_id: str) -> None:
     :param chan_id: the channel id
     """
     try:
-        ChannelInstances.instance().channels[chan_id].pop(chan_name, None)
+        chan = ChannelInstances.instance().channels[chan_id].pop(chan_name, None)
     except KeyError:
         logging.get_logger(ChannelInstances.__name__).warning(
             f"Can't del chan {chan_name} with chan_id: {chan_id}"
         )
+        return
+    if chan is not None:
+        ChannelInstances.instance().unindex_channel(chan, chan_name, chan_id)
+
+
+def get_channels_by_name(
+    chan_name: str,
+) -> dict[typing.Optional[str], "async_channel.channels.channel.Channel"]:
+    """
+    Get every channel registered under a name, whatever its id
+    :param chan_name: the channel name
+    :return: the channel instances by async_channel id, None for the channel registered without id
+    """
+    return dict(ChannelInstances.instance().channels_by_name.get(chan_name, {}))
+
+
+def get_channels_by_class(
+    channel_class: type,
+) -> list["async_channel.channels.channel.Channel"]:
+    """
+    Get every registered instance of a channel class or of its subclasses
+    :param channel_class: the channel class
+    :return: the channel instances in registration order by class
+    """
+    return [
+        chan
+        for indexed_class, indexed_channels in ChannelInstances.instance().channels_by_class.items()
+        if issubclass(indexed_class, channel_class)
+        for chan in indexed_channels.values()
+    ]
+
+
+def get_channels_snapshot() -> types.MappingProxyType:
+    """
+    Get a read only copy of the registered channels that can be iterated while channels are (un)registered
+    :return: the registered channels by name or by id then name
+    """
+    return ChannelInstances.instance().get_snapshot()
+
+
+def _get_channel_class(chan: typing.Any) -> type:
+    """
+    :return: the class of chan, the class of the channel to build when chan is a LazyChannel
+    """
+    if isinstance(chan, LazyChannel):
+        return chan.channel_class
+    return chan.__class__
+
+
+def _pop_index_entry(
+    index: dict, key: typing.Hashable, entry_key: typing.Hashable
+) -> None:
+    """
+    Removes index[key][entry_key] and index[key] when it becomes empty
+    """
+    entries = index.get(key)
+    if entries is not None:
+        entries.pop(entry_key, None)
+        if not entries:
+            del index[key]
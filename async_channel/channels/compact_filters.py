@@ -0,0 +1,65 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Defines CompactFilters, the memory efficient consumer filters used by channels with COMPACT_CONSUMER_FILTERS
+"""
+import collections.abc
+import sys
+import typing
+
+# Shared key positions by filters keys tuple: filters declaring the same keys share the same positions
+_KEYS_POSITIONS: dict[tuple, dict[typing.Hashable, int]] = {}
+
+
+class CompactFilters(collections.abc.Mapping):
+    """
+    Read only consumer filters mapping storing its values in a tuple.
+    Key positions are shared by every CompactFilters declaring the same keys
+    and string values are interned: equal strings of different consumers are stored once.
+    """
+
+    __slots__ = ("_positions", "_values")
+
+    def __init__(self, filters: typing.Mapping):
+        keys = tuple(filters)
+        try:
+            self._positions: dict[typing.Hashable, int] = _KEYS_POSITIONS[keys]
+        except KeyError:
+            self._positions = _KEYS_POSITIONS[keys] = {
+                key: position for position, key in enumerate(keys)
+            }
+        self._values: tuple = tuple(_intern(value) for value in filters.values())
+
+    def __getitem__(self, key: typing.Hashable) -> typing.Any:
+        return self._values[self._positions[key]]
+
+    def __iter__(self) -> typing.Iterator:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+def _intern(value: typing.Any) -> typing.Any:
+    """
+    :return: the interned value when value is a str (str subclasses can't be interned)
+    """
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
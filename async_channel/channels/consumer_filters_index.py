@@ -0,0 +1,228 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Defines the consumer filters inverted index used by channels to select consumers
+"""
+import typing
+
+import async_channel.constants
+
+
+class ConsumerFiltersIndex:
+    """
+    Inverted index of a channel consumer filters.
+    Each filter key maps its filter values to the entries declaring them, selecting entries
+    then costs about the number of matching entries instead of the number of registered entries.
+    Filter values are indexed in the following buckets:
+    - the key wildcard bucket for CHANNEL_WILDCARD values (or lists containing CHANNEL_WILDCARD)
+    - the key values bucket for hashable values (each list item is indexed separately)
+    - the key unhashable bucket for unhashable values, matched by equality
+    When not strict, values are matched like python equality does: 1 matches True.
+    When strict, values also have to share the same type: 1 does not match True.
+    """
+
+    def __init__(self, strict: bool = False):
+        self.strict: bool = strict
+
+        # Indexed consumer filters by entry id, ordered by insertion
+        self.entries: dict[int, dict] = {}
+
+        # key -> bucket key -> entry ids
+        self._values: dict[str, dict[typing.Hashable, set[int]]] = {}
+
+        # key -> entry ids
+        self._wildcards: dict[str, set[int]] = {}
+
+        # key -> entry id -> unhashable values
+        self._unhashables: dict[str, dict[int, list]] = {}
+
+        # id(consumer filters) -> entry id
+        self._entry_ids: dict[int, int] = {}
+
+        self._next_entry_id: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, consumer_filters: dict) -> None:
+        """
+        Index the given consumer filters
+        :param consumer_filters: the consumer filters to index
+        """
+        entry_id = self._next_entry_id
+        self._next_entry_id += 1
+        self.entries[entry_id] = consumer_filters
+        self._entry_ids[id(consumer_filters)] = entry_id
+        for key, value in consumer_filters.items():
+            for item in value if isinstance(value, list) else (value,):
+                if _is_wildcard(item):
+                    self._wildcards.setdefault(key, set()).add(entry_id)
+                    continue
+                try:
+                    self._values.setdefault(key, {}).setdefault(
+                        self._bucket_key(item), set()
+                    ).add(entry_id)
+                except TypeError:
+                    self._unhashables.setdefault(key, {}).setdefault(
+                        entry_id, []
+                    ).append(item)
+
+    def remove(self, consumer_filters: dict) -> None:
+        """
+        Remove the given consumer filters from the index
+        :param consumer_filters: the consumer filters to remove
+        """
+        entry_id = self._entry_ids.pop(id(consumer_filters), None)
+        if entry_id is None:
+            return
+        self.entries.pop(entry_id, None)
+        for key, value in consumer_filters.items():
+            for item in value if isinstance(value, list) else (value,):
+                if _is_wildcard(item):
+                    _discard(self._wildcards, key, entry_id)
+                    continue
+                try:
+                    bucket_key = self._bucket_key(item)
+                except TypeError:
+                    _discard(self._unhashables, key, entry_id)
+                    continue
+                values = self._values.get(key)
+                if values is not None:
+                    _discard(values, bucket_key, entry_id)
+                    if not values:
+                        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every indexed consumer filters
+        """
+        self.entries.clear()
+        self._values.clear()
+        self._wildcards.clear()
+        self._unhashables.clear()
+        self._entry_ids.clear()
+
+    def select(self, expected_filters: dict) -> typing.Optional[list[dict]]:
+        """
+        Returns the indexed consumer filters matching the expected filters, in insertion order
+        Returns every indexed consumer filters if expected_filters is empty
+        :param expected_filters: selected filters
+        :return: the matching consumer filters or None when an expected value can't be looked up in the index
+        """
+        matching_sets_by_key = []
+        for key, value in expected_filters.items():
+            if _is_wildcard(value):
+                continue
+            try:
+                bucket_key = self._bucket_key(value)
+            except TypeError:
+                return None
+            matching_sets = [
+                matching_set
+                for matching_set in (
+                    self._values.get(key, {}).get(bucket_key),
+                    self._wildcards.get(key),
+                    self._get_unhashable_matches(key, value),
+                )
+                if matching_set
+            ]
+            if not matching_sets:
+                return []
+            matching_sets_by_key.append(matching_sets)
+
+        if not matching_sets_by_key:
+            return list(self.entries.values())
+
+        # start from the key with the fewest candidates and check the others by membership
+        matching_sets_by_key.sort(
+            key=lambda matching_sets: sum(len(s) for s in matching_sets)
+        )
+        candidates = set().union(*matching_sets_by_key[0])
+        for matching_sets in matching_sets_by_key[1:]:
+            candidates = {
+                entry_id
+                for entry_id in candidates
+                if any(entry_id in matching_set for matching_set in matching_sets)
+            }
+            if not candidates:
+                return []
+        return [self.entries[entry_id] for entry_id in sorted(candidates)]
+
+    def _bucket_key(self, value: typing.Any) -> typing.Hashable:
+        """
+        :return: the values bucket key of value, raises TypeError when value is unhashable
+        """
+        bucket_key = (value.__class__, value) if self.strict else value
+        hash(bucket_key)
+        return bucket_key
+
+    def _get_unhashable_matches(self, key: str, value: typing.Any) -> set[int]:
+        """
+        :return: the entry ids of the unhashable filter values of key that are equal to value
+        """
+        return {
+            entry_id
+            for entry_id, items in self._unhashables.get(key, {}).items()
+            if any(are_equal_values(item, value, strict=self.strict) for item in items)
+        }
+
+
+def are_equal_values(
+    value: typing.Any, other: typing.Any, strict: bool = False
+) -> bool:
+    """
+    :param value: the value to compare
+    :param other: the value to compare to
+    :param strict: when True, values and their list, tuple and dict items also have to share the same type
+    :return: True if value equals other
+    """
+    if not strict:
+        return value == other
+    if value.__class__ is not other.__class__:
+        return False
+    if isinstance(value, (list, tuple)):
+        return len(value) == len(other) and all(
+            are_equal_values(item, other_item, strict=True)
+            for item, other_item in zip(value, other)
+        )
+    if isinstance(value, dict):
+        return value.keys() == other.keys() and all(
+            are_equal_values(item, other[key], strict=True)
+            for key, item in value.items()
+        )
+    return value == other
+
+
+def _is_wildcard(value: typing.Any) -> bool:
+    """
+    :return: True if value is the channel wildcard
+    """
+    return isinstance(value, str) and value == async_channel.constants.CHANNEL_WILDCARD
+
+
+def _discard(buckets: dict, bucket_key: typing.Hashable, entry_id: int) -> None:
+    """
+    Remove entry_id from the bucket_key bucket and drop the bucket when empty
+    """
+    bucket = buckets.get(bucket_key)
+    if bucket is None:
+        return
+    if isinstance(bucket, dict):
+        bucket.pop(entry_id, None)
+    else:
+        bucket.discard(entry_id)
+    if not bucket:
+        buckets.pop(bucket_key, None)
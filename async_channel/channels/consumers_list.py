@@ -0,0 +1,83 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define ConsumersList: the channels consumers list counting its updates
+"""
+import typing
+
+
+class ConsumersList(list):
+    """
+    A ConsumersList is a channel consumers filters list which version is increased by each of its updates:
+    channels compare it to the version their consumers views and consumer filters index are computed from
+    to know when they are outdated, even when the list is edited directly.
+    Updates of the consumer filters dicts themselves are not counted.
+    """
+
+    def __init__(self, consumers: typing.Iterable[dict] = (), version: int = 0):
+        super().__init__(consumers)
+        self.version: int = version
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, consumers: typing.Iterable[dict]) -> "ConsumersList":  # type: ignore
+        super().__iadd__(consumers)
+        self.version += 1
+        return self
+
+    def __imul__(self, count: int) -> "ConsumersList":  # type: ignore
+        super().__imul__(count)
+        self.version += 1
+        return self
+
+    def append(self, consumer_filters: dict) -> None:
+        super().append(consumer_filters)
+        self.version += 1
+
+    def extend(self, consumers: typing.Iterable[dict]) -> None:
+        super().extend(consumers)
+        self.version += 1
+
+    def insert(self, index: typing.SupportsIndex, consumer_filters: dict) -> None:
+        super().insert(index, consumer_filters)
+        self.version += 1
+
+    def pop(self, index: typing.SupportsIndex = -1) -> dict:
+        consumer_filters = super().pop(index)
+        self.version += 1
+        return consumer_filters
+
+    def remove(self, consumer_filters: dict) -> None:
+        super().remove(consumer_filters)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
@@ -0,0 +1,102 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define DirtyConsumersTracker used by synchronized channels to skip consumers without pending work
+"""
+import functools
+import typing
+
+import async_channel.queues.observed_queue as observed_queue
+
+if typing.TYPE_CHECKING:
+    import async_channel.consumer
+
+
+class DirtyConsumersTracker:
+    """
+    Tracks the consumers that may have pending work: a consumer becomes dirty when data is put in its queue
+    and is marked clean by the producer once its queue is empty and its processing is joined.
+    Consumers which queue can't be observed are always dirty.
+    """
+
+    def __init__(self):
+        # Tracked consumers queue put observers
+        self.tracked_consumers: dict[
+            "async_channel.consumer.Consumer", typing.Callable[[], None]
+        ] = {}
+        self.dirty_consumers: set["async_channel.consumer.Consumer"] = set()
+
+        # Consumers which queue is not observed
+        self.unobserved_consumers: set["async_channel.consumer.Consumer"] = set()
+
+    def track(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Starts tracking consumer, it is dirty when its queue is not empty
+        :param consumer: the consumer to track
+        """
+        if consumer in self.tracked_consumers:
+            return
+        observer = functools.partial(self.dirty_consumers.add, consumer)
+        self.tracked_consumers[consumer] = observer
+        if not observed_queue.observe_put(consumer.queue, observer):
+            self.unobserved_consumers.add(consumer)
+        if not consumer.queue.empty():
+            self.dirty_consumers.add(consumer)
+
+    def untrack(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Stops tracking consumer
+        :param consumer: the tracked consumer
+        """
+        observer = self.tracked_consumers.pop(consumer, None)
+        if observer is None:
+            return
+        self.dirty_consumers.discard(consumer)
+        self.unobserved_consumers.discard(consumer)
+        observed_queue.unobserve_put(consumer.queue, observer)
+
+    def untrack_all(self) -> None:
+        """
+        Stops tracking every consumer
+        """
+        for consumer in list(self.tracked_consumers):
+            self.untrack(consumer)
+
+    def is_dirty(self, consumer: "async_channel.consumer.Consumer") -> bool:
+        """
+        :return: True if consumer may have pending work
+        """
+        return consumer in self.dirty_consumers or consumer in self.unobserved_consumers
+
+    def mark_clean(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Called when consumer has no pending work anymore
+        """
+        self.dirty_consumers.discard(consumer)
+
+    def get_dirty_consumers(
+        self, priority_level: int
+    ) -> list["async_channel.consumer.Consumer"]:
+        """
+        :param priority_level: the consumer maximal priority level value
+        :return: the dirty consumers
+        """
+        return [
+            consumer
+            for consumers in (self.dirty_consumers, self.unobserved_consumers)
+            for consumer in consumers
+            if consumer.priority_level <= priority_level
+        ]
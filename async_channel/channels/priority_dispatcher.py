@@ -0,0 +1,144 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define PriorityDispatcher used to run consumers pending work by priority level
+"""
+import asyncio
+import collections
+import typing
+
+import async_channel.constants
+
+
+class PriorityDispatcher:
+    """
+    A PriorityDispatcher limits the count of consumer perform calls running at the same time
+    and gives the next turn to the highest priority waiting consumer.
+    Turns are given by weighted round-robin between waiting priority levels: while every level is waiting,
+    each level gets up to its weight turns per round so that lower priority levels never starve.
+    A dispatcher can be shared by several channels to schedule their consumers together.
+    Dispatched callbacks should not wait for other consumers of the same dispatcher (for example by sending
+    to a full bounded queue) when max_running is reached: those consumers can't get a turn meanwhile.
+    """
+
+    def __init__(
+        self,
+        max_running: int = async_channel.constants.DEFAULT_DISPATCHER_MAX_RUNNING,
+        weights: typing.Sequence[
+            int
+        ] = async_channel.constants.DEFAULT_DISPATCHER_WEIGHTS,
+    ):
+        # Maximum count of perform calls running at the same time
+        self.max_running: int = max_running
+
+        # Turns per round of each priority level, the last weight is used by the next levels
+        self.weights: tuple[int, ...] = tuple(weights)
+
+        # Count of running perform calls
+        self.running_count: int = 0
+
+        # Waiting consumers turns by priority level
+        self.waiters: dict[int, collections.deque[asyncio.Future]] = {}
+
+        # Remaining turns of each priority level in the current round
+        self._credits: dict[int, int] = {}
+
+    async def dispatch(
+        self,
+        priority_level: int,
+        perform: typing.Callable[[typing.Any], typing.Awaitable],
+        data: typing.Any,
+    ) -> None:
+        """
+        Waits for a turn then calls perform with data
+        :param priority_level: the performing consumer priority level
+        :param perform: the consumer perform method
+        :param data: the data to perform
+        """
+        await self.acquire(priority_level)
+        try:
+            await perform(data)
+        finally:
+            self.release()
+
+    async def acquire(self, priority_level: int) -> None:
+        """
+        Waits for a turn, release should be called when the turn is over
+        :param priority_level: the waiting consumer priority level
+        """
+        if self.running_count < self.max_running and not any(self.waiters.values()):
+            self.running_count += 1
+            return
+        turn = asyncio.get_running_loop().create_future()
+        self.waiters.setdefault(priority_level, collections.deque()).append(turn)
+        try:
+            await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                # the turn was given before being cancelled
+                self.release()
+            else:
+                self.waiters[priority_level].remove(turn)
+            raise
+
+    def release(self) -> None:
+        """
+        Ends a turn and gives the next turns to the waiting consumers
+        """
+        self.running_count -= 1
+        while self.running_count < self.max_running:
+            priority_level = self._get_next_priority_level()
+            if priority_level is None:
+                return
+            turn = self.waiters[priority_level].popleft()
+            self._credits[priority_level] -= 1
+            self.running_count += 1
+            turn.set_result(None)
+
+    def get_waiting_count(self, priority_level: typing.Optional[int] = None) -> int:
+        """
+        :param priority_level: the priority level to count, all levels when None
+        :return: the count of consumers waiting for a turn
+        """
+        if priority_level is not None:
+            return len(self.waiters.get(priority_level, ()))
+        return sum(len(turns) for turns in self.waiters.values())
+
+    def get_weight(self, priority_level: int) -> int:
+        """
+        :return: the turns count per round of priority_level
+        """
+        return self.weights[min(priority_level, len(self.weights) - 1)]
+
+    def _get_next_priority_level(self) -> typing.Optional[int]:
+        """
+        :return: the highest priority waiting level with remaining turns in the current round,
+        None if no consumer is waiting
+        """
+        waiting_levels = sorted(
+            priority_level for priority_level, turns in self.waiters.items() if turns
+        )
+        if not waiting_levels:
+            return None
+        for priority_level in waiting_levels:
+            # levels joining the current round get their whole weight
+            if self._credits.setdefault(
+                priority_level, self.get_weight(priority_level)
+            ):
+                return priority_level
+        # every waiting level used its turns: start a new round
+        self._credits = {waiting_levels[0]: self.get_weight(waiting_levels[0])}
+        return waiting_levels[0]
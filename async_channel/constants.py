@@ -19,3 +19,61 @@ Define async_channel global constants
 CHANNEL_WILDCARD = "*"
 
 DEFAULT_QUEUE_SIZE = 0  # unlimited
+
+DEFAULT_MAX_BATCH = 100  # max data count per BatchConsumer callback call
+
+DEFAULT_RING_BUFFER_SIZE = 1024  # data count kept by a broadcast channel
+
+DEFAULT_MAX_IN_FLIGHT = (
+    4  # max data count processed at the same time by a ProcessPoolConsumer
+)
+
+DEFAULT_SHARED_MEMORY_THRESHOLD = (
+    64 * 1024
+)  # min bytes count of a payload sent through shared memory
+
+DEFAULT_THREADSAFE_BUFFER_SIZE = (
+    10000  # max data count buffered by a producer thread safe sender
+)
+
+DEFAULT_SHARED_MEMORY_RING_SIZE = (
+    1024 * 1024
+)  # bytes count of a shared memory bridge ring
+
+DEFAULT_MIN_POLLING_INTERVAL = 0.0001  # first waiting time in seconds of an idle bridge
+
+DEFAULT_MAX_POLLING_INTERVAL = 0.01  # max waiting time in seconds of an idle bridge
+
+DEFAULT_REMOTE_HIGH_WATER_MARK = (
+    1024 * 1024
+)  # bytes count buffered by a remote connection before waiting
+
+DEFAULT_REMOTE_MAX_FRAME_SIZE = (
+    1024 * 1024
+)  # max bytes count of a client message received by a channel server
+
+DEFAULT_RECONNECT_DELAY = 1  # seconds between a remote channel connection attempts
+
+DEFAULT_MAX_CONCURRENCY = (
+    10  # max perform calls running at the same time in a ConcurrentConsumer
+)
+
+DEFAULT_PARTITIONS_COUNT = 8  # worker queues count of a PartitionedConsumer
+
+DEFAULT_DISPATCHER_MAX_RUNNING = (
+    1  # max consumer perform calls running at the same time in a PriorityDispatcher
+)
+
+DEFAULT_DISPATCHER_WEIGHTS = (8, 4, 1)  # dispatcher turns per round by priority level
+
+DEFAULT_QUEUE_HIGH_WATERMARK = 1000  # consumer queue size pausing producers
+DEFAULT_QUEUE_LOW_WATERMARK = 100  # consumer queue size resuming paused producers
+
+DEFAULT_CHANNEL_CREATION_CONCURRENCY = 16  # channels created at the same time
+
+DEFAULT_JOURNAL_SEGMENT_SIZE = (
+    16 * 1024 * 1024
+)  # preallocated bytes count of a journal segment file
+
+DEFAULT_SPILL_QUEUE_MEMORY_SIZE = 10000  # max data count kept in memory by a SpillQueue
+DEFAULT_SPILL_BATCH_SIZE = 1000  # data count spilled to or read back from disk at once
@@ -22,25 +22,34 @@ import typing
 import async_channel.util.logging_util as logging
 import async_channel.enums
 
+if typing.TYPE_CHECKING:
+    import async_channel.channels.priority_dispatcher
 
-class Consumer:
+
+# pylint: disable=no-member
+class BaseConsumer:
     """
-    A consumer keeps reading from the channel and processes any data passed to it.
-    A consumer will start consuming by calling its 'consume' method.
-    The data processing implementation is coded in the 'perform' method.
-    A consumer also responds to channel events like pause and stop.
+    Defines the consumer behavior without instance dict: see Consumer and CompactConsumer.
+    Subclasses should provide the logger attribute.
     """
 
+    __slots__ = (
+        "queue",
+        "callback",
+        "consume_task",
+        "should_stop",
+        "priority_level",
+        "dispatcher",
+    )
+
     def __init__(
         self,
         callback: typing.Callable,
-        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
-        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        priority_level: int,
+        queue: asyncio.Queue,
     ):
-        self.logger = logging.get_logger(self.__class__.__name__)
-
         # Consumer data queue. It contains producer's work (received through Producer.send()).
-        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.queue: asyncio.Queue = queue
 
         # Method to be called when performing task is done
         self.callback: typing.Callable = callback
@@ -60,24 +69,42 @@ class Consumer:
         # The lowest level has the highest priority
         self.priority_level: int = priority_level
 
+        # Gives perform turns by priority level when set, see Channel.enable_priority_dispatch
+        self.dispatcher: typing.Optional[
+            "async_channel.channels.priority_dispatcher.PriorityDispatcher"
+        ] = None
+
     async def consume(self) -> None:
         """
         Should be overwritten with a self.queue.get() in a while loop
         """
         while not self.should_stop:
             try:
-                await self.perform(await self.queue.get())
+                data = await self.queue.get()
+                if self.dispatcher is None:
+                    await self.perform(data)
+                else:
+                    await self.dispatcher.dispatch(
+                        self.priority_level, self.perform, data
+                    )
             except asyncio.CancelledError:
                 self.logger.debug("Cancelled task")
             except Exception as consume_exception:  # pylint: disable=broad-except
-                self.logger.exception(
-                    consume_exception,
-                    publish_error_if_necessary=True,  # type: ignore
-                    error_message=f"Exception when calling callback on {self}: {consume_exception}",  # type: ignore
-                )
+                self._log_consume_exception(consume_exception)
             finally:
                 await self.consume_ends()
 
+    def _log_consume_exception(self, consume_exception: Exception) -> None:
+        """
+        Logs an exception raised when consuming queue data
+        :param consume_exception: the raised exception
+        """
+        self.logger.exception(
+            consume_exception,
+            publish_error_if_necessary=True,  # type: ignore
+            error_message=f"Exception when calling callback on {self}: {consume_exception}",  # type: ignore
+        )
+
     async def perform(self, kwargs) -> None:
         """
         Should be overwritten to handle queue data
@@ -137,6 +164,31 @@ class Consumer:
         return f"{self.__class__.__name__} with callback: {self.callback.__name__}"
 
 
+class Consumer(BaseConsumer):
+    """
+    A consumer keeps reading from the channel and processes any data passed to it.
+    A consumer will start consuming by calling its 'consume' method.
+    The data processing implementation is coded in the 'perform' method.
+    A consumer also responds to channel events like pause and stop.
+    """
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        self.logger = logging.get_logger(self.__class__.__name__)
+
+        # Uses the given queue if any (size is then ignored)
+        super().__init__(
+            callback,
+            priority_level,
+            asyncio.Queue(maxsize=size) if queue is None else queue,
+        )
+
+
 class InternalConsumer(Consumer):
     """
     An InternalConsumer is a classic Consumer except that his callback is declared internally
@@ -157,25 +209,21 @@ class InternalConsumer(Consumer):
         raise NotImplementedError("internal_callback is not implemented")
 
 
-class SupervisedConsumer(Consumer):
+# pylint: disable=assigning-non-slot, no-member
+class BaseSupervisedConsumer(BaseConsumer):
     """
-    A SupervisedConsumer is a classic Consumer that notifies the queue when its work is done
+    Defines the supervised consumer behavior: see SupervisedConsumer and CompactSupervisedConsumer.
+    Subclasses should provide the idle event and the performing_count attribute storage:
+    slots of several bases can't be combined.
     """
 
-    def __init__(
-        self,
-        callback: typing.Callable,
-        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
-        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
-    ):
-        """
-        The constructor only override the callback to be the 'internal_callback' method
-        """
-        super().__init__(callback, size=size, priority_level=priority_level)
+    __slots__ = ()
 
-        # Clear when perform is running (set after)
-        self.idle: asyncio.Event = asyncio.Event()
-        self.idle.set()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Count of running perform calls, idle is only set when none is running
+        self.performing_count: int = 0
 
     async def join(self, timeout: float) -> None:
         """
@@ -192,14 +240,17 @@ class SupervisedConsumer(Consumer):
 
     async def perform(self, kwargs) -> None:
         """
-        Clear self.idle event when perform is being done then set it
+        Clear self.idle event when perform is being done then set it when no other perform is running
         :param kwargs: queue get content
         """
         try:
+            self.performing_count += 1
             self.idle.clear()
             await self.callback(**kwargs)
         finally:
-            self.idle.set()
+            self.performing_count -= 1
+            if not self.performing_count:
+                self.idle.set()
 
     async def consume_ends(self) -> None:
         """
@@ -211,3 +262,27 @@ class SupervisedConsumer(Consumer):
             ValueError
         ):  # when task_done() is called when the Exception was CancelledError
             pass
+
+
+class SupervisedConsumer(BaseSupervisedConsumer, Consumer):
+    """
+    A SupervisedConsumer is a classic Consumer that notifies the queue when its work is done
+    """
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        """
+        The constructor only override the callback to be the 'internal_callback' method
+        """
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+
+        # Clear when perform is running (set after)
+        self.idle: asyncio.Event = asyncio.Event()
+        self.idle.set()
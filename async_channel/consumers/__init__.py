@@ -0,0 +1,73 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define specialized async_channel consumers
+"""
+from async_channel.consumers import batch_consumer
+from async_channel.consumers import process_pool_consumer
+from async_channel.consumers import concurrent_consumer
+from async_channel.consumers import partitioned_consumer
+from async_channel.consumers import direct_consumer
+from async_channel.consumers import compact_consumer
+from async_channel.consumers import windowed_consumer
+
+from async_channel.consumers.batch_consumer import (
+    BatchConsumer,
+    SupervisedBatchConsumer,
+)
+from async_channel.consumers.process_pool_consumer import (
+    ProcessPoolConsumer,
+    SupervisedProcessPoolConsumer,
+    SharedMemoryArgument,
+)
+from async_channel.consumers.concurrent_consumer import (
+    ConcurrentConsumer,
+    SupervisedConcurrentConsumer,
+)
+from async_channel.consumers.partitioned_consumer import (
+    PartitionedConsumer,
+    SupervisedPartitionedConsumer,
+)
+from async_channel.consumers.direct_consumer import (
+    DirectConsumer,
+)
+from async_channel.consumers.compact_consumer import (
+    CompactConsumer,
+    CompactSupervisedConsumer,
+)
+from async_channel.consumers.windowed_consumer import (
+    WindowTimer,
+    WindowedConsumer,
+    get_window_timer,
+)
+
+__all__ = [
+    "BatchConsumer",
+    "SupervisedBatchConsumer",
+    "ProcessPoolConsumer",
+    "SupervisedProcessPoolConsumer",
+    "SharedMemoryArgument",
+    "ConcurrentConsumer",
+    "SupervisedConcurrentConsumer",
+    "PartitionedConsumer",
+    "SupervisedPartitionedConsumer",
+    "DirectConsumer",
+    "CompactConsumer",
+    "CompactSupervisedConsumer",
+    "WindowTimer",
+    "WindowedConsumer",
+    "get_window_timer",
+]
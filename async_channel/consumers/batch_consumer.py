@@ -0,0 +1,129 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel BatchConsumer classes
+"""
+import asyncio
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.consumer as consumer
+
+
+class BatchConsumer(consumer.Consumer):
+    """
+    A BatchConsumer is a Consumer that calls its callback with a list of queued data.
+    It waits for a first data then drains its queue until max_batch data are collected.
+    When max_wait is set, it waits up to max_wait seconds for the batch to be filled.
+    The callback is called as
+        >>> await callback(batch)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        max_batch: int = async_channel.constants.DEFAULT_MAX_BATCH,
+        max_wait: float = 0,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+
+        # Maximum data count given to a callback call
+        self.max_batch: int = max_batch
+
+        # Maximum time to wait for a batch to be filled after its first data, 0 to never wait
+        self.max_wait: float = max_wait
+
+    async def consume(self) -> None:
+        """
+        Drains the queue and calls perform_batch for each batch
+        """
+        while not self.should_stop:
+            batch: list = []
+            try:
+                batch.append(await self.queue.get())
+                await self._fill_batch(batch)
+                if self.dispatcher is None:
+                    await self.perform_batch(batch)
+                else:
+                    await self.dispatcher.dispatch(
+                        self.priority_level, self.perform_batch, batch
+                    )
+            except asyncio.CancelledError:
+                self.logger.debug("Cancelled batch task")
+            except Exception as consume_exception:  # pylint: disable=broad-except
+                self._log_consume_exception(consume_exception)
+            finally:
+                for _ in batch:
+                    await self.consume_ends()
+
+    async def _fill_batch(self, batch: list) -> None:
+        """
+        Adds queued data to batch until it is full, waiting up to max_wait for new data
+        :param batch: the batch to fill
+        """
+        deadline = None
+        while len(batch) < self.max_batch:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            if self.max_wait <= 0:
+                return
+            if deadline is None:
+                deadline = asyncio.get_running_loop().time() + self.max_wait
+            remaining_time = deadline - asyncio.get_running_loop().time()
+            if remaining_time <= 0:
+                return
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining_time))
+            except asyncio.TimeoutError:
+                return
+
+    async def perform(self, kwargs) -> None:
+        """
+        Performs a single data batch, used when the queue is emptied by the producer
+        :param kwargs: queue get content
+        """
+        await self.perform_batch([kwargs])
+
+    async def perform_batch(self, batch: list) -> None:
+        """
+        Should be overwritten to handle queue data batches
+        :param batch: the queue get contents
+        """
+        await self.callback(batch)
+
+
+class SupervisedBatchConsumer(BatchConsumer, consumer.SupervisedConsumer):
+    """
+    A SupervisedBatchConsumer is a BatchConsumer that notifies the queue when each batch data is processed
+    """
+
+    async def perform_batch(self, batch: list) -> None:
+        """
+        Clear self.idle event when perform_batch is being done then set it
+        :param batch: the queue get contents
+        """
+        try:
+            self.idle.clear()
+            await super().perform_batch(batch)
+        finally:
+            self.idle.set()
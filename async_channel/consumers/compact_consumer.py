@@ -0,0 +1,123 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel CompactConsumer classes
+"""
+import asyncio
+import typing
+
+import async_channel.constants
+import async_channel.consumer as channel_consumer
+import async_channel.enums
+import async_channel.queues.lazy_queue as lazy_queue
+import async_channel.util.logging_util as logging
+
+
+class CompactConsumer(channel_consumer.BaseConsumer):
+    """
+    A CompactConsumer is a Consumer without instance dict whose queue and consume task are only created
+    when the first data is put: idle subscriptions cost a fraction of a Consumer memory.
+    Suited to channels with many rarely triggered consumers.
+    Its queue can't be observed before being created: backpressure ignores it and synchronized channels
+    always consider it as dirty. It can't be metered.
+    """
+
+    __slots__ = ("_is_task_pending",)
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+    ):
+        super().__init__(
+            callback,
+            priority_level,
+            lazy_queue.LazyQueue(size, self),  # type: ignore
+        )
+
+        # True when create_task has been called before the queue creation
+        self._is_task_pending: bool = False
+
+    @property
+    def logger(self) -> typing.Any:
+        """
+        :return: the consumer logger, created on demand
+        """
+        return logging.get_logger(self.__class__.__name__)
+
+    def on_queue_created(self, queue: asyncio.Queue) -> None:
+        """
+        Called by the lazy queue when data is first put: uses queue and starts the pending consume task
+        :param queue: the created queue
+        """
+        self.queue = queue
+        if self._is_task_pending:
+            self._is_task_pending = False
+            super().create_task()
+
+    def create_task(self) -> None:
+        """
+        Creates the consume task, delayed until the queue creation
+        """
+        if isinstance(self.queue, lazy_queue.LazyQueue):
+            self._is_task_pending = True
+        else:
+            super().create_task()
+
+    async def stop(self) -> None:
+        """
+        Stops the consumer and cancels its pending consume task creation
+        """
+        self._is_task_pending = False
+        await super().stop()
+
+
+class CompactSupervisedConsumer(
+    channel_consumer.BaseSupervisedConsumer, CompactConsumer
+):
+    """
+    A CompactSupervisedConsumer is a CompactConsumer that notifies the queue when its work is done.
+    Its idle event is only created when data is first performed.
+    """
+
+    __slots__ = ("performing_count", "_idle")
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+    ):
+        super().__init__(callback, size=size, priority_level=priority_level)
+        self._idle: typing.Optional[asyncio.Event] = None
+
+    @property
+    def idle(self) -> asyncio.Event:  # type: ignore
+        """
+        :return: the idle event, created on demand
+        """
+        if self._idle is None:
+            self._idle = asyncio.Event()
+            self._idle.set()
+        return self._idle
+
+    async def join(self, timeout: float) -> None:
+        """
+        Wait for any perform to be finished, returns immediately when nothing has been performed yet
+        """
+        if self._idle is not None:
+            await super().join(timeout)
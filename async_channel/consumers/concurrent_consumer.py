@@ -0,0 +1,114 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel ConcurrentConsumer classes
+"""
+import asyncio
+import typing
+
+import async_channel.consumer as channel_consumer
+import async_channel.constants
+import async_channel.enums
+
+
+class ConcurrentConsumer(channel_consumer.Consumer):
+    """
+    A ConcurrentConsumer is a Consumer that runs up to max_concurrency perform calls at the same time.
+    Queued data are performed in queue order but may be processed out of order.
+    Exceptions are reported for each data.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        max_concurrency: int = async_channel.constants.DEFAULT_MAX_CONCURRENCY,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+
+        # Maximum count of perform calls running at the same time
+        self.max_concurrency: int = max_concurrency
+
+        self._concurrency_slots: typing.Optional[asyncio.Semaphore] = None
+        self._perform_tasks: set[asyncio.Task] = set()
+
+    async def consume(self) -> None:
+        """
+        Starts a perform task for each queued data once a concurrency slot is available
+        """
+        while not self.should_stop:
+            try:
+                await self._concurrency_slots.acquire()  # type: ignore
+                try:
+                    data = await self.queue.get()
+                except BaseException:
+                    self._concurrency_slots.release()  # type: ignore
+                    raise
+                task = asyncio.create_task(self._perform_concurrently(data))
+                self._perform_tasks.add(task)
+                task.add_done_callback(self._perform_tasks.discard)
+            except asyncio.CancelledError:
+                self.logger.debug("Cancelled concurrent task")
+
+    async def _perform_concurrently(self, kwargs) -> None:
+        """
+        Performs data then releases its concurrency slot
+        :param kwargs: queue get content
+        """
+        try:
+            await self.perform(kwargs)
+        except asyncio.CancelledError:
+            self.logger.debug("Cancelled perform task")
+        except Exception as consume_exception:  # pylint: disable=broad-except
+            self._log_consume_exception(consume_exception)
+        finally:
+            self._concurrency_slots.release()  # type: ignore
+            await self.consume_ends()
+
+    def get_running_count(self) -> int:
+        """
+        :return: the count of running perform tasks
+        """
+        return len(self._perform_tasks)
+
+    async def start(self) -> None:
+        """
+        Initializes the concurrency slots
+        """
+        await super().start()
+        if self._concurrency_slots is None:
+            self._concurrency_slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def stop(self) -> None:
+        """
+        Stops the consumer and cancels its running perform tasks
+        """
+        await super().stop()
+        for task in list(self._perform_tasks):
+            task.cancel()
+
+
+class SupervisedConcurrentConsumer(
+    ConcurrentConsumer, channel_consumer.SupervisedConsumer
+):
+    """
+    A SupervisedConcurrentConsumer is a ConcurrentConsumer that notifies the queue when each data is processed.
+    It is idle when no perform call is running.
+    """
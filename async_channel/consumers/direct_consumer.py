@@ -0,0 +1,115 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel DirectConsumer class
+"""
+import asyncio
+import inspect
+import typing
+
+import async_channel.consumer as channel_consumer
+import async_channel.constants
+import async_channel.enums
+import async_channel.queues.direct_queue as direct_queue
+
+
+class DirectConsumer(channel_consumer.Consumer):
+    """
+    A DirectConsumer has no queue and no consume task: its callback is called inline by the producers
+    putting data in its queue. Suited to cheap callbacks, for which queuing costs more than the callback itself.
+    The callback can be a coroutine function, awaited by the producer, or a regular function.
+    Exceptions raised by the callback are logged and never propagated to the producer.
+    Data is performed in the putting producer context: producers wait for the callback to return.
+    """
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+    ):
+        """
+        :param size: ignored, data is never queued
+        """
+        super().__init__(
+            callback,
+            size=size,
+            priority_level=priority_level,
+            queue=direct_queue.DirectQueue(self.dispatch, self.dispatch_nowait),  # type: ignore
+        )
+
+        # Tasks awaiting coroutine callbacks called from put_nowait
+        self._nowait_tasks: set[asyncio.Task] = set()
+
+    async def dispatch(self, kwargs) -> None:
+        """
+        Called by the queue when data is put: performs data, logging raised exceptions
+        :param kwargs: put data
+        """
+        if self.should_stop:
+            return
+        try:
+            await self.perform(kwargs)
+        except Exception as consume_exception:  # pylint: disable=broad-except
+            self._log_consume_exception(consume_exception)
+
+    def dispatch_nowait(self, kwargs) -> None:
+        """
+        Called by the queue when data is put without waiting: coroutine callbacks are awaited in a task
+        :param kwargs: put data
+        """
+        if self.should_stop:
+            return
+        try:
+            result = self.callback(**kwargs)
+        except Exception as consume_exception:  # pylint: disable=broad-except
+            self._log_consume_exception(consume_exception)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(self._await_callback(result))
+            self._nowait_tasks.add(task)
+            task.add_done_callback(self._nowait_tasks.discard)
+
+    async def _await_callback(self, result: typing.Awaitable) -> None:
+        """
+        Awaits a callback result, logging raised exceptions
+        """
+        try:
+            await result
+        except Exception as consume_exception:  # pylint: disable=broad-except
+            self._log_consume_exception(consume_exception)
+
+    async def perform(self, kwargs) -> None:
+        """
+        Calls the callback, awaiting its result when it is a coroutine function
+        :param kwargs: put data
+        """
+        result = self.callback(**kwargs)
+        if inspect.isawaitable(result):
+            await result
+
+    def create_task(self) -> None:
+        """
+        Data is performed by producers: no consume task is created
+        """
+
+    async def stop(self) -> None:
+        """
+        Stops performing put data and cancels pending put_nowait coroutine callbacks
+        """
+        await super().stop()
+        for task in list(self._nowait_tasks):
+            task.cancel()
@@ -0,0 +1,148 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel PartitionedConsumer classes
+"""
+import asyncio
+import typing
+
+import async_channel.consumer as channel_consumer
+import async_channel.enums
+import async_channel.constants
+
+
+class PartitionedConsumer(channel_consumer.Consumer):
+    """
+    A PartitionedConsumer is a Consumer that dispatches its queued data to partitions_count worker queues
+    according to the hash of their key. Each partition is performed by its own task:
+    data of a key are performed in order while data of keys from different partitions are performed concurrently.
+    The key of a data is either data[partition_key] when partition_key is a string
+    (a consumer filter field for example) or partition_key(data) when partition_key is callable.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        partition_key: typing.Union[
+            str, typing.Callable[[typing.Any], typing.Hashable]
+        ] = "",
+        partitions_count: int = async_channel.constants.DEFAULT_PARTITIONS_COUNT,
+        partition_size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+        if not partition_key:
+            raise ValueError("A PartitionedConsumer requires a partition_key")
+
+        # Data key: a data field name or a function returning the data key
+        self.partition_key: typing.Union[
+            str, typing.Callable[[typing.Any], typing.Hashable]
+        ] = partition_key
+
+        # Worker queues, their size is bounded by partition_size
+        self.partitions: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=partition_size) for _ in range(partitions_count)
+        ]
+
+        self.partition_tasks: list[asyncio.Task] = []
+
+    def get_key(self, data: typing.Any) -> typing.Hashable:
+        """
+        :param data: the data to get the key from
+        :return: the key of data
+        """
+        return (
+            self.partition_key(data)
+            if callable(self.partition_key)
+            else data[self.partition_key]
+        )
+
+    def get_partition_index(self, data: typing.Any) -> int:
+        """
+        :param data: the data to partition
+        :return: the index of the data partition
+        """
+        return hash(self.get_key(data)) % len(self.partitions)
+
+    def get_partitions_queue_depth(self) -> list[int]:
+        """
+        :return: the count of data waiting in each partition, a hot key makes its partition grow
+        """
+        return [partition.qsize() for partition in self.partitions]
+
+    async def consume(self) -> None:
+        """
+        Dispatches queued data to their partition
+        """
+        while not self.should_stop:
+            try:
+                data = await self.queue.get()
+                try:
+                    await self.partitions[self.get_partition_index(data)].put(data)
+                except Exception:
+                    await self.consume_ends()
+                    raise
+            except asyncio.CancelledError:
+                self.logger.debug("Cancelled dispatch task")
+            except Exception as consume_exception:  # pylint: disable=broad-except
+                self._log_consume_exception(consume_exception)
+
+    async def consume_partition(self, partition: asyncio.Queue) -> None:
+        """
+        Performs the data of a partition in order
+        :param partition: the partition queue
+        """
+        while not self.should_stop:
+            try:
+                await self.perform(await partition.get())
+            except asyncio.CancelledError:
+                self.logger.debug("Cancelled partition task")
+            except Exception as consume_exception:  # pylint: disable=broad-except
+                self._log_consume_exception(consume_exception)
+            finally:
+                await self.consume_ends()
+
+    def create_task(self) -> None:
+        """
+        Creates the dispatch task and a task for each partition
+        """
+        super().create_task()
+        self.partition_tasks = [
+            asyncio.create_task(self.consume_partition(partition))
+            for partition in self.partitions
+        ]
+
+    async def stop(self) -> None:
+        """
+        Stops the dispatch and partitions tasks
+        """
+        await super().stop()
+        for task in self.partition_tasks:
+            task.cancel()
+        self.partition_tasks = []
+
+
+class SupervisedPartitionedConsumer(
+    PartitionedConsumer, channel_consumer.SupervisedConsumer
+):
+    """
+    A SupervisedPartitionedConsumer is a PartitionedConsumer that notifies the queue when each data is performed.
+    It is idle when no partition is performing data.
+    """
@@ -0,0 +1,340 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel ProcessPoolConsumer classes
+"""
+import asyncio
+import concurrent.futures
+import multiprocessing.shared_memory as shared_memory
+import typing
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.consumer as consumer
+
+
+class SharedMemoryArgument:
+    """
+    Describes a callback argument sent to the worker process through a shared memory block
+    """
+
+    BYTES = "bytes"
+    NDARRAY = "ndarray"
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        name: str,
+        size: int,
+        kind: str,
+        dtype: typing.Optional[str] = None,
+        shape: typing.Optional[tuple] = None,
+    ):
+        self.name: str = name
+        self.size: int = size
+        self.kind: str = kind
+        self.dtype: typing.Optional[str] = dtype
+        self.shape: typing.Optional[tuple] = shape
+
+
+# pylint: disable=too-many-instance-attributes
+class ProcessPoolConsumer(consumer.Consumer):
+    """
+    A ProcessPoolConsumer is a Consumer that runs its callback in a worker process of a process pool.
+    The callback must be a picklable synchronous function, it is called in the worker process as
+        >>> callback(**kwargs)
+    Its result is given to result_callback on the event loop when set
+        >>> await result_callback(result)
+    Up to max_in_flight data are processed at the same time. When ordered, results are handled in queue order.
+    Bytes-like and numpy arrays arguments of at least shared_memory_threshold bytes are sent through shared memory
+    instead of being pickled: the callback receives a memoryview or an array that is only valid during its call.
+    Uses the given executor if any, otherwise creates its own process pool when started.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        max_in_flight: int = async_channel.constants.DEFAULT_MAX_IN_FLIGHT,
+        ordered: bool = True,
+        result_callback: typing.Optional[typing.Callable] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        max_workers: typing.Optional[int] = None,
+        shared_memory_threshold: int = async_channel.constants.DEFAULT_SHARED_MEMORY_THRESHOLD,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+
+        # Maximum data count processed at the same time
+        self.max_in_flight: int = max_in_flight
+
+        # When True, results are handled in queue order
+        self.ordered: bool = ordered
+
+        # Coroutine function called on the event loop with each callback result
+        self.result_callback: typing.Optional[typing.Callable] = result_callback
+
+        # Process pool running callbacks, created when started if not given
+        self.executor: typing.Optional[concurrent.futures.Executor] = executor
+        self.max_workers: typing.Optional[int] = max_workers
+        self._owns_executor: bool = executor is None
+
+        # Minimum bytes count of an argument sent through shared memory
+        self.shared_memory_threshold: int = shared_memory_threshold
+
+        # Count of data being processed
+        self.in_flight_count: int = 0
+
+        self._in_flight_slots: typing.Optional[asyncio.Semaphore] = None
+        self._in_flight_tasks: set[asyncio.Task] = set()
+        self._last_in_flight_task: typing.Optional[asyncio.Task] = None
+
+    async def consume(self) -> None:
+        """
+        Offloads each queued data once an in flight slot is available
+        """
+        while not self.should_stop:
+            try:
+                await self._in_flight_slots.acquire()  # type: ignore
+                try:
+                    data = await self.queue.get()
+                except BaseException:
+                    self._in_flight_slots.release()  # type: ignore
+                    raise
+                self._work_started()
+                task = asyncio.create_task(
+                    self._perform_in_flight(data, self._last_in_flight_task)
+                )
+                self._in_flight_tasks.add(task)
+                task.add_done_callback(self._in_flight_tasks.discard)
+                self._last_in_flight_task = task
+            except asyncio.CancelledError:
+                self.logger.debug("Cancelled process pool task")
+
+    async def _perform_in_flight(
+        self, kwargs: dict, previous_task: typing.Optional[asyncio.Task]
+    ) -> None:
+        """
+        Runs the callback in the process pool and handles its result
+        :param kwargs: queue get content
+        :param previous_task: the previous in flight task, waited before handling the result when ordered
+        """
+        try:
+            try:
+                result = await self.offload(kwargs)
+            finally:
+                if self.ordered and previous_task is not None:
+                    await asyncio.wait([previous_task])
+            await self.handle_result(result)
+        except asyncio.CancelledError:
+            self.logger.debug("Cancelled process pool task")
+        except Exception as consume_exception:  # pylint: disable=broad-except
+            self._log_consume_exception(consume_exception)
+        finally:
+            self._in_flight_slots.release()  # type: ignore
+            self._work_done()
+            await self.consume_ends()
+
+    async def perform(self, kwargs) -> None:
+        """
+        Runs the callback in the process pool and handles its result
+        :param kwargs: queue get content
+        """
+        self._work_started()
+        try:
+            await self.handle_result(await self.offload(kwargs))
+        finally:
+            self._work_done()
+
+    async def offload(self, kwargs: dict) -> typing.Any:
+        """
+        Runs the callback with kwargs in the process pool
+        :param kwargs: the callback arguments
+        :return: the callback result
+        """
+        shared_kwargs, blocks = _share_arguments(kwargs, self.shared_memory_threshold)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _run_callback, self.callback, shared_kwargs
+            )
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    async def handle_result(self, result: typing.Any) -> None:
+        """
+        Should be overwritten to handle callback results
+        :param result: the callback result
+        """
+        if self.result_callback is not None:
+            await self.result_callback(result)
+
+    def _work_started(self) -> None:
+        """
+        Called when a data processing starts
+        """
+        self.in_flight_count += 1
+
+    def _work_done(self) -> None:
+        """
+        Called when a data processing is done
+        """
+        self.in_flight_count -= 1
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """
+        :return: the process pool, created if necessary
+        """
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers
+            )
+        return self.executor
+
+    async def start(self) -> None:
+        """
+        Initializes the in flight slots and the process pool
+        """
+        await super().start()
+        if self._in_flight_slots is None:
+            self._in_flight_slots = asyncio.Semaphore(self.max_in_flight)
+        self._get_executor()
+
+    async def stop(self) -> None:
+        """
+        Stops the consumer, cancels its in flight tasks and shuts down its own process pool
+        """
+        await super().stop()
+        for task in list(self._in_flight_tasks):
+            task.cancel()
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class SupervisedProcessPoolConsumer(ProcessPoolConsumer, consumer.SupervisedConsumer):
+    """
+    A SupervisedProcessPoolConsumer is a ProcessPoolConsumer that notifies the queue when each data processing is done.
+    It is idle when no data is being processed.
+    """
+
+    def _work_started(self) -> None:
+        """
+        Clears self.idle when a data processing starts
+        """
+        super()._work_started()
+        self.idle.clear()
+
+    def _work_done(self) -> None:
+        """
+        Sets self.idle when no data is being processed anymore
+        """
+        super()._work_done()
+        if not self.in_flight_count:
+            self.idle.set()
+
+
+def _share_arguments(
+    kwargs: dict, threshold: int
+) -> tuple[dict, list[shared_memory.SharedMemory]]:
+    """
+    Copies large bytes-like and numpy arrays arguments into shared memory blocks
+    :param kwargs: the callback arguments
+    :param threshold: the minimum bytes count of an argument to share
+    :return: the arguments referencing shared memory blocks and the created blocks
+    """
+    shared_kwargs = kwargs
+    blocks = []
+    for key, value in kwargs.items():
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            view = memoryview(value).cast("B")
+            kind, dtype, shape = SharedMemoryArgument.BYTES, None, None
+        elif _is_ndarray(value):
+            view = memoryview(
+                value if value.flags["C_CONTIGUOUS"] else value.tobytes()
+            ).cast("B")
+            kind, dtype, shape = (
+                SharedMemoryArgument.NDARRAY,
+                value.dtype.str,
+                value.shape,
+            )
+        else:
+            continue
+        if view.nbytes < threshold:
+            continue
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        block.buf[: view.nbytes] = view
+        blocks.append(block)
+        if shared_kwargs is kwargs:
+            shared_kwargs = dict(kwargs)
+        shared_kwargs[key] = SharedMemoryArgument(
+            block.name, view.nbytes, kind, dtype=dtype, shape=shape
+        )
+    return shared_kwargs, blocks
+
+
+def _is_ndarray(value: typing.Any) -> bool:
+    """
+    :return: True if value is a numpy array, numpy is optional and not imported
+    """
+    return (
+        value.__class__.__name__ == "ndarray" and value.__class__.__module__ == "numpy"
+    )
+
+
+def _run_callback(callback: typing.Callable, kwargs: dict) -> typing.Any:
+    """
+    Called in the worker process: attaches shared memory arguments and calls the callback
+    :param callback: the consumer callback
+    :param kwargs: the callback arguments
+    :return: the callback result
+    """
+    blocks = []
+    loaded_kwargs = dict(kwargs)
+    try:
+        for key, value in kwargs.items():
+            if isinstance(value, SharedMemoryArgument):
+                block = shared_memory.SharedMemory(name=value.name)
+                blocks.append(block)
+                loaded_kwargs[key] = _load_argument(block, value)
+        return callback(**loaded_kwargs)
+    finally:
+        for value in loaded_kwargs.values():
+            if isinstance(value, memoryview):
+                value.release()
+        loaded_kwargs.clear()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # a shared argument is still referenced: let the garbage collector close it
+                pass
+
+
+def _load_argument(
+    block: shared_memory.SharedMemory, argument: SharedMemoryArgument
+) -> typing.Any:
+    """
+    :return: the argument value backed by block
+    """
+    if argument.kind == SharedMemoryArgument.NDARRAY:
+        import numpy  # pylint: disable=import-outside-toplevel, import-error
+
+        return numpy.ndarray(argument.shape, dtype=argument.dtype, buffer=block.buf)
+    return block.buf[: argument.size]
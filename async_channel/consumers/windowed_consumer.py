@@ -0,0 +1,317 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel WindowedConsumer and the WindowTimer shared by its time windows
+"""
+import asyncio
+import collections
+import functools
+import heapq
+import itertools
+import math
+import typing
+import weakref
+
+import async_channel.constants
+import async_channel.enums
+import async_channel.consumer as consumer
+
+# Window timer of each event loop
+_WINDOW_TIMERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class WindowTimer:
+    """
+    A WindowTimer notifies windowed consumers when their windows end.
+    Deadlines of every consumer of an event loop are kept in a single heap:
+    only the earliest deadline is scheduled on the loop, instead of one sleep task per consumer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop: asyncio.AbstractEventLoop = loop
+        self._deadlines: list[tuple[float, int, "WindowedConsumer"]] = []
+        self._sequence: typing.Iterator[int] = itertools.count()
+        self._handle: typing.Optional[asyncio.TimerHandle] = None
+        self._handle_deadline: float = math.inf
+
+    def schedule(self, deadline: float, windowed_consumer: "WindowedConsumer") -> None:
+        """
+        Notifies windowed_consumer at deadline
+        :param deadline: the event loop time to notify windowed_consumer at
+        :param windowed_consumer: the consumer to notify
+        """
+        heapq.heappush(
+            self._deadlines, (deadline, next(self._sequence), windowed_consumer)
+        )
+        if deadline < self._handle_deadline:
+            if self._handle is not None:
+                self._handle.cancel()
+            self._handle = self.loop.call_at(deadline, self._on_deadline)
+            self._handle_deadline = deadline
+
+    def get_scheduled_count(self) -> int:
+        """
+        :return: the count of scheduled notifications
+        """
+        return len(self._deadlines)
+
+    def _on_deadline(self) -> None:
+        """
+        Notifies every consumer which deadline is reached then schedules the next deadline
+        """
+        # the loop may run a timer handle slightly before its deadline
+        now = max(self.loop.time(), self._handle_deadline)
+        self._handle = None
+        self._handle_deadline = math.inf
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, windowed_consumer = heapq.heappop(self._deadlines)
+            windowed_consumer.on_window_deadline(now)
+        if self._deadlines:
+            self._handle_deadline = self._deadlines[0][0]
+            self._handle = self.loop.call_at(self._handle_deadline, self._on_deadline)
+
+
+def get_window_timer() -> WindowTimer:
+    """
+    :return: the window timer of the running event loop, created if necessary
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return _WINDOW_TIMERS[loop]
+    except KeyError:
+        window_timer = _WINDOW_TIMERS[loop] = WindowTimer(loop)
+        return window_timer
+
+
+# pylint: disable=too-many-instance-attributes
+class WindowedConsumer(consumer.Consumer):
+    """
+    A WindowedConsumer is a Consumer that groups queued data into windows and calls its callback once per window.
+    Windows contain either window_count data or the data received during window_duration seconds of the
+    event loop monotonic time. Windows are tumbling when slide is None, otherwise a new window starts
+    every slide data or seconds: sliding windows overlap when slide is smaller than the window.
+    Time windows are aligned on multiples of slide, empty time windows are skipped, time windows ends are
+    notified by the event loop WindowTimer.
+    The callback is called with the window data list, or with its reduced value when reducer is set
+        >>> await callback(window)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        callback: typing.Callable,
+        size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
+        priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        window_count: typing.Optional[int] = None,
+        window_duration: typing.Optional[float] = None,
+        slide: typing.Optional[float] = None,
+        reducer: typing.Optional[typing.Callable] = None,
+        initial: typing.Any = None,
+        queue: typing.Optional[asyncio.Queue] = None,
+    ):
+        super().__init__(
+            callback, size=size, priority_level=priority_level, queue=queue
+        )
+        if (window_count is None) == (window_duration is None):
+            raise ValueError(
+                "A WindowedConsumer requires either a window_count or a window_duration"
+            )
+        if slide is not None and slide <= 0:
+            raise ValueError("A WindowedConsumer slide should be positive")
+
+        # Count of data of a count window
+        self.window_count: typing.Optional[int] = window_count
+
+        # Seconds of a time window
+        self.window_duration: typing.Optional[float] = window_duration
+
+        # Data count or seconds between windows starts, None for tumbling windows
+        self.slide: typing.Optional[float] = slide
+
+        # Function reducing window data as reducer(accumulated, data), starting from initial when not None
+        self.reducer: typing.Optional[typing.Callable] = reducer
+        self.initial: typing.Any = initial
+
+        # Count of windows given to the callback
+        self.windows_count: int = 0
+
+        # Count windows: the window data, time windows: the (time, data) of the open windows
+        self._items: collections.deque = collections.deque(maxlen=window_count)
+        self._pending_count: int = 0
+        self._window_index: typing.Optional[int] = None
+        self._scheduled_deadline: typing.Optional[float] = None
+        self._ready_windows: collections.deque = collections.deque()
+        self._emit_task: typing.Optional[asyncio.Task] = None
+
+    async def perform(self, kwargs) -> None:
+        """
+        Adds data to its windows, performs completed windows
+        :param kwargs: queue get content
+        """
+        if self.window_count is not None:
+            self._items.append(kwargs)
+            self._pending_count += 1
+            if len(self._items) == self.window_count and self._pending_count >= (
+                self.slide or self.window_count
+            ):
+                await self.perform_window(self._take_count_window())
+            return
+        now = asyncio.get_running_loop().time()
+        self._close_time_windows(now)
+        self._items.append((now, kwargs))
+        if self._window_index is None:
+            self._window_index = self._get_first_window_index(now)
+            self._schedule_window_end()
+        self._emit_ready_windows()
+
+    async def perform_window(self, window: list) -> None:
+        """
+        Calls the callback with the window data or its reduced value
+        Should be overwritten to handle windows
+        :param window: the window data
+        """
+        self.windows_count += 1
+        await self.callback(self.reduce_window(window))
+
+    def reduce_window(self, window: list) -> typing.Any:
+        """
+        :param window: the window data
+        :return: the reduced window when reducer is set, otherwise the window
+        """
+        if self.reducer is None:
+            return window
+        if self.initial is None:
+            return functools.reduce(self.reducer, window)
+        return functools.reduce(self.reducer, window, self.initial)
+
+    async def flush_windows(self) -> None:
+        """
+        Performs the incomplete windows: the data of time windows that haven't ended yet
+        and the count window data received since the last performed window
+        """
+        if self.window_count is not None:
+            if self._pending_count:
+                await self.perform_window(self._take_count_window())
+            return
+        self._close_time_windows(math.inf)
+        self._emit_ready_windows()
+        if self._emit_task is not None:
+            await self._emit_task
+
+    def on_window_deadline(self, now: float) -> None:
+        """
+        Called by the window timer when a scheduled window end is reached
+        :param now: the event loop time
+        """
+        if self._scheduled_deadline is not None and self._scheduled_deadline <= now:
+            self._scheduled_deadline = None
+        if self.should_stop:
+            return
+        self._close_time_windows(now)
+        self._emit_ready_windows()
+
+    def _take_count_window(self) -> list:
+        """
+        :return: the count window data, tumbling windows data are cleared
+        """
+        window = list(self._items)
+        self._pending_count = 0
+        if self.slide is None:
+            self._items.clear()
+        return window
+
+    def _get_first_window_index(self, timestamp: float) -> int:
+        """
+        :return: the index of the first time window ending after timestamp
+        """
+        return (
+            math.floor((timestamp - self.window_duration) / self._get_time_slide()) + 1  # type: ignore
+        )
+
+    def _get_time_slide(self) -> float:
+        """
+        :return: the seconds between time windows starts
+        """
+        return self.window_duration if self.slide is None else self.slide  # type: ignore
+
+    def _close_time_windows(self, now: float) -> None:
+        """
+        Moves the time windows ended at now to the ready windows and schedules the next window end
+        :param now: the event loop time
+        """
+        slide = self._get_time_slide()
+        while self._window_index is not None:
+            window_start = self._window_index * slide
+            if window_start + self.window_duration > now:  # type: ignore
+                self._schedule_window_end()
+                return
+            window = [
+                data for timestamp, data in self._items if timestamp >= window_start
+            ]
+            if window:
+                self._ready_windows.append(window)
+            next_window_start = window_start + slide
+            while self._items and self._items[0][0] < next_window_start:
+                self._items.popleft()
+            self._window_index = (
+                max(
+                    self._window_index + 1,
+                    self._get_first_window_index(self._items[0][0]),
+                )
+                if self._items
+                else None
+            )
+
+    def _schedule_window_end(self) -> None:
+        """
+        Schedules the current time window end on the window timer
+        """
+        deadline = (
+            self._window_index * self._get_time_slide() + self.window_duration  # type: ignore
+        )
+        if self._scheduled_deadline != deadline:
+            self._scheduled_deadline = deadline
+            get_window_timer().schedule(deadline, self)
+
+    def _emit_ready_windows(self) -> None:
+        """
+        Starts the emit task when windows are ready and it is not running
+        """
+        if self._ready_windows and (self._emit_task is None or self._emit_task.done()):
+            self._emit_task = asyncio.create_task(self._emit())
+
+    async def _emit(self) -> None:
+        """
+        Performs the ready windows in order
+        """
+        while self._ready_windows and not self.should_stop:
+            window = self._ready_windows.popleft()
+            try:
+                if self.dispatcher is None:
+                    await self.perform_window(window)
+                else:
+                    await self.dispatcher.dispatch(
+                        self.priority_level, self.perform_window, window
+                    )
+            except Exception as consume_exception:  # pylint: disable=broad-except
+                self._log_consume_exception(consume_exception)
+
+    async def stop(self) -> None:
+        """
+        Stops the consumer and cancels its emit task
+        """
+        await super().stop()
+        if self._emit_task is not None:
+            self._emit_task.cancel()
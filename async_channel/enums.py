@@ -29,3 +29,26 @@ class ChannelConsumerPriorityLevels(enum.Enum):
     MEDIUM = 1
     # LOW = 2 not necessary for now
     OPTIONAL = 2
+
+
+class SlowConsumerPolicies(enum.Enum):
+    """
+    Policies applied to consumers that are too late to read a broadcast channel ring buffer
+    """
+
+    BLOCK = "block"  # the producer waits for the slow consumer to read
+    SKIP_TO_HEAD = "skip_to_head"  # the slow consumer skips its pending data
+    DISCONNECT = "disconnect"  # the slow consumer is removed from the channel
+
+
+class QueueOverflowPolicies(enum.Enum):
+    """
+    Policies applied when putting data in a full OverflowQueue
+    """
+
+    BLOCK = "block"  # wait for a free slot, like asyncio.Queue
+    DROP_OLDEST = (
+        "drop_oldest"  # drop the oldest queued data to make room for the new one
+    )
+    DROP_NEWEST = "drop_newest"  # drop the new data
+    RAISE = "raise"  # drop the new data and raise asyncio.QueueFull
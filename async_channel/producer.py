@@ -19,10 +19,13 @@ Define async_channel Producer class
 import asyncio
 import typing
 
+import async_channel.constants
 import async_channel.util.logging_util as logging
+import async_channel.util.threadsafe_sender as threadsafe_sender
 
 if typing.TYPE_CHECKING:
     import async_channel.channels.channel
+    import async_channel.consumer
 
 
 class Producer:
@@ -58,6 +61,11 @@ class Producer:
         """
         self.is_running: bool = False
 
+        # Used to send data from other threads, created by 'enable_threadsafe_send'
+        self.threadsafe_sender: typing.Optional[threadsafe_sender.ThreadSafeSender] = (
+            None
+        )
+
     async def send(self, data: typing.Any) -> None:
         """
         Send to each consumer data though its queue
@@ -71,7 +79,69 @@ class Producer:
             >>>     })
         """
         for consumer in self.channel.get_consumers():
+            try:
+                await consumer.queue.put(data)
+            except asyncio.QueueFull:
+                # full queue with a RAISE overflow policy: data is dropped for this consumer only
+                self.logger.debug(f"Dropped data for {consumer}: queue is full")
+
+    async def send_to_consumer(
+        self, consumer: "async_channel.consumer.BaseConsumer", data: typing.Any
+    ) -> None:
+        """
+        Send data to a single consumer through its queue, like 'send' does for each consumer
+        Should be used by 'send' implementations selecting their recipient consumers
+        :param consumer: the recipient consumer
+        :param data: data to be put into the consumer queue
+        """
+        try:
             await consumer.queue.put(data)
+        except asyncio.QueueFull:
+            # full queue with a RAISE overflow policy: data is dropped for this consumer only
+            self.logger.debug(f"Dropped data for {consumer}: queue is full")
+
+    def enable_threadsafe_send(
+        self,
+        max_buffer_size: int = async_channel.constants.DEFAULT_THREADSAFE_BUFFER_SIZE,
+    ) -> threadsafe_sender.ThreadSafeSender:
+        """
+        Allows 'send_threadsafe' calls, should be called from the producer event loop
+        :param max_buffer_size: the maximum count of data waiting to be sent or being sent
+        :return: the producer thread safe sender
+        """
+        if self.threadsafe_sender is None:
+            self.threadsafe_sender = threadsafe_sender.ThreadSafeSender(
+                self._send_buffered_data, asyncio.get_running_loop(), max_buffer_size
+            )
+        return self.threadsafe_sender
+
+    async def _send_buffered_data(self, data: typing.Any) -> None:
+        """
+        Called by the thread safe sender to send buffered data
+        :param data: data to be sent
+        """
+        await self.send(data)
+
+    def send_threadsafe(
+        self,
+        data: typing.Any,
+        block: bool = False,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        """
+        Send data from any thread: data is buffered and sent with 'send' from the producer event loop
+        The event loop is woken up once per buffered batch instead of once per data
+        Requires 'enable_threadsafe_send' to be called first
+        :param data: data to be sent
+        :param block: when True, waits for buffer space when the buffer is full, never block from the event loop
+        :param timeout: the maximum time to wait for buffer space, None to wait forever
+        :return: False if data was dropped because the buffer is full
+        """
+        if self.threadsafe_sender is None:
+            raise RuntimeError(
+                "enable_threadsafe_send should be called before send_threadsafe"
+            )
+        return self.threadsafe_sender.put(data, block=block, timeout=timeout)
 
     async def push(self, **kwargs) -> None:
         """
@@ -133,11 +203,19 @@ class Producer:
         :param timeout: Time to wait for consumers in join call
         waiting for them when started before this check (when check, their queue is empty but a task is running)
         """
+        tracker = self.channel.dirty_consumers_tracker
         for consumer in self.channel.get_prioritized_consumers(priority_level):
-            while not consumer.queue.empty():
-                await consumer.perform(await consumer.queue.get())
+            if tracker is not None and not tracker.is_dirty(consumer):
+                # clean consumers have no pending work
+                continue
+            queue = consumer.queue
+            while not queue.empty():
+                # drain without waiting: queued data is already available
+                await consumer.perform(queue.get_nowait())
             if join_consumers:
                 await consumer.join(timeout)
+                if tracker is not None and queue.empty():
+                    tracker.mark_clean(consumer)
 
     async def stop(self) -> None:
         """
@@ -147,6 +225,8 @@ class Producer:
         self.is_running = False
         if self.produce_task:
             self.produce_task.cancel()
+        if self.threadsafe_sender is not None:
+            self.threadsafe_sender.stop()
 
     def create_task(self) -> None:
         """
@@ -172,7 +252,12 @@ class Producer:
         :param priority_level: the consumer minimal priority level
         :return: the check result
         """
-        for consumer in self.channel.get_consumers():
-            if consumer.priority_level <= priority_level and not consumer.queue.empty():
-                return False
-        return True
+        tracker = self.channel.dirty_consumers_tracker
+        return all(
+            consumer.queue.empty()
+            for consumer in (
+                self.channel.get_prioritized_consumers(priority_level)
+                if tracker is None
+                else tracker.get_dirty_consumers(priority_level)
+            )
+        )
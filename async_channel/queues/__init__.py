@@ -0,0 +1,67 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define async_channel queues
+"""
+from async_channel.queues import ring_buffer
+from async_channel.queues import overflow_queue
+from async_channel.queues import conflating_queue
+from async_channel.queues import observed_queue
+from async_channel.queues import direct_queue
+from async_channel.queues import lazy_queue
+from async_channel.queues import spill_queue
+
+from async_channel.queues.ring_buffer import (
+    RingBuffer,
+    RingBufferReader,
+)
+from async_channel.queues.overflow_queue import (
+    OverflowQueue,
+)
+from async_channel.queues.conflating_queue import (
+    ConflatingQueue,
+)
+from async_channel.queues.observed_queue import (
+    observe_put,
+    unobserve_put,
+    observe_get,
+    unobserve_get,
+    is_observed,
+)
+from async_channel.queues.direct_queue import (
+    DirectQueue,
+)
+from async_channel.queues.lazy_queue import (
+    LazyQueue,
+)
+from async_channel.queues.spill_queue import (
+    SpillQueue,
+)
+
+__all__ = [
+    "RingBuffer",
+    "RingBufferReader",
+    "OverflowQueue",
+    "ConflatingQueue",
+    "observe_put",
+    "unobserve_put",
+    "observe_get",
+    "unobserve_get",
+    "is_observed",
+    "DirectQueue",
+    "LazyQueue",
+    "SpillQueue",
+]
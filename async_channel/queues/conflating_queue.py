@@ -0,0 +1,89 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the key conflating ConflatingQueue
+"""
+import asyncio
+import collections
+import typing
+
+
+class ConflatingQueue(asyncio.Queue):
+    """
+    A ConflatingQueue is an asyncio.Queue that keeps only the latest pending data of each key.
+    Putting data which key is already pending replaces the pending data at its queue position:
+    data are still consumed in FIFO order of their keys and the queue size is bounded by the count of keys.
+    The key of a data is either data[key] when key is a string or key(data) when key is callable.
+    """
+
+    def __init__(
+        self,
+        key: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable]],
+        maxsize: int = 0,
+    ):
+        # Data key: a data field name or a function returning the data key
+        self.key: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable]] = (
+            key
+        )
+
+        # Count of pending data replaced by a newer data of the same key
+        self.conflated_count: int = 0
+
+        super().__init__(maxsize=maxsize)
+
+    def get_key(self, item: typing.Any) -> typing.Hashable:
+        """
+        :param item: the data to get the key from
+        :return: the key of item
+        """
+        return self.key(item) if callable(self.key) else item[self.key]
+
+    async def put(self, item: typing.Any) -> None:
+        """
+        Replaces the pending data of the item key if any, otherwise puts item in the queue
+        :param item: the data to put
+        """
+        if not self._conflate(item):
+            await super().put(item)
+
+    def put_nowait(self, item: typing.Any) -> None:
+        """
+        Replaces the pending data of the item key if any, otherwise puts item in the queue
+        :param item: the data to put
+        """
+        if not self._conflate(item):
+            super().put_nowait(item)
+
+    def _conflate(self, item: typing.Any) -> bool:
+        """
+        Replaces the pending data of the item key if any
+        :return: True if item replaced a pending data
+        """
+        key = self.get_key(item)
+        if key in self._queue:
+            self._queue[key] = item
+            self.conflated_count += 1
+            return True
+        return False
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: collections.OrderedDict = collections.OrderedDict()
+
+    def _put(self, item: typing.Any) -> None:
+        self._queue[self.get_key(item)] = item
+
+    def _get(self) -> typing.Any:
+        return self._queue.popitem(last=False)[1]
@@ -0,0 +1,95 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the queue-less DirectQueue
+"""
+import asyncio
+import typing
+
+
+class DirectQueue:
+    """
+    A DirectQueue is an always empty queue replacement that hands put data directly to its dispatch functions:
+    data is processed inline by the putting producer instead of being queued.
+    """
+
+    def __init__(
+        self,
+        dispatch: typing.Callable[[typing.Any], typing.Awaitable],
+        dispatch_nowait: typing.Callable[[typing.Any], None],
+    ):
+        # Coroutine function processing put data
+        self.dispatch: typing.Callable[[typing.Any], typing.Awaitable] = dispatch
+
+        # Function processing put_nowait data
+        self.dispatch_nowait: typing.Callable[[typing.Any], None] = dispatch_nowait
+
+        # asyncio.Queue compatibility: unlimited
+        self.maxsize: int = 0
+
+    async def put(self, item: typing.Any) -> None:
+        """
+        Processes item before returning
+        :param item: the data to process
+        """
+        await self.dispatch(item)
+
+    def put_nowait(self, item: typing.Any) -> None:
+        """
+        Processes item before returning, without waiting
+        :param item: the data to process
+        """
+        self.dispatch_nowait(item)
+
+    def qsize(self) -> int:
+        """
+        :return: 0, data is never queued
+        """
+        return 0
+
+    def empty(self) -> bool:
+        """
+        :return: True, data is never queued
+        """
+        return True
+
+    def full(self) -> bool:
+        """
+        :return: False, data is never queued
+        """
+        return False
+
+    def get_nowait(self) -> typing.Any:
+        """
+        :raise asyncio.QueueEmpty: data is never queued
+        """
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> typing.Any:
+        """
+        Never returns: data is never queued
+        """
+        await asyncio.get_running_loop().create_future()
+
+    def task_done(self) -> None:
+        """
+        Nothing to do: put data is already processed
+        """
+
+    async def join(self) -> None:
+        """
+        Returns immediately: put data is already processed
+        """
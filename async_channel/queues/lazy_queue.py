@@ -0,0 +1,107 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the LazyQueue placeholder of not yet needed queues
+"""
+import asyncio
+import typing
+
+
+class LazyQueue:
+    """
+    A LazyQueue is an empty queue placeholder that creates the real asyncio.Queue when data is first put:
+    the queue is then given to its owner that should replace the LazyQueue with it.
+        >>> owner.on_queue_created(queue)
+    Idle subscriptions don't pay for an asyncio.Queue.
+    """
+
+    __slots__ = ("maxsize", "owner", "_queue")
+
+    def __init__(self, maxsize: int, owner: typing.Any):
+        # Maximum size of the created queue
+        self.maxsize: int = maxsize
+
+        # Notified with the created queue
+        self.owner: typing.Any = owner
+
+        # The created queue, kept to forward calls made through stale references to this placeholder
+        self._queue: typing.Optional[asyncio.Queue] = None
+
+    def create_queue(self) -> asyncio.Queue:
+        """
+        Creates the real queue and gives it to the owner, only once
+        :return: the created queue
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self.owner.on_queue_created(self._queue)
+        return self._queue
+
+    async def put(self, item: typing.Any) -> None:
+        """
+        Puts item into the created queue
+        :param item: the data to queue
+        """
+        await self.create_queue().put(item)
+
+    def put_nowait(self, item: typing.Any) -> None:
+        """
+        Puts item into the created queue without waiting
+        :param item: the data to queue
+        """
+        self.create_queue().put_nowait(item)
+
+    async def get(self) -> typing.Any:
+        """
+        Waits for data from the created queue
+        :return: the first put data
+        """
+        return await self.create_queue().get()
+
+    def qsize(self) -> int:
+        """
+        :return: 0, no data has been put yet
+        """
+        return 0
+
+    def empty(self) -> bool:
+        """
+        :return: True, no data has been put yet
+        """
+        return True
+
+    def full(self) -> bool:
+        """
+        :return: False, no data has been put yet
+        """
+        return False
+
+    def get_nowait(self) -> typing.Any:
+        """
+        :raise asyncio.QueueEmpty: no data has been put yet
+        """
+        raise asyncio.QueueEmpty
+
+    def task_done(self) -> None:
+        """
+        :raise ValueError: like asyncio.Queue, no data has been got yet
+        """
+        raise ValueError("task_done() called too many times")
+
+    async def join(self) -> None:
+        """
+        Returns immediately: no data has been put yet
+        """
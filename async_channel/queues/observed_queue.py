@@ -0,0 +1,121 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define queue observation, used to be notified when data is put in or got from queues without polling them
+"""
+import asyncio
+import typing
+
+# Instance attribute containing the queue observers by observed method name
+OBSERVERS_ATTRIBUTE = "queue_observers"
+
+PUT_METHOD = "_put"
+GET_METHOD = "_get"
+
+
+def observe_put(queue: typing.Any, observer: typing.Callable[[], None]) -> bool:
+    """
+    Starts calling observer each time data is put in queue
+    :param queue: the queue to observe
+    :param observer: the function to call, without argument
+    :return: False if queue can't be observed because it is not an asyncio.Queue
+    """
+    return _observe(queue, PUT_METHOD, observer)
+
+
+def unobserve_put(queue: typing.Any, observer: typing.Callable[[], None]) -> None:
+    """
+    Stops calling observer when data is put in queue
+    :param queue: the observed queue
+    :param observer: the observer to remove
+    """
+    _unobserve(queue, PUT_METHOD, observer)
+
+
+def observe_get(queue: typing.Any, observer: typing.Callable[[], None]) -> bool:
+    """
+    Starts calling observer each time data is got from queue
+    :param queue: the queue to observe
+    :param observer: the function to call, without argument
+    :return: False if queue can't be observed because it is not an asyncio.Queue
+    """
+    return _observe(queue, GET_METHOD, observer)
+
+
+def unobserve_get(queue: typing.Any, observer: typing.Callable[[], None]) -> None:
+    """
+    Stops calling observer when data is got from queue
+    :param queue: the observed queue
+    :param observer: the observer to remove
+    """
+    _unobserve(queue, GET_METHOD, observer)
+
+
+def is_observed(queue: typing.Any) -> bool:
+    """
+    :return: True if queue is observed
+    """
+    return bool(getattr(queue, "__dict__", {}).get(OBSERVERS_ATTRIBUTE))
+
+
+def _observe(
+    queue: typing.Any, method_name: str, observer: typing.Callable[[], None]
+) -> bool:
+    """
+    Calls observer after each queue method_name call
+    The queue class is left untouched: an instance attribute shadows the observed method
+    and calls the current class method to keep working when the queue class is swapped
+    :return: False if queue can't be observed because it is not an asyncio.Queue
+    """
+    if not isinstance(queue, asyncio.Queue):
+        return False
+    # observers are replaced instead of being updated: they can be added or removed while being called
+    observers_by_method = vars(queue).setdefault(OBSERVERS_ATTRIBUTE, {})
+    if method_name not in observers_by_method:
+
+        def _observed_method(*args) -> typing.Any:
+            result = getattr(queue.__class__, method_name)(queue, *args)
+            for queue_observer in observers_by_method[method_name]:
+                queue_observer()
+            return result
+
+        setattr(queue, method_name, _observed_method)
+    observers_by_method[method_name] = observers_by_method.get(method_name, ()) + (
+        observer,
+    )
+    return True
+
+
+def _unobserve(
+    queue: typing.Any, method_name: str, observer: typing.Callable[[], None]
+) -> None:
+    """
+    Stops calling observer after each queue method_name call
+    """
+    observers_by_method = getattr(queue, "__dict__", {}).get(OBSERVERS_ATTRIBUTE, {})
+    observers = observers_by_method.get(method_name, ())
+    if observer not in observers:
+        return
+    remaining_observers = tuple(
+        queue_observer for queue_observer in observers if queue_observer is not observer
+    )
+    if remaining_observers:
+        observers_by_method[method_name] = remaining_observers
+        return
+    del observers_by_method[method_name]
+    delattr(queue, method_name)
+    if not observers_by_method:
+        delattr(queue, OBSERVERS_ATTRIBUTE)
@@ -0,0 +1,78 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the bounded OverflowQueue
+"""
+import asyncio
+import typing
+
+import async_channel.enums
+
+
+class OverflowQueue(asyncio.Queue):
+    """
+    An OverflowQueue is an asyncio.Queue applying overflow_policy when data is put while it is full.
+    Except with the BLOCK policy, putting data never waits: it is either queued or dropped.
+    Dropped data are counted in dropped_count.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow_policy: async_channel.enums.QueueOverflowPolicies = (
+            async_channel.enums.QueueOverflowPolicies.DROP_OLDEST
+        ),
+    ):
+        super().__init__(maxsize=maxsize)
+        self.overflow_policy: async_channel.enums.QueueOverflowPolicies = (
+            overflow_policy
+        )
+
+        # Count of data dropped because the queue was full
+        self.dropped_count: int = 0
+
+    async def put(self, item: typing.Any) -> None:
+        """
+        Put item in the queue, only waits for a free slot with the BLOCK policy
+        :param item: the data to put
+        """
+        if self.overflow_policy is async_channel.enums.QueueOverflowPolicies.BLOCK:
+            await super().put(item)
+        else:
+            self.put_nowait(item)
+
+    def put_nowait(self, item: typing.Any) -> None:
+        """
+        Put item in the queue, applies the overflow policy when the queue is full
+        :param item: the data to put
+        """
+        if (
+            self.full()
+            and self.overflow_policy
+            is not async_channel.enums.QueueOverflowPolicies.BLOCK
+        ):
+            self.dropped_count += 1
+            if (
+                self.overflow_policy
+                is async_channel.enums.QueueOverflowPolicies.DROP_NEWEST
+            ):
+                return
+            if self.overflow_policy is async_channel.enums.QueueOverflowPolicies.RAISE:
+                raise asyncio.QueueFull
+            # DROP_OLDEST: the dropped data is considered as processed
+            self.get_nowait()
+            self.task_done()
+        super().put_nowait(item)
@@ -0,0 +1,265 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the broadcast RingBuffer and its per consumer RingBufferReader
+"""
+import asyncio
+import collections
+import typing
+
+import async_channel.constants
+import async_channel.enums
+
+
+class RingBuffer:  # pylint: disable=too-many-instance-attributes
+    """
+    A RingBuffer is a bounded buffer written once per data and read by each of its readers through their own cursor.
+    Cursors are absolute data sequence numbers: the data at sequence S is stored at S % capacity.
+    A reader is too slow when the next write would overwrite the oldest data it didn't read yet,
+    slow readers are then handled according to slow_reader_policy.
+    """
+
+    def __init__(
+        self,
+        capacity: int = async_channel.constants.DEFAULT_RING_BUFFER_SIZE,
+        slow_reader_policy: async_channel.enums.SlowConsumerPolicies = async_channel.enums.SlowConsumerPolicies.BLOCK,
+    ):
+        if capacity <= 0:
+            raise ValueError(f"Invalid ring buffer capacity: {capacity}")
+        self.capacity: int = capacity
+        self.slow_reader_policy: async_channel.enums.SlowConsumerPolicies = (
+            slow_reader_policy
+        )
+
+        # Sequence number of the next written data
+        self.head: int = 0
+
+        # Registered readers, used as an ordered set
+        self.readers: dict["RingBufferReader", None] = {}
+
+        self._buffer: list = [None] * capacity
+
+        # Lower bound of the slowest reader cursor, updated when the buffer looks full
+        self._min_cursor: int = 0
+
+        # Futures of readers waiting for new data
+        self._data_waiters: collections.deque = collections.deque()
+
+        # Futures of writers waiting for slow readers (BLOCK policy)
+        self._space_waiters: collections.deque = collections.deque()
+
+    def create_reader(self) -> "RingBufferReader":
+        """
+        Creates and registers a new reader starting at the buffer head
+        :return: the created reader
+        """
+        reader = RingBufferReader(self, self.head)
+        self.readers[reader] = None
+        return reader
+
+    def remove_reader(self, reader: "RingBufferReader") -> None:
+        """
+        Unregisters a reader, its pending data can then be overwritten
+        :param reader: the reader to remove
+        """
+        if reader in self.readers:
+            del self.readers[reader]
+            self._wake_up(self._space_waiters)
+
+    async def put(self, data: typing.Any) -> list["RingBufferReader"]:
+        """
+        Writes data once for every reader
+        :param data: the data to write
+        :return: the readers disconnected by the DISCONNECT policy to make room for data
+        """
+        disconnected_readers = []
+        while self.head - self.capacity >= self._min_cursor:
+            self._min_cursor = min(
+                (reader.cursor for reader in self.readers), default=self.head
+            )
+            if self.head - self.capacity < self._min_cursor:
+                break
+            if (
+                self.slow_reader_policy
+                is async_channel.enums.SlowConsumerPolicies.BLOCK
+            ):
+                await self._wait_for_space()
+                continue
+            for reader in self.get_slow_readers():
+                if (
+                    self.slow_reader_policy
+                    is async_channel.enums.SlowConsumerPolicies.DISCONNECT
+                ):
+                    self.remove_reader(reader)
+                    reader.disconnect()
+                    disconnected_readers.append(reader)
+                else:
+                    reader.skip_to(self.head)
+        self._buffer[self.head % self.capacity] = data
+        self.head += 1
+        if self._data_waiters:
+            self._wake_up(self._data_waiters)
+        return disconnected_readers
+
+    def get_slow_readers(self) -> list["RingBufferReader"]:
+        """
+        :return: the readers which pending data would be overwritten by the next write
+        """
+        return [
+            reader
+            for reader in self.readers
+            if reader.cursor <= self.head - self.capacity
+        ]
+
+    async def _wait_for_data(self) -> None:
+        """
+        Waits until new data is written
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._data_waiters.append(waiter)
+        await waiter
+
+    async def _wait_for_space(self) -> None:
+        """
+        Waits until a reader progresses or is removed
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._space_waiters.append(waiter)
+        await waiter
+
+    def _on_reader_progress(self) -> None:
+        """
+        Called when a reader cursor moves forward
+        """
+        if self._space_waiters:
+            self._wake_up(self._space_waiters)
+
+    @staticmethod
+    def _wake_up(waiters: collections.deque) -> None:
+        """
+        Resolves and clears every waiter
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class RingBufferReader:
+    """
+    A RingBufferReader reads its RingBuffer data from its own cursor.
+    It implements the asyncio.Queue reading interface to be used as a consumer queue.
+    """
+
+    def __init__(self, ring_buffer: RingBuffer, cursor: int):
+        self.ring_buffer: RingBuffer = ring_buffer
+
+        # Sequence number of the next data to read
+        self.cursor: int = cursor
+
+        # Count of data this reader skipped because it was too slow
+        self.skipped_count: int = 0
+
+        # True when this reader has been removed from its ring buffer because it was too slow
+        self.is_disconnected: bool = False
+
+        # Count of read data without a task_done() call
+        self._unfinished_tasks: int = 0
+        self._join_waiters: collections.deque = collections.deque()
+
+    def qsize(self) -> int:
+        """
+        :return: the count of data this reader didn't read yet
+        """
+        return self.ring_buffer.head - self.cursor
+
+    def empty(self) -> bool:
+        """
+        :return: True if this reader has read every written data or is disconnected
+        """
+        return self.is_disconnected or self.cursor >= self.ring_buffer.head
+
+    def full(self) -> bool:
+        """
+        :return: True if the next write would overwrite data this reader didn't read yet
+        """
+        return self.qsize() >= self.ring_buffer.capacity
+
+    def get_nowait(self) -> typing.Any:
+        """
+        :return: the next data to read, raises asyncio.QueueEmpty if there is none
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        data = self.ring_buffer._buffer[  # pylint: disable=protected-access
+            self.cursor % self.ring_buffer.capacity
+        ]
+        self.cursor += 1
+        self._unfinished_tasks += 1
+        self.ring_buffer._on_reader_progress()  # pylint: disable=protected-access
+        return data
+
+    async def get(self) -> typing.Any:
+        """
+        :return: the next data to read, waits for it if necessary
+        """
+        while self.empty():
+            await self.ring_buffer._wait_for_data()  # pylint: disable=protected-access
+        return self.get_nowait()
+
+    def skip_to(self, cursor: int) -> None:
+        """
+        Moves this reader cursor forward, skipping the data before cursor
+        :param cursor: the new cursor
+        """
+        if cursor <= self.cursor:
+            return
+        self.skipped_count += cursor - self.cursor
+        self.cursor = cursor
+        self.ring_buffer._on_reader_progress()  # pylint: disable=protected-access
+        self._wake_up_joins_if_done()
+
+    def disconnect(self) -> None:
+        """
+        Marks this reader as disconnected: it won't receive any new data
+        """
+        self.is_disconnected = True
+        self._wake_up_joins_if_done()
+
+    def task_done(self) -> None:
+        """
+        Indicates that a formerly read data is processed
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        self._wake_up_joins_if_done()
+
+    async def join(self) -> None:
+        """
+        Waits until every written data has been read and processed
+        """
+        while not self._is_done():
+            waiter = asyncio.get_running_loop().create_future()
+            self._join_waiters.append(waiter)
+            await waiter
+
+    def _is_done(self) -> bool:
+        return self._unfinished_tasks == 0 and self.empty()
+
+    def _wake_up_joins_if_done(self) -> None:
+        if self._join_waiters and self._is_done():
+            RingBuffer._wake_up(self._join_waiters)  # pylint: disable=protected-access
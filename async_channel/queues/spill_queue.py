@@ -0,0 +1,187 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the SpillQueue spilling its older data to disk
+"""
+import asyncio
+import collections
+import itertools
+import pickle
+import struct
+import tempfile
+import typing
+
+import async_channel.constants
+import async_channel.util.logging_util as logging
+
+# Spilled record header: the pickled data length
+SPILL_RECORD_HEADER = struct.Struct("<I")
+
+
+class SpillQueue(asyncio.Queue):  # pylint: disable=too-many-instance-attributes
+    """
+    A SpillQueue is an unbounded asyncio.Queue keeping at most memory_size data in memory.
+    When its in memory window is full, its older data are spilled by batches to a temporary file
+    as length prefixed pickled records, then read back by batches, in order, when the consumer catches up.
+    Data are never dropped and putting data never waits, queued data should be picklable:
+    spilled data are read back as copies. When an older data can't be pickled, it is logged and kept in memory
+    with the data queued after it: spilling resumes once it has been got.
+    The spill file is emptied each time every spilled data has been read back.
+    """
+
+    def __init__(
+        self,
+        memory_size: int = async_channel.constants.DEFAULT_SPILL_QUEUE_MEMORY_SIZE,
+        batch_size: int = async_channel.constants.DEFAULT_SPILL_BATCH_SIZE,
+        directory: typing.Optional[str] = None,
+    ):
+        if memory_size < 1:
+            raise ValueError(f"Invalid spill queue memory size: {memory_size}")
+        self.logger = logging.get_logger(self.__class__.__name__)
+
+        # Maximum count of in memory data, read back data excluded
+        self.memory_size: int = memory_size
+
+        # Count of data spilled or read back at once
+        self.batch_size: int = max(1, min(batch_size, memory_size))
+
+        # Directory of the spill file, the default temporary directory when None
+        self.directory: typing.Optional[str] = directory
+
+        # Counters
+        self.spilled_count: int = 0
+        self.spilled_bytes: int = 0
+        self.read_back_count: int = 0
+        self.read_back_bytes: int = 0
+        self.unspillable_count: int = 0
+
+        self._spill_file: typing.Optional[typing.BinaryIO] = None
+        self._write_position: int = 0
+        self._read_position: int = 0
+        self._pending_spilled_count: int = 0
+        self._read_back: collections.deque = collections.deque()
+
+        # Count of the older in memory data that can't be spilled, spilling is paused until they are got
+        self._pinned_count: int = 0
+
+        super().__init__()
+
+    def get_pending_spilled_count(self) -> int:
+        """
+        :return: the count of spilled data that are not read back yet
+        """
+        return self._pending_spilled_count
+
+    def qsize(self) -> int:
+        """
+        :return: the count of queued data, spilled data included
+        """
+        return len(self._read_back) + self._pending_spilled_count + len(self._queue)
+
+    def empty(self) -> bool:
+        """
+        :return: True if no data is queued, spilled data included
+        """
+        return not (self._read_back or self._pending_spilled_count or self._queue)
+
+    def close(self) -> None:
+        """
+        Closes the spill file, pending spilled data are dropped
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._write_position = self._read_position = self._pending_spilled_count = 0
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: collections.deque = collections.deque()
+
+    def _put(self, item: typing.Any) -> None:
+        if not self._pinned_count and len(self._queue) >= self.memory_size:
+            self._spill()
+        self._queue.append(item)
+
+    def _get(self) -> typing.Any:
+        if not self._read_back and self._pending_spilled_count:
+            self._load()
+        if self._read_back:
+            return self._read_back.popleft()
+        if self._pinned_count:
+            self._pinned_count -= 1
+        return self._queue.popleft()
+
+    def _spill(self) -> None:
+        """
+        Writes the batch_size older in memory data at the end of the spill file
+        Data are removed from memory once encoded, the batch stops before the first data that can't be pickled:
+        this data is pinned in memory
+        """
+        records = []
+        spilled_count = 0
+        for item in itertools.islice(self._queue, self.batch_size):
+            try:
+                payload = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as pickle_exception:  # pylint: disable=broad-except
+                self._pinned_count = 1
+                self.unspillable_count += 1
+                self.logger.error(
+                    f"Can't spill {item!r}, it is kept in memory: {pickle_exception}"
+                )
+                break
+            records.append(SPILL_RECORD_HEADER.pack(len(payload)))
+            records.append(payload)
+            spilled_count += 1
+        if not spilled_count:
+            return
+        content = b"".join(records)
+        if self._spill_file is None:
+            self._spill_file = (
+                tempfile.TemporaryFile(  # pylint: disable=consider-using-with
+                    prefix="async_channel_spill_", dir=self.directory
+                )
+            )
+        self._spill_file.seek(self._write_position)
+        self._spill_file.write(content)
+        self._write_position += len(content)
+        for _ in range(spilled_count):
+            self._queue.popleft()
+        self._pending_spilled_count += spilled_count
+        self.spilled_count += spilled_count
+        self.spilled_bytes += len(content)
+
+    def _load(self) -> None:
+        """
+        Reads back the next batch_size spilled data, empties the spill file when every spilled data is read back
+        """
+        self._spill_file.seek(self._read_position)  # type: ignore
+        read_position = self._read_position
+        for _ in range(min(self.batch_size, self._pending_spilled_count)):
+            (payload_size,) = SPILL_RECORD_HEADER.unpack(
+                self._spill_file.read(SPILL_RECORD_HEADER.size)  # type: ignore
+            )
+            self._read_back.append(
+                pickle.loads(self._spill_file.read(payload_size))  # type: ignore
+            )
+            read_position += SPILL_RECORD_HEADER.size + payload_size
+        loaded_count = len(self._read_back)
+        self._pending_spilled_count -= loaded_count
+        self.read_back_count += loaded_count
+        self.read_back_bytes += read_position - self._read_position
+        if self._pending_spilled_count:
+            self._read_position = read_position
+        else:
+            self._spill_file.truncate(0)  # type: ignore
+            self._write_position = self._read_position = 0
@@ -17,19 +17,55 @@
 Define Channel helping methods
 """
 from async_channel.util import channel_creator
+from async_channel.util import journal
 from async_channel.util import logging_util
+from async_channel.util import metrics
+from async_channel.util import threadsafe_sender
 
 from async_channel.util.channel_creator import (
     create_all_subclasses_channel,
+    create_all_subclasses_channel_concurrently,
+    create_all_subclasses_lazy_channel,
+    get_subclasses,
     create_channel_instance,
+    create_lazy_channel_instance,
+)
+
+from async_channel.util.journal import (
+    JournalRecord,
+    JournalWriter,
+    JournalReader,
+    JournalRecorder,
 )
 
 from async_channel.util.logging_util import (
     get_logger,
 )
 
+from async_channel.util.metrics import (
+    ChannelMetrics,
+    ConsumerMetrics,
+    Histogram,
+)
+
+from async_channel.util.threadsafe_sender import (
+    ThreadSafeSender,
+)
+
 __all__ = [
     "create_all_subclasses_channel",
+    "create_all_subclasses_channel_concurrently",
+    "create_all_subclasses_lazy_channel",
+    "get_subclasses",
     "create_channel_instance",
+    "create_lazy_channel_instance",
+    "JournalRecord",
+    "JournalWriter",
+    "JournalReader",
+    "JournalRecorder",
     "get_logger",
+    "ChannelMetrics",
+    "ConsumerMetrics",
+    "Histogram",
+    "ThreadSafeSender",
 ]
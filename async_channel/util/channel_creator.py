@@ -16,17 +16,21 @@
 """
 Define Channel creation helping methods
 """
+import asyncio
 import typing
 
+import async_channel.constants
+
 if typing.TYPE_CHECKING:
     import async_channel.channels.channel
+    import async_channel.channels.channel_instances
 
 
 async def create_all_subclasses_channel(
     channel_class: typing.Type["async_channel.channels.channel.Channel"],
     set_chan_method: typing.Callable,
     is_synchronized: bool = False,
-    **kwargs: dict
+    **kwargs: dict,
 ) -> None:
     """
     Calls 'channel_creator.create_channel_instance' for each subclasses of the 'channel_class' param
@@ -40,8 +44,103 @@ async def create_all_subclasses_channel(
             to_be_created_channel_class,
             set_chan_method,
             is_synchronized=is_synchronized,
-            **kwargs
+            **kwargs,
+        )
+
+
+async def create_all_subclasses_channel_concurrently(
+    channel_class: typing.Type["async_channel.channels.channel.Channel"],
+    set_chan_method: typing.Callable,
+    is_synchronized: bool = False,
+    recursive: bool = False,
+    max_concurrency: int = async_channel.constants.DEFAULT_CHANNEL_CREATION_CONCURRENCY,
+    **kwargs: dict,
+) -> list["async_channel.channels.channel.Channel"]:
+    """
+    Calls 'channel_creator.create_channel_instance' for each subclasses of the 'channel_class' param,
+    up to max_concurrency channels are created and started at the same time
+    :param channel_class: The class in which to search for subclasses
+    :param set_chan_method: The method reference used in 'channel_creator.create_channel_instance'
+    :param is_synchronized: the channel is_synchronized attribute
+    :param recursive: when True, subclasses of subclasses are also created
+    :param max_concurrency: the maximum count of channels created at the same time
+    :param kwargs: Some additional params passed to 'channel_creator.create_channel_instance'
+    :return: the created channels, in subclasses order
+    """
+    creation_slots = asyncio.Semaphore(max_concurrency)
+
+    async def create(
+        to_be_created_channel_class: typing.Type[
+            "async_channel.channels.channel.Channel"
+        ],
+    ) -> "async_channel.channels.channel.Channel":
+        async with creation_slots:
+            return await create_channel_instance(
+                to_be_created_channel_class,
+                set_chan_method,
+                is_synchronized=is_synchronized,
+                **kwargs,
+            )
+
+    return list(
+        await asyncio.gather(
+            *(
+                create(to_be_created_channel_class)
+                for to_be_created_channel_class in get_subclasses(
+                    channel_class, recursive
+                )
+            )
+        )
+    )
+
+
+def create_all_subclasses_lazy_channel(
+    channel_class: typing.Type["async_channel.channels.channel.Channel"],
+    set_chan_method: typing.Callable,
+    is_synchronized: bool = False,
+    recursive: bool = False,
+    **kwargs: dict,
+) -> list["async_channel.channels.channel_instances.LazyChannel"]:
+    """
+    Calls 'channel_creator.create_lazy_channel_instance' for each subclasses of the 'channel_class' param
+    :param channel_class: The class in which to search for subclasses
+    :param set_chan_method: The method reference used in 'channel_creator.create_lazy_channel_instance'
+    :param is_synchronized: the channel is_synchronized attribute
+    :param recursive: when True, subclasses of subclasses are also registered
+    :param kwargs: Some additional params passed to 'channel_creator.create_lazy_channel_instance'
+    :return: the registered lazy channels, in subclasses order
+    :raise ValueError: when a subclass overrides Channel.start, see 'channel_creator.create_lazy_channel_instance'
+    """
+    return [
+        create_lazy_channel_instance(
+            to_be_created_channel_class,
+            set_chan_method,
+            is_synchronized=is_synchronized,
+            **kwargs,
         )
+        for to_be_created_channel_class in get_subclasses(channel_class, recursive)
+    ]
+
+
+def get_subclasses(
+    channel_class: typing.Type["async_channel.channels.channel.Channel"],
+    recursive: bool = False,
+) -> list[typing.Type["async_channel.channels.channel.Channel"]]:
+    """
+    :param channel_class: The class in which to search for subclasses
+    :param recursive: when True, subclasses of subclasses are also returned
+    :return: channel_class subclasses, each subclass is followed by its own subclasses when recursive
+    """
+    if not recursive:
+        return channel_class.__subclasses__()
+    subclasses: dict[typing.Type["async_channel.channels.channel.Channel"], None] = {}
+    to_visit = list(reversed(channel_class.__subclasses__()))
+    while to_visit:
+        subclass = to_visit.pop()
+        if subclass not in subclasses:
+            subclasses[subclass] = None
+            to_visit.extend(reversed(subclass.__subclasses__()))
+    return list(subclasses)
 
 
 async def create_channel_instance(
@@ -49,7 +148,7 @@ async def create_channel_instance(
     set_chan_method: typing.Callable,
     is_synchronized: bool = False,
     channel_name: typing.Optional[str] = None,
-    **kwargs: dict
+    **kwargs: dict,
 ) -> "async_channel.channels.channel.Channel":
     """
     Creates, initialize and start a async_channel instance
@@ -65,3 +164,47 @@ async def create_channel_instance(
     created_channel.is_synchronized = is_synchronized
     await created_channel.start()
     return created_channel
+
+
+def create_lazy_channel_instance(
+    channel_class: typing.Type["async_channel.channels.channel.Channel"],
+    set_chan_method: typing.Callable,
+    is_synchronized: bool = False,
+    channel_name: typing.Optional[str] = None,
+    chan_id: typing.Optional[str] = None,
+    **kwargs: dict,
+) -> "async_channel.channels.channel_instances.LazyChannel":
+    """
+    Registers a LazyChannel: the channel is only instantiated when it is first used
+    :param channel_class: The class to instantiate with optional kwargs params
+    :param set_chan_method: The method to call to add the lazy channel to a Channel list
+    :param is_synchronized: the channel is_synchronized attribute
+    :param channel_name: name of the channel to create. Defaults to channel_class.get_name()
+    :param chan_id: id of the channel to create, required by set_chan_at_id: the channel id is unknown until built
+    :param kwargs: Some additional params passed to the 'channel_class' constructor
+    :return: the registered LazyChannel
+    :raise ValueError: when 'channel_class' overrides Channel.start: the built channel would never be started,
+    or when registering at id without 'chan_id'
+    """
+    # pylint: disable=import-outside-toplevel
+    # channels can't be imported when util is: channels import producer that imports util
+    import async_channel.channels.channel as channel
+    import async_channel.channels.channel_instances as channel_instances
+
+    if channel_class.start is not channel.Channel.start:
+        raise ValueError(
+            f"{channel_class.__name__} overrides start and can't be lazily created, use create_channel_instance"
+        )
+    if set_chan_method is channel_instances.set_chan_at_id and chan_id is None:
+        raise ValueError(
+            f"chan_id is required to register {channel_class.__name__} at id"
+        )
+    created_channel = channel_instances.LazyChannel(
+        channel_class,
+        channel_name or channel_class.get_name(),
+        is_synchronized=is_synchronized,
+        chan_id=chan_id,
+        **kwargs,
+    )
+    set_chan_method(created_channel, name=created_channel.get_name())
+    return created_channel
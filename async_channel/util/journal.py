@@ -0,0 +1,315 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the memory mapped append-only journal used to record and replay channels traffic.
+A journal is a directory of segment files named by their index, each segment is preallocated and memory mapped.
+A segment starts with a header containing a magic and the written bytes count, published after each record.
+A record is a header (timestamp, payload length, channel name length) followed by the utf-8 channel name
+and the payload: the pickled data. Journals should only be read from trusted sources.
+"""
+import mmap
+import os
+import pickle
+import struct
+import time
+import typing
+
+import async_channel.constants
+import async_channel.util.logging_util as logging
+import async_channel.util.metrics as metrics
+
+if typing.TYPE_CHECKING:
+    import async_channel.producer
+
+JOURNAL_SEGMENT_EXTENSION = ".journal"
+
+# Segment header: magic, written bytes count
+SEGMENT_HEADER = struct.Struct("<4sQ")
+SEGMENT_HEADER_SIZE = 16
+SEGMENT_MAGIC = b"ACJ1"
+SEGMENT_WRITTEN_SIZE = struct.Struct("<Q")
+
+# Record header: timestamp, payload length, channel name length
+RECORD_HEADER = struct.Struct("<dIH")
+
+
+class JournalRecord(typing.NamedTuple):
+    """
+    A journal record
+    """
+
+    timestamp: float
+    channel_name: str
+    data: typing.Any
+
+
+class JournalWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    A JournalWriter appends records to the segments of a journal directory.
+    Records are copied into the memory mapped current segment: writing doesn't involve any system call
+    until the segment is full. A new segment is created after the last existing one.
+    Closed segments are truncated to their written size.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = async_channel.constants.DEFAULT_JOURNAL_SEGMENT_SIZE,
+    ):
+        self.directory: str = directory
+
+        # Preallocated bytes count of a segment, larger records get their own segment
+        self.segment_size: int = segment_size
+
+        # Count of written records
+        self.written_count: int = 0
+
+        self.segment_index: int = -1
+        self._segment_file: typing.Optional[typing.BinaryIO] = None
+        self._segment: typing.Optional[mmap.mmap] = None
+        self._position: int = 0
+        self._encoded_names: dict[str, bytes] = {}
+        os.makedirs(directory, exist_ok=True)
+        segments_indexes = get_segments_indexes(directory)
+        if segments_indexes:
+            self.segment_index = segments_indexes[-1]
+
+    def write(
+        self,
+        channel_name: str,
+        data: typing.Any,
+        timestamp: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Appends a record to the journal
+        :param channel_name: the name of the channel data was sent to
+        :param data: the recorded data
+        :param timestamp: the record timestamp, now when None
+        """
+        try:
+            encoded_name = self._encoded_names[channel_name]
+        except KeyError:
+            encoded_name = self._encoded_names[channel_name] = channel_name.encode()
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        record_size = RECORD_HEADER.size + len(encoded_name) + len(payload)
+        if self._segment is None or self._position + record_size > len(self._segment):
+            self._open_next_segment(record_size)
+        name_end = self._position + RECORD_HEADER.size + len(encoded_name)
+        record_end = self._position + record_size
+        RECORD_HEADER.pack_into(
+            self._segment,  # type: ignore
+            self._position,
+            time.time() if timestamp is None else timestamp,
+            len(payload),
+            len(encoded_name),
+        )
+        self._segment[self._position + RECORD_HEADER.size : name_end] = encoded_name  # type: ignore
+        self._segment[name_end:record_end] = payload  # type: ignore
+        self._position = record_end
+        SEGMENT_WRITTEN_SIZE.pack_into(self._segment, 4, record_end)  # type: ignore
+        self.written_count += 1
+
+    def flush(self) -> None:
+        """
+        Flushes the current segment to disk
+        """
+        if self._segment is not None:
+            self._segment.flush()
+
+    def close(self) -> None:
+        """
+        Closes the current segment, truncated to its written size
+        """
+        if self._segment is None:
+            return
+        self._segment.flush()
+        self._segment.close()
+        self._segment_file.truncate(self._position)  # type: ignore
+        self._segment_file.close()  # type: ignore
+        self._segment = None
+        self._segment_file = None
+
+    def _open_next_segment(self, record_size: int) -> None:
+        """
+        Closes the current segment and creates the next one
+        :param record_size: the bytes count of the record to write
+        """
+        self.close()
+        self.segment_index += 1
+        size = max(self.segment_size, SEGMENT_HEADER_SIZE + record_size)
+        self._segment_file = open(  # pylint: disable=consider-using-with
+            get_segment_path(self.directory, self.segment_index), "w+b"
+        )
+        self._segment_file.truncate(size)
+        self._segment = mmap.mmap(self._segment_file.fileno(), size)
+        SEGMENT_HEADER.pack_into(self._segment, 0, SEGMENT_MAGIC, SEGMENT_HEADER_SIZE)
+        self._position = SEGMENT_HEADER_SIZE
+
+
+class JournalReader:
+    """
+    A JournalReader iterates over the records of a journal directory, in order.
+    Segments are memory mapped one at a time: whole files are never loaded into memory.
+    Only the payloads of the records of the read channels are unpickled.
+    """
+
+    def __init__(self, directory: str):
+        self.directory: str = directory
+
+    def read(
+        self, channel_names: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Iterator[JournalRecord]:
+        """
+        :param channel_names: the names of the channels to read records of, every channel when None
+        :return: the journal records iterator
+        """
+        encoded_names = (
+            None
+            if channel_names is None
+            else {channel_name.encode() for channel_name in channel_names}
+        )
+        for segment_index in get_segments_indexes(self.directory):
+            yield from _read_segment(
+                get_segment_path(self.directory, segment_index), encoded_names
+            )
+
+    def __iter__(self) -> typing.Iterator[JournalRecord]:
+        return self.read()
+
+
+class JournalRecorder:
+    """
+    A JournalRecorder records the data sent by the producers of a channel into a journal.
+    Recorded producers class is swapped with a subclass extended with RecordedProducerMixin, like metered producers:
+    unrecorded producers don't pay any cost.
+    Each record data is the (args, kwargs) tuple given to send.
+    """
+
+    def __init__(self, writer: JournalWriter, channel_name: str):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.writer: JournalWriter = writer
+        self.channel_name: str = channel_name
+
+        # Count of sent data that couldn't be recorded
+        self.failed_count: int = 0
+
+        self.producers: set["async_channel.producer.Producer"] = set()
+
+    def track_producer(self, producer: "async_channel.producer.Producer") -> None:
+        """
+        Starts recording producer sent data
+        :param producer: the producer to record
+        """
+        if producer in self.producers:
+            return
+        self.producers.add(producer)
+        producer.recorder = self  # type: ignore
+        metrics.enable_mixin(producer, RecordedProducerMixin)
+
+    def untrack_producer(self, producer: "async_channel.producer.Producer") -> None:
+        """
+        Stops recording producer sent data
+        :param producer: the recorded producer
+        """
+        if producer in self.producers:
+            self.producers.remove(producer)
+            metrics.disable_mixin(producer, RecordedProducerMixin)
+            producer.__dict__.pop("recorder", None)
+
+    def record(self, args: tuple, kwargs: dict) -> None:
+        """
+        Writes send arguments in the journal, sent data that can't be recorded are logged and counted
+        :param args: send positional arguments
+        :param kwargs: send keyword arguments
+        """
+        try:
+            self.writer.write(self.channel_name, (args, kwargs))
+        except Exception as record_exception:  # pylint: disable=broad-except
+            self.failed_count += 1
+            self.logger.exception(
+                f"Error when recording {self.channel_name} data: {record_exception}"
+            )
+
+
+class RecordedProducerMixin:
+    """
+    Records the producer sent data
+    """
+
+    recorder: JournalRecorder
+
+    async def send(self, *args, **kwargs) -> None:
+        """
+        Records sent data then sends it
+        """
+        self.recorder.record(args, kwargs)
+        await super().send(*args, **kwargs)  # type: ignore
+
+
+def get_segment_path(directory: str, segment_index: int) -> str:
+    """
+    :return: the path of the segment at segment_index
+    """
+    return os.path.join(directory, f"{segment_index:08d}{JOURNAL_SEGMENT_EXTENSION}")
+
+
+def get_segments_indexes(directory: str) -> list[int]:
+    """
+    :return: the sorted indexes of the directory segments
+    """
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        int(file_name[: -len(JOURNAL_SEGMENT_EXTENSION)])
+        for file_name in os.listdir(directory)
+        if file_name.endswith(JOURNAL_SEGMENT_EXTENSION)
+        and file_name[: -len(JOURNAL_SEGMENT_EXTENSION)].isdigit()
+    )
+
+
+def _read_segment(
+    path: str, encoded_names: typing.Optional[set[bytes]]
+) -> typing.Iterator[JournalRecord]:
+    """
+    :param path: the segment path
+    :param encoded_names: the encoded names of the channels to read records of, every channel when None
+    :return: the segment records iterator
+    """
+    with open(path, "rb") as segment_file:
+        if os.fstat(segment_file.fileno()).st_size < SEGMENT_HEADER_SIZE:
+            return
+        with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as segment:
+            magic, written_size = SEGMENT_HEADER.unpack_from(segment, 0)
+            if magic != SEGMENT_MAGIC:
+                raise ValueError(f"{path} is not a journal segment")
+            names: dict[bytes, str] = {}
+            position = SEGMENT_HEADER_SIZE
+            while position < written_size:
+                timestamp, payload_size, name_size = RECORD_HEADER.unpack_from(
+                    segment, position
+                )
+                name_end = position + RECORD_HEADER.size + name_size
+                encoded_name = segment[position + RECORD_HEADER.size : name_end]
+                position = name_end + payload_size
+                if encoded_names is not None and encoded_name not in encoded_names:
+                    continue
+                try:
+                    channel_name = names[encoded_name]
+                except KeyError:
+                    channel_name = names[encoded_name] = encoded_name.decode()
+                yield JournalRecord(
+                    timestamp, channel_name, pickle.loads(segment[name_end:position])
+                )
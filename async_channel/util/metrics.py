@@ -0,0 +1,383 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define channels metrics: counters and histograms recorded by metered producers, consumers and queues.
+Metering is enabled by swapping the class of the metered objects with a metered subclass,
+unmetered objects don't pay any metrics related cost.
+Swapped classes can stack several mixins: a producer can be both metered and recorded (see journal).
+"""
+import asyncio
+import collections
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    import async_channel.consumer
+    import async_channel.producer
+
+# Count of histogram buckets, the last bucket contains durations longer than 2^(HISTOGRAM_BUCKETS - 2) µs
+HISTOGRAM_BUCKETS = 32
+
+# Metered classes by (original class, metered mixins)
+_METERED_CLASSES: dict[tuple[type, tuple[type, ...]], type] = {}
+
+
+class Histogram:
+    """
+    Low overhead durations histogram.
+    Durations are counted in power of 2 microseconds buckets: percentiles are estimated by their bucket upper bound.
+    """
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0
+        self.max: float = 0
+        self.buckets: list[int] = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, duration: float) -> None:
+        """
+        Records a duration
+        :param duration: the duration in seconds
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.buckets[min(int(duration * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        :param percent: the percentile to estimate, between 0 and 100
+        :return: the estimated percentile in seconds, bounded by the recorded max
+        """
+        if not self.count:
+            return 0
+        threshold = self.count * percent / 100
+        cumulated_count = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulated_count += bucket_count
+            if cumulated_count >= threshold:
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """
+        :return: the histogram summary, durations are in seconds
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+class ConsumerMetrics:
+    """
+    Metrics of a consumer and of its queue
+    """
+
+    def __init__(self):
+        self.consumed_count: int = 0
+        self.exceptions_count: int = 0
+        self.peak_queue_depth: int = 0
+
+        # Time spent by data in queue between being sent and being performed
+        self.dwell_time: Histogram = Histogram()
+
+        # Consumer callback execution time
+        self.callback_time: Histogram = Histogram()
+
+    def snapshot(self, consumer: "async_channel.consumer.Consumer") -> dict:
+        """
+        :param consumer: the metered consumer
+        :return: the consumer metrics summary
+        """
+        queue_depth = consumer.queue.qsize()
+        return {
+            "consumer": str(consumer),
+            "priority_level": consumer.priority_level,
+            "consumed_count": self.consumed_count,
+            "exceptions_count": self.exceptions_count,
+            "queue_depth": queue_depth,
+            "peak_queue_depth": max(self.peak_queue_depth, queue_depth),
+            "dwell_time": self.dwell_time.snapshot(),
+            "callback_time": self.callback_time.snapshot(),
+        }
+
+
+class ChannelMetrics:
+    """
+    Metrics of a channel: its producers sent data count and its consumers metrics
+    """
+
+    def __init__(self):
+        self.sent_count: int = 0
+
+        # Metered consumers metrics
+        self.consumers: dict["async_channel.consumer.Consumer", ConsumerMetrics] = {}
+
+        # Counters of consumers that are no longer metered
+        self.removed_consumers_consumed_count: int = 0
+        self.removed_consumers_exceptions_count: int = 0
+
+    def track_producer(self, producer: "async_channel.producer.Producer") -> None:
+        """
+        Starts metering producer
+        :param producer: the producer to meter
+        """
+        _enable(producer, MeteredProducerMixin, self)
+
+    def untrack_producer(self, producer: "async_channel.producer.Producer") -> None:
+        """
+        Stops metering producer
+        :param producer: the metered producer
+        """
+        _disable(producer, MeteredProducerMixin)
+
+    def track_consumer(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Starts metering consumer and its queue when it is an asyncio.Queue
+        Consumers without instance dict (like CompactConsumer) can't be metered and are ignored
+        :param consumer: the consumer to meter
+        """
+        if consumer in self.consumers or not hasattr(consumer, "__dict__"):
+            return
+        consumer_metrics = ConsumerMetrics()
+        self.consumers[consumer] = consumer_metrics
+        _enable(consumer, _get_consumer_mixin(consumer), consumer_metrics)
+        if isinstance(consumer.queue, asyncio.Queue):
+            # data already queued are considered as queued now
+            consumer.queue.metrics_put_times = collections.deque(  # type: ignore
+                [time.perf_counter()] * consumer.queue.qsize()
+            )
+            _enable(consumer.queue, MeteredQueueMixin, consumer_metrics)
+
+    def untrack_consumer(self, consumer: "async_channel.consumer.Consumer") -> None:
+        """
+        Stops metering consumer and its queue
+        :param consumer: the metered consumer
+        """
+        consumer_metrics = self.consumers.pop(consumer, None)
+        if consumer_metrics is None:
+            return
+        self.removed_consumers_consumed_count += consumer_metrics.consumed_count
+        self.removed_consumers_exceptions_count += consumer_metrics.exceptions_count
+        _disable(consumer, _get_consumer_mixin(consumer))
+        _disable(consumer.queue, MeteredQueueMixin)
+
+    def snapshot(self) -> dict:
+        """
+        :return: the channel metrics summary
+        """
+        consumers_snapshots = [
+            consumer_metrics.snapshot(consumer)
+            for consumer, consumer_metrics in self.consumers.items()
+        ]
+        return {
+            "sent_count": self.sent_count,
+            "consumed_count": self.removed_consumers_consumed_count
+            + sum(snapshot["consumed_count"] for snapshot in consumers_snapshots),
+            "exceptions_count": self.removed_consumers_exceptions_count
+            + sum(snapshot["exceptions_count"] for snapshot in consumers_snapshots),
+            "queue_depth": sum(
+                snapshot["queue_depth"] for snapshot in consumers_snapshots
+            ),
+            "consumers": consumers_snapshots,
+        }
+
+
+class MeteredProducerMixin:
+    """
+    Counts the producer sent data
+    """
+
+    metrics: ChannelMetrics
+
+    async def send(self, *args, **kwargs) -> None:
+        """
+        Counts sent data then sends it
+        """
+        self.metrics.sent_count += 1
+        await super().send(*args, **kwargs)  # type: ignore
+
+
+class MeteredConsumerMixin:
+    """
+    Counts the consumer performed data, raised exceptions and measures its callback execution time
+    """
+
+    metrics: ConsumerMetrics
+
+    async def perform(self, *args, **kwargs) -> None:
+        """
+        Performs data and records its metrics
+        """
+        start_time = time.perf_counter()
+        try:
+            await super().perform(*args, **kwargs)  # type: ignore
+        except Exception:
+            self.metrics.exceptions_count += 1
+            raise
+        finally:
+            self.metrics.callback_time.record(time.perf_counter() - start_time)
+            self.metrics.consumed_count += 1
+
+
+class MeteredBatchConsumerMixin:
+    """
+    Counts the batch consumer performed data, raised exceptions and measures its callback execution time
+    """
+
+    metrics: ConsumerMetrics
+
+    async def perform_batch(self, batch: list) -> None:
+        """
+        Performs the data batch and records its metrics
+        """
+        start_time = time.perf_counter()
+        try:
+            await super().perform_batch(batch)  # type: ignore
+        except Exception:
+            self.metrics.exceptions_count += 1
+            raise
+        finally:
+            self.metrics.callback_time.record(time.perf_counter() - start_time)
+            self.metrics.consumed_count += len(batch)
+
+
+class MeteredQueueMixin:
+    """
+    Measures the queue peak depth and the time spent by data in the queue
+    """
+
+    metrics: ConsumerMetrics
+    metrics_put_times: collections.deque
+
+    def _put(self, item: typing.Any) -> None:
+        super()._put(item)  # type: ignore
+        self.metrics_put_times.append(time.perf_counter())
+        self.metrics.peak_queue_depth = max(
+            self.metrics.peak_queue_depth, self.qsize()  # type: ignore
+        )
+
+    def _get(self) -> typing.Any:
+        item = super()._get()  # type: ignore
+        self.metrics.dwell_time.record(
+            time.perf_counter() - self.metrics_put_times.popleft()
+        )
+        return item
+
+
+def get_metered_class(original_class: type, *mixins: type) -> type:
+    """
+    :return: the cached original_class subclass extended with mixins, the last mixin being the outermost
+    """
+    try:
+        return _METERED_CLASSES[(original_class, mixins)]
+    except KeyError:
+        metered_class = type(
+            original_class.__name__,
+            (*reversed(mixins), original_class),
+            {
+                "__module__": original_class.__module__,
+                "__qualname__": original_class.__qualname__,
+                "unmetered_class": original_class,
+                "metered_mixins": mixins,
+            },
+        )
+        _METERED_CLASSES[(original_class, mixins)] = metered_class
+        return metered_class
+
+
+def get_mixins(element: typing.Any) -> tuple[type, ...]:
+    """
+    :return: the mixins element class has been extended with
+    """
+    return element.__class__.__dict__.get("metered_mixins", ())
+
+
+def is_metered(element: typing.Any) -> bool:
+    """
+    :return: True if element class has been swapped with a metered class
+    """
+    return any(mixin in _METRICS_MIXINS for mixin in get_mixins(element))
+
+
+def enable_mixin(element: typing.Any, mixin: type) -> None:
+    """
+    Swaps element class with its original class extended with its current mixins and mixin
+    """
+    mixins = get_mixins(element)
+    if mixin in mixins:
+        return
+    original_class = element.__class__.unmetered_class if mixins else element.__class__
+    element.__class__ = get_metered_class(original_class, *mixins, mixin)
+
+
+def disable_mixin(element: typing.Any, mixin: type) -> None:
+    """
+    Swaps element class with its original class extended with its current mixins but mixin
+    """
+    mixins = get_mixins(element)
+    if mixin not in mixins:
+        return
+    remaining_mixins = tuple(
+        enabled_mixin for enabled_mixin in mixins if enabled_mixin is not mixin
+    )
+    original_class = element.__class__.unmetered_class
+    element.__class__ = (
+        get_metered_class(original_class, *remaining_mixins)
+        if remaining_mixins
+        else original_class
+    )
+
+
+def _get_consumer_mixin(consumer: "async_channel.consumer.Consumer") -> type:
+    """
+    :return: the metered mixin of consumer
+    """
+    return (
+        MeteredBatchConsumerMixin
+        if hasattr(consumer, "perform_batch")
+        else MeteredConsumerMixin
+    )
+
+
+def _enable(element: typing.Any, mixin: type, metrics: typing.Any) -> None:
+    """
+    Swaps element class with its metered class
+    """
+    element.metrics = metrics
+    enable_mixin(element, mixin)
+
+
+def _disable(element: typing.Any, mixin: type) -> None:
+    """
+    Restores element class without its metered mixin
+    """
+    if mixin in get_mixins(element):
+        disable_mixin(element, mixin)
+        element.__dict__.pop("metrics", None)
+        element.__dict__.pop("metrics_put_times", None)
+
+
+_METRICS_MIXINS: tuple[type, ...] = (
+    MeteredProducerMixin,
+    MeteredConsumerMixin,
+    MeteredBatchConsumerMixin,
+    MeteredQueueMixin,
+)
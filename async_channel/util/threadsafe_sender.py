@@ -0,0 +1,151 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define ThreadSafeSender used to send data to a channel from other threads
+"""
+import asyncio
+import collections
+import threading
+import typing
+
+import async_channel.util.logging_util as logging
+
+
+class ThreadSafeSender:  # pylint: disable=too-many-instance-attributes
+    """
+    A ThreadSafeSender buffers data put from any thread and sends them from its event loop.
+    The event loop is woken up once per batch: data put while a batch is pending are sent with this batch.
+    The buffer is bounded by max_buffer_size, the data being sent included: data put when it is full
+    are dropped unless put is blocking. Buffered data are taken one by one by the flush task.
+    """
+
+    def __init__(
+        self,
+        send: typing.Callable[[typing.Any], typing.Awaitable],
+        loop: asyncio.AbstractEventLoop,
+        max_buffer_size: int,
+    ):
+        self.logger = logging.get_logger(self.__class__.__name__)
+
+        # Coroutine function called on loop with each buffered data
+        self.send: typing.Callable[[typing.Any], typing.Awaitable] = send
+        self.loop: asyncio.AbstractEventLoop = loop
+
+        # Maximum count of buffered data, the data being sent included
+        self.max_buffer_size: int = max_buffer_size
+
+        # Counters
+        self.put_count: int = 0
+        self.dropped_count: int = 0
+        self.wakeups_count: int = 0
+
+        self._buffer: collections.deque = collections.deque()
+
+        # 1 while the flush task is sending a data taken from the buffer, counted in the buffer bound
+        self._in_flight_count: int = 0
+
+        self._buffer_condition: threading.Condition = threading.Condition()
+        self._is_flush_scheduled: bool = False
+        self._flush_task: typing.Optional[asyncio.Task] = None
+
+    def put(
+        self,
+        data: typing.Any,
+        block: bool = False,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        """
+        Buffers data to be sent from the event loop, can be called from any thread
+        Blocking calls should never be done from the event loop thread
+        :param data: the data to send
+        :param block: when True, waits for a buffer slot when the buffer is full
+        :param timeout: the maximum time to wait for a buffer slot when block is True, None to wait forever
+        :return: False if data was dropped because the buffer is full
+        """
+        with self._buffer_condition:
+            if not self._has_free_slot() and not (
+                block and self._buffer_condition.wait_for(self._has_free_slot, timeout)
+            ):
+                self.dropped_count += 1
+                return False
+            self._buffer.append(data)
+            self.put_count += 1
+            if self._is_flush_scheduled:
+                return True
+            self._is_flush_scheduled = True
+            self.wakeups_count += 1
+        try:
+            self.loop.call_soon_threadsafe(self._schedule_flush)
+        except RuntimeError:
+            # closed event loop
+            with self._buffer_condition:
+                self._is_flush_scheduled = False
+            raise
+        return True
+
+    def _has_free_slot(self) -> bool:
+        """
+        Should be called with the buffer condition acquired
+        :return: True if a data can be put in the buffer
+        """
+        return len(self._buffer) + self._in_flight_count < self.max_buffer_size
+
+    def _schedule_flush(self) -> None:
+        """
+        Called from the event loop to create the flush task
+        """
+        self._flush_task = self.loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """
+        Sends buffered data one by one until the buffer is empty
+        A buffer slot is freed each time a data has been sent
+        """
+        while True:
+            with self._buffer_condition:
+                self._in_flight_count = 0
+                self._buffer_condition.notify()
+                if not self._buffer:
+                    self._is_flush_scheduled = False
+                    return
+                data = self._buffer.popleft()
+                self._in_flight_count = 1
+            try:
+                await self.send(data)
+            except Exception as send_exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    f"Error when sending thread safe data: {send_exception}"
+                )
+
+    def get_buffer_size(self) -> int:
+        """
+        :return: the count of data waiting to be sent
+        """
+        return len(self._buffer)
+
+    def stop(self) -> None:
+        """
+        Cancels the pending flush and drops buffered data
+        The data being sent when the flush is cancelled was already taken from the buffer: it may be lost too
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        with self._buffer_condition:
+            self._buffer.clear()
+            self._in_flight_count = 0
+            self._is_flush_scheduled = False
+            self._buffer_condition.notify_all()
@@ -0,0 +1,108 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Runs benchmarks and compares them to a baseline
+    python -m benchmarks --sizes 1,10,100 --output results.json --baseline baseline.json
+Exits with 1 when a regression is detected
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+import async_channel.consumer as consumer
+import async_channel.consumers as consumers
+
+import benchmarks.runner as runner
+import benchmarks.scenarios  # pylint: disable=unused-import  # registers scenarios
+
+CONSUMER_CLASSES = {
+    consumer_class.__name__: consumer_class
+    for consumer_class in (
+        consumer.Consumer,
+        consumer.SupervisedConsumer,
+        consumers.DirectConsumer,
+        consumers.CompactConsumer,
+        consumers.CompactSupervisedConsumer,
+    )
+}
+
+
+def _parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Async-Channel micro-benchmarks")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(runner.SCENARIOS),
+        help=f"comma separated scenarios to run among {', '.join(runner.SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--consumers",
+        default=",".join(CONSUMER_CLASSES),
+        help=f"comma separated consumer classes among {', '.join(CONSUMER_CLASSES)}",
+    )
+    parser.add_argument(
+        "--sizes", default="1,10,100", help="comma separated scenario sizes"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="iterations per scenario"
+    )
+    parser.add_argument("--output", help="path of the json report to write")
+    parser.add_argument("--baseline", help="path of the json report to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="tolerated relative degradation before flagging a regression",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list[str]) -> int:
+    """
+    Runs the requested benchmarks
+    :return: the process exit code
+    """
+    parsed_args = _parse_args(args)
+    report = asyncio.run(
+        runner.run(
+            parsed_args.scenarios.split(","),
+            [CONSUMER_CLASSES[name] for name in parsed_args.consumers.split(",")],
+            [int(size) for size in parsed_args.sizes.split(",")],
+            parsed_args.iterations,
+        )
+    )
+    for result in report["results"]:
+        print(
+            f"{result['name']:<55} {result['ops_per_second']:>12.0f} ops/s "
+            f"p50 {result['p50_latency_us']:>10.2f}us p99 {result['p99_latency_us']:>10.2f}us "
+            f"peak {result['peak_memory_bytes_per_op']:>10.0f}B/op"
+        )
+    if parsed_args.output:
+        with open(parsed_args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if parsed_args.baseline:
+        with open(parsed_args.baseline, encoding="utf-8") as baseline_file:
+            regressions = runner.compare(
+                report, json.load(baseline_file), parsed_args.threshold
+            )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
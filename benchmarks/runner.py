@@ -0,0 +1,214 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define benchmark scenarios runner and baseline comparison
+"""
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import typing
+
+# Registered scenarios by name
+SCENARIOS: dict[str, typing.Callable] = {}
+
+
+class Measurement:  # pylint: disable=too-many-instance-attributes
+    """
+    Measures of a scenario run: the operations count, the measured time and each operation latency
+    """
+
+    def __init__(self):
+        self.operations: int = 0
+        self.elapsed: float = 0
+        self.latencies: list[float] = []
+
+        # Scenario specific counters, reported per operation
+        self.counters: dict[str, int] = {}
+
+        # Memory measured between start() and stop() calls
+        self.peak_memory: int = 0
+        self.allocated_blocks: int = 0
+        self._start_memory: int = 0
+        self._start_blocks: int = 0
+
+    def start(self) -> None:
+        """
+        Starts memory measures, should be called after the scenario setup
+        """
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._start_memory = tracemalloc.get_traced_memory()[0]
+        self._start_blocks = sys.getallocatedblocks()
+
+    def stop(self) -> None:
+        """
+        Stops memory measures, should be called before the scenario teardown
+        """
+        self.allocated_blocks = sys.getallocatedblocks() - self._start_blocks
+        if tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1] - self._start_memory
+
+    def add_latency(self, latency: float, operations: int = 1) -> None:
+        """
+        Adds an operation latency
+        :param latency: the operation duration in seconds
+        :param operations: the count of operations performed during latency
+        """
+        self.latencies.append(latency)
+        self.operations += operations
+        self.elapsed += latency
+
+
+def scenario(name: str) -> typing.Callable:
+    """
+    Registers a scenario under name
+    A scenario is a coroutine function called with (consumer_class, size, iterations) returning a Measurement.
+    Scenarios should call Measurement.start() after their setup and Measurement.stop() before their teardown.
+    :param name: the scenario name
+    """
+
+    def register(scenario_function: typing.Callable) -> typing.Callable:
+        SCENARIOS[name] = scenario_function
+        return scenario_function
+
+    return register
+
+
+def get_result_name(scenario_name: str, consumer_class: type, size: int) -> str:
+    """
+    :return: the unique name of a scenario result
+    """
+    return f"{scenario_name}[{consumer_class.__name__}-{size}]"
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    :return: the percent percentile of values
+    """
+    if not values:
+        return 0
+    ordered_values = sorted(values)
+    return ordered_values[
+        min(len(ordered_values) - 1, int(len(ordered_values) * percent / 100))
+    ]
+
+
+async def run_scenario(
+    scenario_name: str, consumer_class: type, size: int, iterations: int
+) -> dict:
+    """
+    Runs a scenario twice: once to measure time, once with tracemalloc to measure memory
+    :return: the scenario result
+    """
+    scenario_function = SCENARIOS[scenario_name]
+    gc.collect()
+    measurement = await scenario_function(consumer_class, size, iterations)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        memory_measurement = await scenario_function(consumer_class, size, iterations)
+    finally:
+        tracemalloc.stop()
+
+    memory_operations = max(memory_measurement.operations, 1)
+    return {
+        "name": get_result_name(scenario_name, consumer_class, size),
+        "scenario": scenario_name,
+        "consumer_class": consumer_class.__name__,
+        "size": size,
+        "operations": measurement.operations,
+        "ops_per_second": (
+            measurement.operations / measurement.elapsed if measurement.elapsed else 0
+        ),
+        "p50_latency_us": (
+            statistics.median(measurement.latencies) * 1e6
+            if measurement.latencies
+            else 0
+        ),
+        "p99_latency_us": percentile(measurement.latencies, 99) * 1e6,
+        "peak_memory_bytes_per_op": memory_measurement.peak_memory / memory_operations,
+        "allocated_blocks_per_op": memory_measurement.allocated_blocks
+        / memory_operations,
+        **{
+            f"{counter_name}_per_op": counter / max(measurement.operations, 1)
+            for counter_name, counter in measurement.counters.items()
+        },
+    }
+
+
+async def run(
+    scenario_names: typing.Iterable[str],
+    consumer_classes: typing.Iterable[type],
+    sizes: typing.Iterable[int],
+    iterations: int,
+) -> dict:
+    """
+    Runs every scenario for every consumer class and size
+    :return: the benchmark report
+    """
+    results = []
+    for scenario_name in scenario_names:
+        for consumer_class in consumer_classes:
+            for size in sizes:
+                results.append(
+                    await run_scenario(scenario_name, consumer_class, size, iterations)
+                )
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.time(),
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compares report results to baseline results
+    :param threshold: tolerated relative degradation (0.2 for 20%)
+    :return: the detected regressions descriptions
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        baseline_result = baseline_results.get(result["name"])
+        if baseline_result is None:
+            continue
+        if result["ops_per_second"] < baseline_result["ops_per_second"] * (
+            1 - threshold
+        ):
+            regressions.append(
+                f"{result['name']}: {result['ops_per_second']:.0f} ops/s "
+                f"(baseline: {baseline_result['ops_per_second']:.0f} ops/s)"
+            )
+        if result["p50_latency_us"] > baseline_result["p50_latency_us"] * (
+            1 + threshold
+        ):
+            regressions.append(
+                f"{result['name']}: p50 latency {result['p50_latency_us']:.2f}us "
+                f"(baseline: {baseline_result['p50_latency_us']:.2f}us)"
+            )
+    return regressions
+
+
+def timer() -> float:
+    """
+    :return: the benchmark clock time in seconds
+    """
+    return time.perf_counter()
@@ -0,0 +1,416 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define channel hot paths benchmark scenarios
+"""
+import asyncio
+import tempfile
+import threading
+
+import async_channel.enums as enums
+import async_channel.bridges as bridges
+import async_channel.channels as channels
+import async_channel.consumer as consumer
+import async_channel.consumers as consumers
+import async_channel.producer as producer
+import async_channel.util as util
+
+import benchmarks.runner as runner
+
+BENCHMARK_CHANNEL = "Benchmark"
+SYMBOLS_COUNT = 50
+TIME_FRAMES = ["1m", "5m", "15m", "1h", "4h", "1d"]
+LOWEST_PRIORITY_LEVEL = enums.ChannelConsumerPriorityLevels.OPTIONAL.value
+OPTIONAL_CALLBACK_DURATION = 0.00002  # seconds spent by saturated OPTIONAL consumers
+
+
+class BenchmarkProducer(producer.Producer):
+    """
+    Producer that never pauses
+    """
+
+    async def pause(self) -> None:
+        pass
+
+    async def resume(self) -> None:
+        pass
+
+
+class BenchmarkChannel(channels.Channel):
+    """
+    Channel used by benchmarks
+    """
+
+    PRODUCER_CLASS = BenchmarkProducer
+    CONSUMER_CLASS = consumer.Consumer
+
+
+async def callback(**_) -> None:
+    """
+    Benchmark consumers callback
+    """
+
+
+async def create_channel(is_synchronized: bool = False) -> channels.Channel:
+    """
+    :return: a new registered benchmark channel
+    """
+    channels.del_chan(BENCHMARK_CHANNEL)
+    return await util.create_channel_instance(
+        BenchmarkChannel, channels.set_chan, is_synchronized=is_synchronized
+    )
+
+
+async def delete_channel(channel: channels.Channel) -> None:
+    """
+    Stops and unregisters the benchmark channel
+    """
+    await channel.stop()
+    channels.del_chan(BENCHMARK_CHANNEL)
+
+
+def get_filters(index: int) -> dict:
+    """
+    :return: the consumer filters of the consumer at index
+    """
+    return {
+        "symbol": f"SYMBOL{index % SYMBOLS_COUNT}/USDT",
+        "time_frame": TIME_FRAMES[(index // SYMBOLS_COUNT) % len(TIME_FRAMES)],
+    }
+
+
+async def wait_for_consumers(channel: channels.Channel, channel_producer) -> None:
+    """
+    Waits for consumers to process their queue
+    """
+    if isinstance(channel.get_consumers()[0], consumer.BaseSupervisedConsumer):
+        await channel_producer.wait_for_processing()
+        return
+    while not channel_producer.is_consumers_queue_empty(LOWEST_PRIORITY_LEVEL):
+        await asyncio.sleep(0)
+
+
+@runner.scenario("send")
+async def send_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Producer.send throughput to a single consumer, size data sent per batch
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    await channel.new_consumer(callback, consumer_class=consumer_class)
+    channel_producer = channel.get_internal_producer()
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        for _ in range(size):
+            await channel_producer.send({})
+        await wait_for_consumers(channel, channel_producer)
+        measurement.add_latency(runner.timer() - start, size)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("fan_out")
+async def fan_out_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Producer.send fan out cost to size consumers, one operation per delivered data
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    for _ in range(size):
+        await channel.new_consumer(callback, consumer_class=consumer_class)
+    channel_producer = channel.get_internal_producer()
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        await channel_producer.send({})
+        await wait_for_consumers(channel, channel_producer)
+        measurement.add_latency(runner.timer() - start, size)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("filter_consumers")
+async def filter_consumers_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Channel.get_consumer_from_filters cost with size filtered consumers
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    for index in range(size):
+        await channel.new_consumer(
+            callback, consumer_filters=get_filters(index), consumer_class=consumer_class
+        )
+    measurement.start()
+    for index in range(iterations):
+        filters = get_filters(index)
+        start = runner.timer()
+        channel.get_consumer_from_filters(filters)
+        measurement.add_latency(runner.timer() - start)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("synchronized_perform")
+async def synchronized_perform_scenario(
+    consumer_class: type, size: int, iterations: int
+):
+    """
+    Producer.send then Producer.synchronized_perform_consumers_queue latency with size consumers
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel(is_synchronized=True)
+    for _ in range(size):
+        await channel.new_consumer(callback, consumer_class=consumer_class)
+    channel_producer = channel.get_internal_producer()
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        await channel_producer.send({})
+        await channel_producer.synchronized_perform_consumers_queue(
+            LOWEST_PRIORITY_LEVEL, True, 1
+        )
+        measurement.add_latency(runner.timer() - start)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("synchronized_sparse_perform")
+async def synchronized_sparse_perform_scenario(
+    consumer_class: type, size: int, iterations: int
+):
+    """
+    Producer.synchronized_perform_consumers_queue latency with size consumers when a single one has data
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel(is_synchronized=True)
+    for _ in range(size):
+        await channel.new_consumer(callback, consumer_class=consumer_class)
+    channel_producer = channel.get_internal_producer()
+    sparse_consumer = channel.get_consumers()[-1]
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        await sparse_consumer.queue.put({})
+        await channel_producer.synchronized_perform_consumers_queue(
+            LOWEST_PRIORITY_LEVEL, True, 1
+        )
+        measurement.add_latency(runner.timer() - start)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+async def measure_saturated_high_priority_latency(
+    consumer_class: type, size: int, iterations: int, dispatched: bool
+) -> runner.Measurement:
+    """
+    Measures a HIGH priority consumer latency while size OPTIONAL consumers are saturated
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    if dispatched:
+        channel.enable_priority_dispatch()
+    high_priority_performed = asyncio.Event()
+
+    async def high_priority_callback(sent_at: float) -> None:
+        measurement.add_latency(runner.timer() - sent_at)
+        high_priority_performed.set()
+
+    async def optional_callback(**_) -> None:
+        # simulates a CPU bound callback
+        busy_until = runner.timer() + OPTIONAL_CALLBACK_DURATION
+        while runner.timer() < busy_until:
+            pass
+        await asyncio.sleep(0)
+
+    await channel.new_consumer(high_priority_callback, consumer_class=consumer_class)
+    for _ in range(size):
+        await channel.new_consumer(
+            optional_callback,
+            priority_level=LOWEST_PRIORITY_LEVEL,
+            consumer_class=consumer_class,
+        )
+    channel_producer = channel.get_internal_producer()
+    measurement.start()
+    for _ in range(iterations):
+        high_priority_performed.clear()
+        await channel_producer.send({"sent_at": runner.timer()})
+        await high_priority_performed.wait()
+    measurement.stop()
+    await wait_for_consumers(channel, channel_producer)
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("saturated_high_priority")
+async def saturated_high_priority_scenario(
+    consumer_class: type, size: int, iterations: int
+):
+    """
+    HIGH priority consumer latency while size OPTIONAL consumers run CPU bound callbacks
+    """
+    return await measure_saturated_high_priority_latency(
+        consumer_class, size, iterations, False
+    )
+
+
+@runner.scenario("saturated_high_priority_dispatched")
+async def saturated_high_priority_dispatched_scenario(
+    consumer_class: type, size: int, iterations: int
+):
+    """
+    saturated_high_priority with a channel PriorityDispatcher
+    """
+    return await measure_saturated_high_priority_latency(
+        consumer_class, size, iterations, True
+    )
+
+
+@runner.scenario("send_threadsafe")
+async def send_threadsafe_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Producer.send_threadsafe throughput from another thread to a single consumer, size data sent per batch
+    Also reports the event loop wakeups per sent data
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    await channel.new_consumer(callback, consumer_class=consumer_class)
+    channel_producer = channel.get_internal_producer()
+    sender = channel_producer.enable_threadsafe_send()
+
+    def feed() -> None:
+        for _ in range(size):
+            channel_producer.send_threadsafe({}, block=True)
+
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        feeding_thread = threading.Thread(target=feed)
+        feeding_thread.start()
+        while feeding_thread.is_alive() or sender.get_buffer_size():
+            await asyncio.sleep(0)
+        await wait_for_consumers(channel, channel_producer)
+        measurement.add_latency(runner.timer() - start, size)
+    measurement.stop()
+    measurement.counters["loop_wakeups"] = sender.wakeups_count
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("consumer_churn")
+async def consumer_churn_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Channel.new_consumer then Channel.remove_consumer latency with size already subscribed consumers
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    for index in range(size):
+        await channel.new_consumer(
+            callback, consumer_filters=get_filters(index), consumer_class=consumer_class
+        )
+    measurement.start()
+    for index in range(iterations):
+        start = runner.timer()
+        churn_consumer = await channel.new_consumer(
+            callback, consumer_filters=get_filters(index), consumer_class=consumer_class
+        )
+        await channel.remove_consumer(churn_consumer)
+        measurement.add_latency(runner.timer() - start)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("bulk_subscribe")
+async def bulk_subscribe_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    Channel.new_consumers then Channel.remove_consumers latency of size filtered consumers, one operation per consumer
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    measurement.start()
+    for _ in range(iterations):
+        start = runner.timer()
+        bulk_consumers = await channel.new_consumers(
+            {
+                "callback": callback,
+                "consumer_filters": get_filters(index),
+                "consumer_class": consumer_class,
+            }
+            for index in range(size)
+        )
+        await channel.remove_consumers(bulk_consumers)
+        measurement.add_latency(runner.timer() - start, size)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("consumer_footprint")
+async def consumer_footprint_scenario(consumer_class: type, size: int, _: int):
+    """
+    Channel.new_consumer latency and memory per subscribed consumer when subscribing size filtered consumers
+    Compact consumers are stored with compact filters
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel()
+    channel.COMPACT_CONSUMER_FILTERS = issubclass(  # type: ignore
+        consumer_class, consumers.CompactConsumer
+    )
+    measurement.start()
+    for index in range(size):
+        start = runner.timer()
+        await channel.new_consumer(
+            callback, consumer_filters=get_filters(index), consumer_class=consumer_class
+        )
+        measurement.add_latency(runner.timer() - start)
+    measurement.stop()
+    await delete_channel(channel)
+    return measurement
+
+
+@runner.scenario("journal_replay")
+async def journal_replay_scenario(consumer_class: type, size: int, iterations: int):
+    """
+    JournalReplayProducer.replay throughput of size recorded data into a synchronized channel with a single consumer
+    """
+    measurement = runner.Measurement()
+    channel = await create_channel(is_synchronized=True)
+    await channel.new_consumer(callback, consumer_class=consumer_class)
+    with tempfile.TemporaryDirectory() as directory:
+        writer = util.JournalWriter(directory)
+        channel.enable_recording(writer)
+        channel_producer = channel.get_internal_producer()
+        for _ in range(size):
+            await channel_producer.send({})
+        channel.disable_recording()
+        writer.close()
+        replay_producer = bridges.JournalReplayProducer(
+            channel, util.JournalReader(directory)
+        )
+        measurement.start()
+        for _ in range(iterations):
+            start = runner.timer()
+            await replay_producer.replay()
+            measurement.add_latency(runner.timer() - start, size)
+        measurement.stop()
+    await delete_channel(channel)
+    return measurement
@@ -19,7 +19,7 @@ from setuptools import setup
 
 from async_channel import PROJECT_NAME, VERSION
 
-PACKAGES = find_packages(exclude=["tests"])
+PACKAGES = find_packages(exclude=["tests", "benchmarks", "benchmarks.*"])
 
 
 REQUIRED = open('requirements.txt').readlines()
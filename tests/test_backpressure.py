@@ -0,0 +1,113 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+import pytest_asyncio
+
+import async_channel
+import async_channel.channels as channels
+import async_channel.util as util
+import tests
+
+HIGH = async_channel.ChannelConsumerPriorityLevels.HIGH.value
+OPTIONAL = async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+async def create_producer(channel):
+    producer = tests.EmptyTestProducer(channel)
+    await producer.run()
+    return producer
+
+
+def test_queue_watermarks():
+    watermarks = channels.QueueWatermarks(10, 2)
+    assert (watermarks.high, watermarks.low) == (10, 2)
+    with pytest.raises(ValueError):
+        channels.QueueWatermarks(2, 2)
+    assert set(channels.get_default_watermarks()) == {HIGH, async_channel.ChannelConsumerPriorityLevels.MEDIUM.value}
+
+
+@pytest.mark.asyncio
+async def test_congested_consumer_pauses_producers(synchronized_channel):
+    synchronized_channel.enable_backpressure({HIGH: channels.QueueWatermarks(3, 1)})
+    producer = await create_producer(synchronized_channel)
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    assert not synchronized_channel.is_paused
+
+    with mock.patch.object(producer, "pause", mock.AsyncMock()) as pause_mock, \
+            mock.patch.object(producer, "resume", mock.AsyncMock()) as resume_mock:
+        for _ in range(2):
+            await producer.send({})
+        await tests.mock_was_not_called(pause_mock)
+        await producer.send({})
+        await tests.mock_was_called_once(pause_mock)
+        assert synchronized_channel.is_paused
+        assert synchronized_channel.backpressure.is_congested()
+
+        consumer.queue.get_nowait()
+        await tests.mock_was_not_called(resume_mock)
+        consumer.queue.get_nowait()
+        await tests.mock_was_called_once(resume_mock)
+        assert not synchronized_channel.is_paused
+        assert not synchronized_channel.backpressure.is_congested()
+        # the queue is not observed when got from anymore
+        await producer.synchronized_perform_consumers_queue(HIGH, True, 1)
+        resume_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_consumers_without_watermarks_are_not_tracked(synchronized_channel):
+    synchronized_channel.enable_backpressure()
+    producer = await create_producer(synchronized_channel)
+    await synchronized_channel.new_consumer(tests.empty_test_callback)
+    optional_consumer = await synchronized_channel.new_consumer(tests.empty_test_callback, priority_level=OPTIONAL)
+    for _ in range(async_channel.DEFAULT_QUEUE_HIGH_WATERMARK - 1):
+        await optional_consumer.queue.put({})
+    with mock.patch.object(producer, "pause", mock.AsyncMock()) as pause_mock:
+        await optional_consumer.queue.put({})
+        await tests.mock_was_not_called(pause_mock)
+
+
+@pytest.mark.asyncio
+async def test_removing_or_disabling_resumes_producers(synchronized_channel):
+    producer = await create_producer(synchronized_channel)
+    consumer_1 = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    consumer_2 = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    await consumer_1.queue.put({})
+    await consumer_2.queue.put({})
+    # consumers already congested when enabling backpressure
+    synchronized_channel.enable_backpressure({HIGH: channels.QueueWatermarks(1, 0)})
+    await tests.wait_asyncio_next_cycle()
+    assert synchronized_channel.is_paused
+
+    with mock.patch.object(producer, "resume", mock.AsyncMock()) as resume_mock:
+        await synchronized_channel.remove_consumer(consumer_1)
+        await tests.mock_was_not_called(resume_mock)
+        synchronized_channel.disable_backpressure()
+        await tests.mock_was_called_once(resume_mock)
+    assert synchronized_channel.backpressure is None
+    assert not synchronized_channel.is_paused
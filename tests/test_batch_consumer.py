@@ -0,0 +1,108 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_batch_consumer_drains_queue(test_channel):
+    batches = []
+
+    async def callback(batch):
+        batches.append(batch)
+
+    consumer = await test_channel.new_consumer(callback, consumer_class=consumers.BatchConsumer, max_batch=2)
+    assert isinstance(consumer, consumers.BatchConsumer)
+    producer = test_channel.get_internal_producer()
+    for index in range(5):
+        await producer.send({"index": index})
+    for _ in range(5):
+        await tests.wait_asyncio_next_cycle()
+    assert batches == [
+        [{"index": 0}, {"index": 1}],
+        [{"index": 2}, {"index": 3}],
+        [{"index": 4}],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_consumer_waits_for_max_wait(test_channel):
+    batches = []
+
+    async def callback(batch):
+        batches.append(batch)
+
+    await test_channel.new_consumer(callback, consumer_class=consumers.BatchConsumer, max_batch=10, max_wait=0.5)
+    producer = test_channel.get_internal_producer()
+    await producer.send({"index": 0})
+    await tests.wait_asyncio_next_cycle()
+    await producer.send({"index": 1})
+    await asyncio.sleep(0.6)
+    assert batches == [[{"index": 0}, {"index": 1}]]
+
+
+@pytest.mark.asyncio
+async def test_supervised_batch_consumer(test_channel):
+    batches = []
+    idle_states = []
+
+    async def callback(batch):
+        idle_states.append(consumer.idle.is_set())
+        batches.append(batch)
+
+    consumer = await test_channel.new_consumer(
+        callback, consumer_class=consumers.SupervisedBatchConsumer, max_batch=3
+    )
+    producer = test_channel.get_internal_producer()
+    for index in range(4):
+        await producer.send({"index": index})
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert idle_states == [False, False]
+    assert consumer.idle.is_set()
+    assert consumer.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_batch_consumer_callback_exception(test_channel):
+    batches = []
+
+    async def callback(batch):
+        batches.append(batch)
+        raise RuntimeError("test")
+
+    await test_channel.new_consumer(callback, consumer_class=consumers.SupervisedBatchConsumer)
+    producer = test_channel.get_internal_producer()
+    await producer.send({"index": 0})
+    await producer.send({"index": 1})
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    assert batches == [[{"index": 0}, {"index": 1}]]
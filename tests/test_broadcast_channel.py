@@ -0,0 +1,141 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel
+import async_channel.channels as channels
+import async_channel.util as util
+import tests
+
+BROADCAST_TEST_CHANNEL = "BroadcastTest"
+
+
+async def data_callback(data):
+    pass
+
+
+class BroadcastTestChannel(channels.BroadcastChannel):
+    CONSUMER_CLASS = tests.EmptyTestConsumer
+    RING_BUFFER_SIZE = 2
+
+
+async def create_broadcast_channel(channel_class, is_synchronized=False):
+    channels.del_chan(BROADCAST_TEST_CHANNEL)
+    return await util.create_channel_instance(channel_class, channels.set_chan, is_synchronized=is_synchronized)
+
+
+@pytest_asyncio.fixture
+async def broadcast_channel():
+    yield await create_broadcast_channel(BroadcastTestChannel)
+    await channels.get_chan(BROADCAST_TEST_CHANNEL).stop()
+    channels.del_chan(BROADCAST_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_to_every_consumer(broadcast_channel):
+    calls_1 = []
+    calls_2 = []
+
+    async def callback_1(data):
+        calls_1.append(data)
+
+    async def callback_2(data):
+        calls_2.append(data)
+
+    await broadcast_channel.new_consumer(callback_1)
+    await broadcast_channel.new_consumer(callback_2, consumer_class=tests.EmptyTestSupervisedConsumer)
+    producer = broadcast_channel.get_internal_producer()
+    for index in range(5):
+        await producer.send({"data": index})
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    await tests.wait_asyncio_next_cycle()
+    assert calls_1 == calls_2 == list(range(5))
+    assert broadcast_channel.ring_buffer.head == 5
+
+
+@pytest.mark.asyncio
+async def test_broadcast_block_policy(broadcast_channel):
+    consumer = await broadcast_channel.new_consumer(tests.empty_test_callback)
+    await consumer.stop()
+    producer = broadcast_channel.get_internal_producer()
+    await producer.send({})
+    await producer.send({})
+    send_task = asyncio.create_task(producer.send({}))
+    await tests.wait_asyncio_next_cycle()
+    assert not send_task.done()
+    assert consumer.queue.full()
+    assert consumer.queue.get_nowait() == {}
+    await asyncio.wait_for(send_task, 1)
+    assert consumer.queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_broadcast_skip_to_head_policy():
+    class SkipBroadcastTestChannel(BroadcastTestChannel):
+        SLOW_CONSUMER_POLICY = async_channel.SlowConsumerPolicies.SKIP_TO_HEAD
+
+    channel = await create_broadcast_channel(SkipBroadcastTestChannel, is_synchronized=True)
+    slow_consumer = await channel.new_consumer(data_callback)
+    consumer = await channel.new_consumer(data_callback)
+    producer = channel.get_internal_producer()
+    await producer.send({"data": 0})
+    await producer.send({"data": 1})
+    consumer.queue.get_nowait()
+    consumer.queue.get_nowait()
+    await producer.send({"data": 2})
+    assert slow_consumer.queue.skipped_count == 2
+    assert slow_consumer.queue.get_nowait() == {"data": 2}
+    assert consumer.queue.skipped_count == 0
+    assert consumer.queue.get_nowait() == {"data": 2}
+    assert channel.get_consumers() == (slow_consumer, consumer)
+    await channel.stop()
+    channels.del_chan(channel.get_name())
+
+
+@pytest.mark.asyncio
+async def test_broadcast_disconnect_policy():
+    class DisconnectBroadcastTestChannel(BroadcastTestChannel):
+        SLOW_CONSUMER_POLICY = async_channel.SlowConsumerPolicies.DISCONNECT
+
+    channel = await create_broadcast_channel(DisconnectBroadcastTestChannel, is_synchronized=True)
+    slow_consumer = await channel.new_consumer(data_callback)
+    consumer = await channel.new_consumer(data_callback)
+    producer = channel.get_internal_producer()
+    await producer.send({"data": 0})
+    await producer.send({"data": 1})
+    consumer.queue.get_nowait()
+    await producer.send({"data": 2})
+    assert channel.get_consumers() == (consumer,)
+    assert slow_consumer.queue.is_disconnected
+    assert slow_consumer.should_stop
+    assert not producer.is_consumers_queue_empty(1)
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    assert producer.is_consumers_queue_empty(1)
+    await channel.stop()
+    channels.del_chan(channel.get_name())
+
+
+@pytest.mark.asyncio
+async def test_remove_consumers_removes_readers(broadcast_channel):
+    consumers = await broadcast_channel.new_consumers([{"callback": data_callback}] * 3)
+    assert len(broadcast_channel.ring_buffer.readers) == 3
+    await broadcast_channel.remove_consumers(consumers[:2])
+    assert list(broadcast_channel.ring_buffer.readers) == [consumers[2].queue]
+    await broadcast_channel.remove_consumer(consumers[2])
+    assert broadcast_channel.ring_buffer.readers == {}
@@ -92,13 +92,13 @@ async def test_new_consumer_without_producer(test_channel):
 @pytest.mark.asyncio
 async def test_new_consumer_without_filters(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback)
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == [consumer]
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == (consumer,)
 
 
 @pytest.mark.asyncio
 async def test_new_consumer_with_filters(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback, {"test_key": 1})
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == [consumer]
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == (consumer,)
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({}) == [consumer]  # returns all if empty
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({"test_key": 2}) == []
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({"test_key": 1, "test2": 2}) == []
@@ -109,7 +109,7 @@ async def test_new_consumer_with_filters(test_channel):
 async def test_new_consumer_with_expected_wildcard_filters(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback, {"test_key": 1,
                                                                                      "test_key_2": "abc"})
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == [consumer]
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == (consumer,)
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({}) == [consumer]  # returns all if empty
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({"test_key": 1, "test_key_2": "abc"}) == [consumer]
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters(
@@ -133,7 +133,7 @@ async def test_new_consumer_with_consumer_wildcard_filters(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback, {"test_key": 1,
                                                                                      "test_key_2": "abc",
                                                                                      "test_key_3": async_channel.CHANNEL_WILDCARD})
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == [consumer]
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == (consumer,)
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({}) == [consumer]  # returns all if empty
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({"test_key": 1, "test_key_2": "abc"}) == [consumer]
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters(
@@ -191,7 +191,7 @@ async def test_new_consumer_with_multiple_consumer_filtering(test_channel):
         for consumers_description in consumers_descriptions
     ]
 
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == consumers
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == tuple(consumers)
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({}) == consumers
     # Warning : consumer[5] is returned because 1 == True
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumer_from_filters({"A": 1, "B": "6"}) == \
@@ -213,9 +213,9 @@ async def test_new_consumer_with_multiple_consumer_filtering(test_channel):
 @pytest.mark.asyncio
 async def test_remove_consumer(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback)
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == [consumer]
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == (consumer,)
     await channels.get_chan(tests.EMPTY_TEST_CHANNEL).remove_consumer(consumer)
-    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == []
+    assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == ()
 
 
 @pytest.mark.asyncio
@@ -408,3 +408,236 @@ async def test_should_resume_producers_with_optional_consumers(test_channel):
     await test_channel.remove_consumer(consumer_1)
     await test_channel.remove_consumer(consumer_2)
     await test_channel.remove_consumer(consumer_3)
+
+
+@pytest.mark.asyncio
+async def test_get_consumer_from_filters_after_remove_consumer(test_channel):
+    consumer_1 = await test_channel.new_consumer(tests.empty_test_callback, {"A": 1, "B": [2, 3]})
+    consumer_2 = await test_channel.new_consumer(tests.empty_test_callback, {"A": async_channel.CHANNEL_WILDCARD, "B": 2})
+    consumer_3 = await test_channel.new_consumer(tests.empty_test_callback, {"A": 1, "B": {"unhashable": 1}})
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": 2}) == [consumer_1, consumer_2]
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_1, consumer_2, consumer_3]
+    await test_channel.remove_consumer(consumer_1)
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": 2}) == [consumer_2]
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": 3}) == []
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_2, consumer_3]
+    await test_channel.remove_consumer(consumer_3)
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_2]
+    assert len(test_channel.consumer_filters_index) == 1
+    await test_channel.remove_consumer(consumer_2)
+
+
+@pytest.mark.asyncio
+async def test_get_consumer_from_filters_with_strict_filters(test_channel):
+    test_channel.consumer_filters_index.strict = True
+    consumer_1 = await test_channel.new_consumer(tests.empty_test_callback, {"A": True})
+    consumer_2 = await test_channel.new_consumer(tests.empty_test_callback, {"A": [1, "B"]})
+    consumer_3 = await test_channel.new_consumer(tests.empty_test_callback, {"A": async_channel.CHANNEL_WILDCARD})
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_2, consumer_3]
+    assert test_channel.get_consumer_from_filters({"A": True}) == [consumer_1, consumer_3]
+    assert test_channel.get_consumer_from_filters({"A": "B"}) == [consumer_2, consumer_3]
+    await test_channel.remove_consumer(consumer_1)
+    await test_channel.remove_consumer(consumer_2)
+    await test_channel.remove_consumer(consumer_3)
+
+
+@pytest.mark.asyncio
+async def test_get_consumer_from_filters_with_strict_filters_and_unhashable_selection(test_channel):
+    consumer_1 = await test_channel.new_consumer(tests.empty_test_callback, {"A": 1})
+    consumer_2 = await test_channel.new_consumer(tests.empty_test_callback, {"A": [True, "B"]})
+    consumer_3 = await test_channel.new_consumer(tests.empty_test_callback, {"A": async_channel.CHANNEL_WILDCARD})
+    # unhashable selection values are matched by a full scan of the consumers
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": []}) == []
+    assert test_channel.get_consumer_from_filters({"A": []}) == [consumer_3]
+    consumer_4 = await test_channel.new_consumer(tests.empty_test_callback, {"A": 1, "B": [[1]]})
+    consumer_5 = await test_channel.new_consumer(tests.empty_test_callback, {"A": True, "B": (1,)})
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": [True]}) == [consumer_4]
+    test_channel.consumer_filters_index.strict = True
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": [True]}) == []
+    assert test_channel.get_consumer_from_filters({"A": 1, "B": [1]}) == [consumer_4]
+    assert test_channel.get_consumer_from_filters({"A": True, "B": [1]}) == []
+    assert test_channel.get_consumer_from_filters({"B": [1]}) == [consumer_4]
+    await test_channel.remove_consumer(consumer_1)
+    await test_channel.remove_consumer(consumer_2)
+    await test_channel.remove_consumer(consumer_3)
+    await test_channel.remove_consumer(consumer_4)
+    await test_channel.remove_consumer(consumer_5)
+
+
+@pytest.mark.asyncio
+async def test_get_consumer_from_filters_with_updated_consumers_list(test_channel):
+    consumer_1 = await test_channel.new_consumer(tests.empty_test_callback, {"A": 1})
+    consumer_2 = tests.EmptyTestConsumer(tests.empty_test_callback)
+    test_channel.consumers.append({"A": 1, test_channel.INSTANCE_KEY: consumer_2})
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_1, consumer_2]
+    # replacing a consumer keeps the consumers count
+    consumer_3 = tests.EmptyTestConsumer(tests.empty_test_callback)
+    test_channel.consumers[1] = {"A": 2, test_channel.INSTANCE_KEY: consumer_3}
+    assert test_channel.get_consumer_from_filters({}) == [consumer_1, consumer_3]
+    assert test_channel.get_consumer_from_filters({"A": 1}) == [consumer_1]
+    assert test_channel.get_consumer_from_filters({"A": 2}) == [consumer_3]
+    await test_channel.remove_consumer(consumer_1)
+    assert test_channel.get_consumer_from_filters({"A": 2}) == [consumer_3]
+    await test_channel.remove_consumer(consumer_3)
+    assert test_channel.get_consumer_from_filters({}) == []
+
+
+@pytest.mark.asyncio
+async def test_get_consumers_with_updated_consumers_list(test_channel):
+    consumer_1 = await test_channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value)
+    assert test_channel.get_consumers() == (consumer_1,)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == ()
+    consumer_2 = tests.EmptyTestConsumer(tests.empty_test_callback)
+    test_channel.consumers.append({"A": 1, test_channel.INSTANCE_KEY: consumer_2})
+    assert test_channel.get_consumers() == (consumer_1, consumer_2)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == (consumer_2,)
+    if not os.getenv('CYTHON_IGNORE'):
+        assert test_channel._get_non_optional_consumers_count() == 1
+    # replacing a consumer keeps the consumers count
+    consumer_3 = tests.EmptyTestConsumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value)
+    test_channel.consumers[1] = {test_channel.INSTANCE_KEY: consumer_3}
+    assert test_channel.get_consumers() == (consumer_1, consumer_3)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == ()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert test_channel._get_non_optional_consumers_count() == 0
+    test_channel.consumers = [{test_channel.INSTANCE_KEY: consumer_2}]
+    assert isinstance(test_channel.consumers, channels.ConsumersList)
+    assert test_channel.get_consumers() == (consumer_2,)
+    await test_channel.remove_consumer(consumer_2)
+    await consumer_1.stop()
+
+
+@pytest.mark.asyncio
+async def test_consumers_views_are_updated_on_subscription_changes(test_channel):
+    consumer_1 = await test_channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.HIGH.value)
+    consumer_2 = await test_channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value)
+    assert test_channel.get_consumers() is test_channel.get_consumers()
+    assert test_channel.get_consumers() == (consumer_1, consumer_2)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == (consumer_1,)
+    if not os.getenv('CYTHON_IGNORE'):
+        assert test_channel._get_non_optional_consumers_count() == 1
+    consumer_3 = await test_channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.MEDIUM.value)
+    assert test_channel.get_consumers() == (consumer_1, consumer_2, consumer_3)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == (consumer_1, consumer_3)
+    await test_channel.remove_consumer(consumer_1)
+    await test_channel.remove_consumer(consumer_3)
+    assert test_channel.get_consumers() == (consumer_2,)
+    assert test_channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == ()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert test_channel._get_non_optional_consumers_count() == 0
+    await test_channel.remove_consumer(consumer_2)
+
+
+@pytest.mark.asyncio
+async def test_new_consumers(test_channel):
+    producer = tests.EmptyTestProducer(test_channel)
+    await test_channel.register_producer(producer)
+    test_channel.is_paused = True
+    with mock.patch.object(producer, "resume", mock.AsyncMock()) as resume_mock, \
+            mock.patch.object(test_channel, "_update_consumers_views",
+                              mock.Mock(wraps=test_channel._update_consumers_views)) as update_mock:
+        consumers = await test_channel.new_consumers(
+            {"callback": tests.empty_test_callback, "consumer_filters": {"A": index}, "size": index}
+            for index in range(1, 4)
+        )
+        resume_mock.assert_called_once()
+        # producers state is computed from a single consumers views update
+        update_mock.assert_called_once()
+    assert not test_channel.is_paused
+    assert test_channel.get_consumers() == tuple(consumers)
+    assert [consumer.queue.maxsize for consumer in consumers] == [1, 2, 3]
+    assert all(consumer.consume_task is not None for consumer in consumers)
+    assert test_channel.get_consumer_from_filters({"A": 2}) == [consumers[1]]
+    internal_consumer = tests.EmptyTestConsumer(tests.empty_test_callback)
+    assert await test_channel.new_consumers([{"internal_consumer": internal_consumer}]) == [internal_consumer]
+    assert await test_channel.new_consumers([]) == []
+    await test_channel.remove_consumers(test_channel.get_consumers())
+
+
+class ExchangeFiltersTestChannel(tests.EmptyTestChannel):
+    async def _add_new_consumer(self, consumer, consumer_filters, **kwargs):
+        await super()._add_new_consumer(consumer, {"exchange": "test", **(consumer_filters or {})}, **kwargs)
+
+
+class SymbolTestChannel(tests.EmptyTestChannel):
+    async def new_consumer(self, callback=None, symbol="*", **kwargs):
+        return await super().new_consumer(callback, consumer_filters={"symbol": symbol}, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("channel_class, expected_filters", [
+    (ExchangeFiltersTestChannel, {"exchange": "test"}),
+    (SymbolTestChannel, {"symbol": "*"}),
+])
+async def test_new_consumers_uses_subclasses_hooks(channel_class, expected_filters):
+    channels.del_chan(channel_class.get_name())
+    channel = await util.create_channel_instance(channel_class, channels.set_chan)
+    consumer = await channel.new_consumer(tests.empty_test_callback)
+    bulk_consumers = await channel.new_consumers([{"callback": tests.empty_test_callback}])
+    assert channel.get_consumers() == (consumer, *bulk_consumers)
+    assert [
+        {key: value for key, value in consumer_filters.items() if key != channel.INSTANCE_KEY}
+        for consumer_filters in channel.consumers
+    ] == [expected_filters, expected_filters]
+    assert bulk_consumers[0].consume_task is not None
+    await channel.remove_consumers(channel.get_consumers())
+    await channel.stop()
+    channels.del_chan(channel_class.get_name())
+
+
+class CleanupTestChannel(tests.EmptyTestChannel):
+    def __init__(self):
+        super().__init__()
+        self.cleaned_consumers = []
+
+    async def remove_consumer(self, consumer):
+        self.cleaned_consumers.append(consumer)
+        await super().remove_consumer(consumer)
+
+
+@pytest.mark.asyncio
+async def test_remove_consumers_uses_remove_consumer_override():
+    channels.del_chan(CleanupTestChannel.get_name())
+    channel = await util.create_channel_instance(CleanupTestChannel, channels.set_chan)
+    consumers = await channel.new_consumers([{"callback": tests.empty_test_callback}] * 2)
+    await channel.remove_consumers(channel.get_consumers())
+    assert channel.cleaned_consumers == consumers
+    assert channel.get_consumers() == ()
+    assert all(consumer.should_stop for consumer in consumers)
+    await channel.stop()
+    channels.del_chan(CleanupTestChannel.get_name())
+
+
+@pytest.mark.asyncio
+async def test_remove_consumers(test_channel):
+    producer = tests.EmptyTestProducer(test_channel)
+    await test_channel.register_producer(producer)
+    consumers = [
+        await test_channel.new_consumer(tests.empty_test_callback, {"A": index})
+        for index in range(4)
+    ]
+    with mock.patch.object(producer, "pause", mock.AsyncMock()) as pause_mock:
+        await test_channel.remove_consumers([consumers[0], consumers[2], consumers[0]])
+        pause_mock.assert_not_called()
+        assert test_channel.get_consumers() == (consumers[1], consumers[3])
+        assert test_channel.get_consumer_from_filters({"A": 2}) == []
+        assert len(test_channel.consumer_filters_index) == 2
+        assert consumers[0].should_stop and consumers[2].should_stop
+        assert not consumers[1].should_stop
+
+        # not subscribed consumers are ignored
+        await test_channel.remove_consumers([consumers[0], consumers[1], consumers[3]])
+        pause_mock.assert_called_once()
+    assert test_channel.get_consumers() == ()
+    assert test_channel.is_paused
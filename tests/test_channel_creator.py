@@ -13,7 +13,9 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import copy 
+import uuid
 
 import pytest
 import async_channel.channels as channels
@@ -65,3 +67,158 @@ async def test_create_all_subclasses_channel():
     await util.create_all_subclasses_channel(TestChannelClass, channels.set_chan, is_synchronized=True)
     assert all(channels.get_chan(channel).is_synchronized for channel in channels.ChannelInstances.instance().channels)
     clean_channels()
+
+
+def test_get_subclasses():
+    class TestChannelClass(channels.Channel):
+        pass
+
+    class Test1Channel(TestChannelClass):
+        pass
+
+    class Test11Channel(Test1Channel):
+        pass
+
+    class Test2Channel(TestChannelClass):
+        pass
+
+    class Test12Channel(Test11Channel, Test2Channel):
+        pass
+
+    assert util.get_subclasses(TestChannelClass) == [Test1Channel, Test2Channel]
+    assert util.get_subclasses(TestChannelClass, recursive=True) == \
+           [Test1Channel, Test11Channel, Test12Channel, Test2Channel]
+
+
+@pytest.mark.asyncio
+async def test_create_all_subclasses_channel_concurrently():
+    started = []
+    running = []
+
+    class TestChannelClass(channels.Channel):
+        async def start(self):
+            running.append(self)
+            started.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(self)
+
+    class Test1Channel(TestChannelClass):
+        pass
+
+    class Test11Channel(Test1Channel):
+        pass
+
+    class Test2Channel(TestChannelClass):
+        pass
+
+    created_channels = await util.create_all_subclasses_channel_concurrently(
+        TestChannelClass, channels.set_chan, is_synchronized=True, recursive=True, max_concurrency=2
+    )
+    try:
+        assert [channel.__class__ for channel in created_channels] == [Test1Channel, Test11Channel, Test2Channel]
+        assert [channels.get_chan(name) for name in ("Test1", "Test11", "Test2")] == created_channels
+        assert all(channel.is_synchronized for channel in created_channels)
+        # at most 2 channels started at the same time
+        assert started == [1, 2, 1]
+    finally:
+        for name in ("Test1", "Test11", "Test2"):
+            channels.del_chan(name)
+
+
+@pytest.mark.asyncio
+async def test_create_lazy_channel_instance():
+    class TestChannel(channels.Channel):
+        pass
+
+    channels.del_chan(tests.TEST_CHANNEL)
+    lazy_channel = util.create_lazy_channel_instance(TestChannel, channels.set_chan, is_synchronized=True)
+    assert channels.ChannelInstances.instance().channels[tests.TEST_CHANNEL] is lazy_channel
+    assert channels.get_channels_by_class(TestChannel) == [lazy_channel]
+    assert lazy_channel.channel is None
+    channel = channels.get_chan(tests.TEST_CHANNEL)
+    assert isinstance(channel, TestChannel)
+    assert channel.is_synchronized
+    assert lazy_channel.channel is channel
+    assert channels.ChannelInstances.instance().channels[tests.TEST_CHANNEL] is channel
+    assert channels.get_channels_by_class(TestChannel) == [channel]
+    assert channels.get_chan(tests.TEST_CHANNEL) is channel
+    await channels.get_chan(tests.TEST_CHANNEL).stop()
+    channels.del_chan(tests.TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_create_lazy_channel_instance_at_id():
+    chan_id = uuid.uuid4().hex
+    lazy_channel = util.create_lazy_channel_instance(
+        tests.EmptyTestWithIdChannel, channels.set_chan_at_id, chan_id=chan_id, test_id=chan_id
+    )
+    consumer = await lazy_channel.new_consumer(tests.empty_test_callback)
+    channel = lazy_channel.channel
+    assert channel.chan_id == chan_id
+    assert channels.get_chan_at_id(tests.EMPTY_TEST_WITH_ID_CHANNEL, chan_id) is channel
+    assert channel.get_consumers() == (consumer,)
+    # attributes are forwarded to the built channel
+    assert lazy_channel.get_consumers() == (consumer,)
+    await lazy_channel.stop()
+    channels.del_channel_container(chan_id)
+
+
+def test_create_lazy_channel_instance_at_id_without_chan_id():
+    with pytest.raises(ValueError):
+        util.create_lazy_channel_instance(tests.EmptyTestWithIdChannel, channels.set_chan_at_id, test_id=None)
+    assert tests.EMPTY_TEST_WITH_ID_CHANNEL not in channels.ChannelInstances.instance().channels
+    assert None not in channels.ChannelInstances.instance().channels
+
+
+def test_create_lazy_channel_instance_with_start_override():
+    class TestChannel(channels.Channel):
+        async def start(self) -> None:
+            pass
+
+    channels.del_chan(tests.TEST_CHANNEL)
+    with pytest.raises(ValueError):
+        util.create_lazy_channel_instance(TestChannel, channels.set_chan)
+    assert tests.TEST_CHANNEL not in channels.ChannelInstances.instance().channels
+
+
+@pytest.mark.asyncio
+async def test_create_all_subclasses_lazy_channel():
+    class TestChannelClass(channels.Channel):
+        pass
+
+    class Test1Channel(TestChannelClass):
+        pass
+
+    class Test2Channel(TestChannelClass):
+        pass
+
+    lazy_channels = util.create_all_subclasses_lazy_channel(TestChannelClass, channels.set_chan)
+    try:
+        assert [lazy_channel.get_name() for lazy_channel in lazy_channels] == ["Test1", "Test2"]
+        # copying the registry doesn't build channels
+        copy.deepcopy(channels.ChannelInstances.instance().channels)
+        assert all(lazy_channel.channel is None for lazy_channel in lazy_channels)
+        assert isinstance(channels.get_chan("Test2"), Test2Channel)
+        assert lazy_channels[0].channel is None
+        await lazy_channels[0].stop()
+        assert lazy_channels[0].channel is None
+    finally:
+        channels.del_chan("Test1")
+        channels.del_chan("Test2")
+
+
+@pytest.mark.asyncio
+async def test_lazy_channel_metrics_snapshot():
+    class TestChannel(channels.Channel):
+        pass
+
+    channels.del_chan(tests.TEST_CHANNEL)
+    lazy_channel = util.create_lazy_channel_instance(TestChannel, channels.set_chan)
+    assert tests.TEST_CHANNEL not in channels.ChannelInstances.instance().get_metrics_snapshot()
+    assert lazy_channel.metrics is None
+    assert lazy_channel.channel is None
+    lazy_channel.enable_metrics()
+    assert lazy_channel.metrics is lazy_channel.channel.metrics
+    assert tests.TEST_CHANNEL in channels.ChannelInstances.instance().get_metrics_snapshot()
+    lazy_channel.disable_metrics()
+    channels.del_chan(tests.TEST_CHANNEL)
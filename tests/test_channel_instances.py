@@ -112,3 +112,55 @@ async def test_get_channels(chan_id):
     channels.del_channel_container(chan_id)
     channels.del_channel_container(channel_4_id)
     channels.del_channel_container(channel_6_id)
+
+
+@pytest.mark.asyncio
+async def test_get_channels_by_name_and_class(chan_id):
+    class EmptyTestWithId2Channel(tests.EmptyTestWithIdChannel):
+        pass
+
+    other_chan_id = uuid.uuid4().hex
+    ch1 = channels.get_chan_at_id(tests.EMPTY_TEST_WITH_ID_CHANNEL, chan_id)
+    ch2 = await util.create_channel_instance(tests.EmptyTestWithIdChannel, channels.set_chan_at_id, test_id=other_chan_id)
+    ch3 = await util.create_channel_instance(EmptyTestWithId2Channel, channels.set_chan_at_id, test_id=other_chan_id)
+    assert channels.get_channels_by_name(tests.EMPTY_TEST_WITH_ID_CHANNEL) == {chan_id: ch1, other_chan_id: ch2}
+    assert channels.get_channels_by_name("EmptyTestWithId2") == {other_chan_id: ch3}
+    assert channels.get_channels_by_class(EmptyTestWithId2Channel) == [ch3]
+    assert ch1 in channels.get_channels_by_class(tests.EmptyTestWithIdChannel)
+    assert ch3 in channels.get_channels_by_class(tests.EmptyTestWithIdChannel)
+
+    channels.del_chan_at_id(tests.EMPTY_TEST_WITH_ID_CHANNEL, other_chan_id)
+    assert channels.get_channels_by_name(tests.EMPTY_TEST_WITH_ID_CHANNEL) == {chan_id: ch1}
+    assert ch2 not in channels.get_channels_by_class(tests.EmptyTestWithIdChannel)
+    channels.del_channel_container(other_chan_id)
+    assert channels.get_channels_by_name("EmptyTestWithId2") == {}
+    assert channels.get_channels_by_class(EmptyTestWithId2Channel) == []
+    channels.del_channel_container(chan_id)
+    assert chan_id not in channels.get_channels_by_name(tests.EMPTY_TEST_WITH_ID_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_get_channels_by_name_without_id():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    assert channels.get_channels_by_name(tests.EMPTY_TEST_CHANNEL) == {None: channel}
+    assert channel in channels.get_channels_by_class(tests.EmptyTestChannel)
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    assert channels.get_channels_by_name(tests.EMPTY_TEST_CHANNEL) == {}
+    assert channel not in channels.get_channels_by_class(tests.EmptyTestChannel)
+
+
+@pytest.mark.asyncio
+async def test_get_channels_snapshot(chan_id):
+    snapshot = channels.get_channels_snapshot()
+    assert channels.get_channels_snapshot() is snapshot
+    assert snapshot[chan_id] == {tests.EMPTY_TEST_WITH_ID_CHANNEL: channels.get_chan_at_id(
+        tests.EMPTY_TEST_WITH_ID_CHANNEL, chan_id)}
+    with pytest.raises(TypeError):
+        snapshot[chan_id]["other"] = None
+    # iterating while unregistering channels
+    for registered_chan_id in snapshot:
+        if registered_chan_id == chan_id:
+            channels.del_channel_container(chan_id)
+    assert chan_id in snapshot
+    assert chan_id not in channels.get_channels_snapshot()
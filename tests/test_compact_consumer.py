@@ -0,0 +1,138 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.queues as queues
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    channel.disable_metrics()
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_compact_consumers_have_no_instance_dict():
+    assert not hasattr(consumers.CompactConsumer(tests.empty_test_callback), "__dict__")
+    assert not hasattr(consumers.CompactSupervisedConsumer(tests.empty_test_callback), "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_queue_and_task_created_on_first_data(test_channel):
+    received = []
+
+    async def callback(value):
+        received.append(value)
+
+    consumer = await test_channel.new_consumer(callback, size=2, consumer_class=consumers.CompactConsumer)
+    assert isinstance(consumer.queue, queues.LazyQueue)
+    assert consumer.queue.empty()
+    assert consumer.consume_task is None
+
+    await test_channel.get_internal_producer().send({"value": 1})
+    assert isinstance(consumer.queue, asyncio.Queue)
+    assert consumer.queue.maxsize == 2
+    assert consumer.consume_task is not None
+    await tests.wait_asyncio_next_cycle()
+    await test_channel.get_internal_producer().send({"value": 2})
+    await tests.wait_asyncio_next_cycle()
+    assert received == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stale_lazy_queue_reference():
+    consumer = consumers.CompactConsumer(tests.empty_test_callback)
+    lazy_queue = consumer.queue
+    lazy_queue.put_nowait({})
+    lazy_queue.put_nowait({})
+    assert consumer.queue is not lazy_queue
+    assert consumer.queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_stopped_before_first_data(test_channel):
+    consumer = await test_channel.new_consumer(tests.empty_test_callback, consumer_class=consumers.CompactConsumer)
+    await consumer.stop()
+    await test_channel.get_internal_producer().send({})
+    assert consumer.consume_task is None
+
+
+@pytest.mark.asyncio
+async def test_supervised_wait_for_processing(test_channel):
+    received = []
+
+    async def callback(value):
+        await asyncio.sleep(0)
+        received.append(value)
+
+    consumer = await test_channel.new_consumer(callback, consumer_class=consumers.CompactSupervisedConsumer)
+    producer = test_channel.get_internal_producer()
+    # nothing performed yet: returns immediately without creating the idle event
+    await consumer.join(1)
+    await producer.wait_for_processing()
+    assert consumer._idle is None
+
+    for value in range(3):
+        await producer.send({"value": value})
+    await producer.wait_for_processing()
+    assert received == [0, 1, 2]
+    assert consumer.idle.is_set()
+    assert consumer.performing_count == 0
+
+
+@pytest.mark.asyncio
+async def test_synchronized_channel(synchronized_channel):
+    received = []
+
+    async def callback(value):
+        received.append(value)
+
+    synchronized_channel.enable_metrics()
+    consumer = await synchronized_channel.new_consumer(callback, consumer_class=consumers.CompactSupervisedConsumer)
+    producer = synchronized_channel.get_internal_producer()
+    # not metered
+    assert synchronized_channel.get_metrics_snapshot()["consumers"] == []
+    assert synchronized_channel.dirty_consumers_tracker.is_dirty(consumer)
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    assert isinstance(consumer.queue, queues.LazyQueue)
+
+    await producer.send({"value": 1})
+    assert consumer.consume_task is None
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    assert received == [1]
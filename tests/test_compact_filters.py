@@ -0,0 +1,74 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.util as util
+import tests
+
+
+class CompactFiltersTestChannel(tests.EmptyTestChannel):
+    COMPACT_CONSUMER_FILTERS = True
+
+    @classmethod
+    def get_name(cls) -> str:
+        return tests.EMPTY_TEST_CHANNEL
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(CompactFiltersTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_compact_filters_mapping():
+    filters = channels.CompactFilters({"symbol": "BTC/USDT", "time_frame": "1h", "values": [1, 2]})
+    assert filters == {"symbol": "BTC/USDT", "time_frame": "1h", "values": [1, 2]}
+    assert list(filters) == ["symbol", "time_frame", "values"]
+    assert len(filters) == 3
+    assert filters["time_frame"] == "1h"
+    assert filters.get("missing") is None
+    assert "symbol" in filters
+    with pytest.raises(KeyError):
+        filters["missing"]
+    with pytest.raises(TypeError):
+        filters["symbol"] = "ETH/USDT"
+    assert repr(filters) == "CompactFilters({'symbol': 'BTC/USDT', 'time_frame': '1h', 'values': [1, 2]})"
+
+
+def test_compact_filters_sharing():
+    first = channels.CompactFilters({"symbol": "".join(["BTC", "/USDT"]), "time_frame": "1h"})
+    second = channels.CompactFilters({"symbol": "".join(["BTC", "/USDT"]), "time_frame": "4h"})
+    assert first._positions is second._positions
+    assert first["symbol"] is second["symbol"]
+    assert channels.CompactFilters({"time_frame": "1h", "symbol": "BTC/USDT"})._positions is not first._positions
+
+
+@pytest.mark.asyncio
+async def test_channel_compact_consumer_filters(test_channel):
+    btc_consumer = await test_channel.new_consumer(tests.empty_test_callback, consumer_filters={"symbol": "BTC/USDT"})
+    eth_consumer = await test_channel.new_consumer(tests.empty_test_callback, consumer_filters={"symbol": "ETH/USDT"})
+    assert all(isinstance(consumer_filters, channels.CompactFilters) for consumer_filters in test_channel.consumers)
+    assert test_channel.get_consumer_from_filters({"symbol": "BTC/USDT"}) == [btc_consumer]
+    await test_channel.remove_consumer(btc_consumer)
+    assert test_channel.get_consumer_from_filters({"symbol": "BTC/USDT"}) == []
+    assert test_channel.get_consumers() == (eth_consumer,)
@@ -0,0 +1,114 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import mock
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumer_runs_up_to_max_concurrency(test_channel):
+    release_event = asyncio.Event()
+    running = []
+    done = []
+
+    async def callback(index):
+        running.append(index)
+        await release_event.wait()
+        done.append(index)
+
+    consumer = await test_channel.new_consumer(
+        callback, consumer_class=consumers.SupervisedConcurrentConsumer, max_concurrency=3
+    )
+    producer = test_channel.get_internal_producer()
+    for index in range(5):
+        await producer.send({"index": index})
+    for _ in range(5):
+        await tests.wait_asyncio_next_cycle()
+    assert running == [0, 1, 2]
+    assert consumer.get_running_count() == 3
+    assert not consumer.idle.is_set()
+
+    release_event.set()
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert consumer.get_running_count() == 0
+    assert consumer.idle.is_set()
+
+
+@pytest.mark.asyncio
+async def test_supervised_concurrent_consumer_idle(test_channel):
+    events = [asyncio.Event(), asyncio.Event()]
+
+    async def callback(index):
+        await events[index].wait()
+
+    consumer = await test_channel.new_consumer(
+        callback, consumer_class=consumers.SupervisedConcurrentConsumer, max_concurrency=2
+    )
+    producer = test_channel.get_internal_producer()
+    await producer.send({"index": 0})
+    await producer.send({"index": 1})
+    for _ in range(3):
+        await tests.wait_asyncio_next_cycle()
+    events[0].set()
+    for _ in range(3):
+        await tests.wait_asyncio_next_cycle()
+    # idle is only set when all in flight work is done
+    assert not consumer.idle.is_set()
+    events[1].set()
+    await asyncio.wait_for(consumer.join(1), 1)
+    assert consumer.idle.is_set()
+    await asyncio.wait_for(consumer.join_queue(), 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumer_reports_exceptions_per_data(test_channel):
+    done = []
+
+    async def callback(index):
+        if index == 1:
+            raise ValueError("failing")
+        done.append(index)
+
+    consumer = await test_channel.new_consumer(
+        callback, consumer_class=consumers.SupervisedConcurrentConsumer, max_concurrency=2
+    )
+    with mock.patch.object(consumer, "_log_consume_exception", mock.Mock()) as log_mock:
+        producer = test_channel.get_internal_producer()
+        for index in range(3):
+            await producer.send({"index": index})
+        await asyncio.wait_for(producer.wait_for_processing(), 1)
+        log_mock.assert_called_once()
+        assert isinstance(log_mock.mock_calls[0].args[0], ValueError)
+    assert sorted(done) == [0, 2]
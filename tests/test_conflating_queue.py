@@ -0,0 +1,83 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+
+import async_channel.channels as channels
+import async_channel.queues as queues
+import async_channel.util as util
+import tests
+
+
+@pytest.mark.asyncio
+async def test_conflate_by_field():
+    queue = queues.ConflatingQueue("symbol")
+    await queue.put({"symbol": "BTC/USDT", "price": 1})
+    await queue.put({"symbol": "ETH/USDT", "price": 2})
+    await queue.put({"symbol": "BTC/USDT", "price": 3})
+    queue.put_nowait({"symbol": "ETH/USDT", "price": 4})
+    queue.put_nowait({"symbol": "SOL/USDT", "price": 5})
+    assert queue.qsize() == 3
+    assert queue.conflated_count == 2
+    assert [queue.get_nowait() for _ in range(3)] == [
+        {"symbol": "BTC/USDT", "price": 3},
+        {"symbol": "ETH/USDT", "price": 4},
+        {"symbol": "SOL/USDT", "price": 5},
+    ]
+    await queue.put({"symbol": "BTC/USDT", "price": 6})
+    assert queue.get_nowait() == {"symbol": "BTC/USDT", "price": 6}
+
+
+@pytest.mark.asyncio
+async def test_conflate_by_key_function():
+    queue = queues.ConflatingQueue(lambda data: (data["symbol"], data["time_frame"]))
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1h", "close": 1})
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1d", "close": 2})
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1h", "close": 3})
+    assert [queue.get_nowait()["close"] for _ in range(2)] == [3, 2]
+
+
+@pytest.mark.asyncio
+async def test_conflate_does_not_block_on_pending_key():
+    queue = queues.ConflatingQueue("symbol", maxsize=1)
+    await queue.put({"symbol": "BTC/USDT", "price": 1})
+    await asyncio.wait_for(queue.put({"symbol": "BTC/USDT", "price": 2}), 1)
+    assert queue.full()
+    assert queue.get_nowait() == {"symbol": "BTC/USDT", "price": 2}
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+
+
+@pytest.mark.asyncio
+async def test_supervised_consumer_with_conflating_queue():
+    calls = []
+
+    async def callback(symbol, price):
+        calls.append((symbol, price))
+
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    await channel.new_consumer(
+        callback, consumer_class=tests.EmptyTestSupervisedConsumer, queue=queues.ConflatingQueue("symbol")
+    )
+    producer = channel.get_internal_producer()
+    for price in range(3):
+        await producer.send({"symbol": "BTC/USDT", "price": price})
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    assert calls == [("BTC/USDT", 2)]
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
@@ -0,0 +1,44 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import async_channel.channels as channels
+
+
+def test_updates_increase_version():
+    consumers = channels.ConsumersList([{"A": 1}])
+    assert consumers == [{"A": 1}]
+    assert consumers.version == 0
+    updates = [
+        lambda: consumers.append({"A": 2}),
+        lambda: consumers.extend([{"A": 3}]),
+        lambda: consumers.insert(0, {"A": 0}),
+        lambda: consumers.__setitem__(0, {"A": -1}),
+        lambda: consumers.__setitem__(slice(0, 1), [{"A": -2}]),
+        lambda: consumers.__delitem__(0),
+        lambda: consumers.pop(),
+        lambda: consumers.remove({"A": 2}),
+        lambda: consumers.sort(key=lambda consumer_filters: consumer_filters["A"]),
+        lambda: consumers.reverse(),
+        lambda: consumers.clear(),
+    ]
+    for version, update in enumerate(updates, start=1):
+        update()
+        assert consumers.version == version
+    assert consumers == []
+    consumers += [{"A": 4}]
+    consumers *= 2
+    assert consumers == [{"A": 4}, {"A": 4}]
+    assert consumers.version == len(updates) + 2
+    assert isinstance(consumers, channels.ConsumersList)
@@ -0,0 +1,115 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_send_performs_inline(test_channel):
+    received = []
+
+    async def async_callback(value):
+        received.append(("async", value))
+
+    def sync_callback(value):
+        received.append(("sync", value))
+
+    async_consumer = await test_channel.new_consumer(async_callback, consumer_class=consumers.DirectConsumer)
+    sync_consumer = await test_channel.new_consumer(sync_callback, consumer_class=consumers.DirectConsumer)
+    assert async_consumer.consume_task is None
+    assert sync_consumer.consume_task is None
+
+    producer = test_channel.get_internal_producer()
+    await producer.send({"value": 1})
+    # performed before send returns
+    assert received == [("async", 1), ("sync", 1)]
+    assert producer.is_consumers_queue_empty(1)
+    await producer.wait_for_processing()
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_break_delivery(test_channel):
+    received = []
+
+    async def failing_callback(value):
+        raise RuntimeError(value)
+
+    async def callback(value):
+        received.append(value)
+
+    failing_consumer = await test_channel.new_consumer(failing_callback, consumer_class=consumers.DirectConsumer)
+    await test_channel.new_consumer(callback, consumer_class=consumers.DirectConsumer)
+    with mock.patch.object(failing_consumer, "_log_consume_exception", mock.Mock()) as log_mock:
+        await test_channel.get_internal_producer().send({"value": 1})
+        log_mock.assert_called_once()
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_put_nowait(test_channel):
+    received = []
+
+    async def callback(value):
+        received.append(value)
+
+    consumer = await test_channel.new_consumer(callback, consumer_class=consumers.DirectConsumer)
+    consumer.queue.put_nowait({"value": 1})
+    assert received == []
+    await tests.wait_asyncio_next_cycle()
+    assert received == [1]
+
+    await consumer.stop()
+    await consumer.queue.put({"value": 2})
+    consumer.queue.put_nowait({"value": 3})
+    await tests.wait_asyncio_next_cycle()
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_synchronized_channel_direct_consumer():
+    received = []
+
+    def callback(value):
+        received.append(value)
+
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    consumer = await channel.new_consumer(callback, consumer_class=consumers.DirectConsumer)
+    producer = channel.get_internal_producer()
+    await producer.send({"value": 1})
+    assert received == [1]
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    assert received == [1]
+    await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
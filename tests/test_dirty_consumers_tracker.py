@@ -0,0 +1,68 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import async_channel.channels as channels
+import async_channel.queues as queues
+import tests
+
+
+@pytest.mark.asyncio
+async def test_track_marks_dirty_on_put():
+    tracker = channels.DirtyConsumersTracker()
+    consumer_1 = tests.EmptyTestConsumer(None)
+    consumer_2 = tests.EmptyTestConsumer(None, priority_level=2)
+    tracker.track(consumer_1)
+    tracker.track(consumer_2)
+    assert queues.is_observed(consumer_1.queue)
+    assert tracker.get_dirty_consumers(2) == []
+
+    consumer_2.queue.put_nowait({})
+    await consumer_1.queue.put({})
+    assert tracker.is_dirty(consumer_1)
+    assert tracker.get_dirty_consumers(1) == [consumer_1]
+    assert set(tracker.get_dirty_consumers(2)) == {consumer_1, consumer_2}
+
+    consumer_1.queue.get_nowait()
+    tracker.mark_clean(consumer_1)
+    assert not tracker.is_dirty(consumer_1)
+    assert tracker.get_dirty_consumers(2) == [consumer_2]
+
+    tracker.untrack(consumer_2)
+    assert tracker.get_dirty_consumers(2) == []
+    assert not queues.is_observed(consumer_2.queue)
+    tracker.untrack_all()
+    assert tracker.tracked_consumers == {}
+    assert not queues.is_observed(consumer_1.queue)
+
+
+def test_track_already_filled_queue():
+    tracker = channels.DirtyConsumersTracker()
+    consumer = tests.EmptyTestConsumer(None)
+    consumer.queue.put_nowait({})
+    tracker.track(consumer)
+    assert tracker.get_dirty_consumers(1) == [consumer]
+
+
+def test_unobserved_consumers_are_always_dirty():
+    tracker = channels.DirtyConsumersTracker()
+    consumer = tests.EmptyTestConsumer(None, queue=queues.RingBuffer(2).create_reader())
+    tracker.track(consumer)
+    assert tracker.get_dirty_consumers(1) == [consumer]
+    tracker.mark_clean(consumer)
+    assert tracker.get_dirty_consumers(1) == [consumer]
+    tracker.untrack(consumer)
+    assert tracker.get_dirty_consumers(1) == []
@@ -0,0 +1,263 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+
+import async_channel.bridges as bridges
+import async_channel.channels as channels
+import async_channel.util as util
+import async_channel.util.journal as journal
+import async_channel.util.metrics as metrics
+import tests
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    channel.disable_recording()
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_write_and_read(tmp_path):
+    writer = util.JournalWriter(str(tmp_path), segment_size=128)
+    for index in range(10):
+        writer.write("A" if index % 2 else "B", {"index": index}, timestamp=index)
+    writer.close()
+    assert writer.written_count == 10
+    assert len(journal.get_segments_indexes(str(tmp_path))) > 1
+    records = list(util.JournalReader(str(tmp_path)))
+    assert records == [
+        util.JournalRecord(index, "A" if index % 2 else "B", {"index": index})
+        for index in range(10)
+    ]
+    assert [record.data["index"] for record in util.JournalReader(str(tmp_path)).read(channel_names=("A",))] == \
+        [1, 3, 5, 7, 9]
+
+
+def test_closed_segments_are_truncated(tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    writer.write("A", b"data")
+    writer.close()
+    segment_path = journal.get_segment_path(str(tmp_path), 0)
+    assert os.path.getsize(segment_path) < 128
+    writer.close()
+
+
+def test_large_record_segment(tmp_path):
+    writer = util.JournalWriter(str(tmp_path), segment_size=64)
+    writer.write("A", b"0" * 1000)
+    writer.write("A", b"1")
+    writer.close()
+    assert journal.get_segments_indexes(str(tmp_path)) == [0, 1]
+    assert [record.data for record in util.JournalReader(str(tmp_path))] == [b"0" * 1000, b"1"]
+
+
+def test_writer_appends_after_existing_segments(tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    writer.write("A", 1)
+    writer.close()
+    writer = util.JournalWriter(str(tmp_path))
+    writer.write("A", 2)
+    writer.close()
+    assert journal.get_segments_indexes(str(tmp_path)) == [0, 1]
+    assert [record.data for record in util.JournalReader(str(tmp_path))] == [1, 2]
+
+
+def test_read_while_writing(tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    writer.write("A", 1)
+    assert [record.data for record in util.JournalReader(str(tmp_path))] == [1]
+    writer.write("A", 2)
+    assert [record.data for record in util.JournalReader(str(tmp_path))] == [1, 2]
+    writer.close()
+
+
+def test_read_invalid_segment(tmp_path):
+    with open(journal.get_segment_path(str(tmp_path), 0), "wb") as segment_file:
+        segment_file.write(b"0" * 64)
+    with pytest.raises(ValueError):
+        list(util.JournalReader(str(tmp_path)))
+
+
+def test_read_missing_directory(tmp_path):
+    assert list(util.JournalReader(str(tmp_path / "missing"))) == []
+
+
+@pytest.mark.asyncio
+async def test_enable_and_disable_recording(synchronized_channel, tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    internal_producer = synchronized_channel.get_internal_producer()
+    producer = tests.EmptyTestProducer(synchronized_channel)
+    await synchronized_channel.register_producer(producer)
+    recorder = synchronized_channel.enable_recording(writer)
+    assert synchronized_channel.enable_recording(writer) is recorder
+    assert recorder.channel_name == tests.EMPTY_TEST_CHANNEL
+    assert recorder.producers == {internal_producer, producer}
+    assert isinstance(internal_producer, journal.RecordedProducerMixin)
+    assert internal_producer.recorder is recorder
+
+    synchronized_channel.unregister_producer(producer)
+    assert producer.__class__ is tests.EmptyTestProducer
+    assert not hasattr(producer, "recorder")
+    synchronized_channel.disable_recording()
+    assert synchronized_channel.recorder is None
+    assert not isinstance(internal_producer, journal.RecordedProducerMixin)
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_record_metered_producer(synchronized_channel, tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    producer = synchronized_channel.get_internal_producer()
+    producer_class = producer.__class__
+    channel_metrics = synchronized_channel.enable_metrics()
+    synchronized_channel.enable_recording(writer)
+    await producer.send({"index": 0})
+    synchronized_channel.disable_metrics()
+    assert not metrics.is_metered(producer)
+    assert isinstance(producer, journal.RecordedProducerMixin)
+    await producer.send({"index": 1})
+    new_channel_metrics = synchronized_channel.enable_metrics()
+    synchronized_channel.disable_recording()
+    await producer.send({"index": 2})
+    assert metrics.is_metered(producer)
+    assert not isinstance(producer, journal.RecordedProducerMixin)
+    synchronized_channel.disable_metrics()
+    assert producer.__class__ is producer_class
+    writer.close()
+    assert channel_metrics.sent_count == 1
+    assert new_channel_metrics.sent_count == 1
+    assert [record.data for record in util.JournalReader(str(tmp_path))] == [
+        (({"index": index},), {}) for index in range(2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_record_sent_data(synchronized_channel, tmp_path):
+    received = []
+
+    async def callback(index):
+        received.append(index)
+
+    writer = util.JournalWriter(str(tmp_path))
+    await synchronized_channel.new_consumer(callback)
+    synchronized_channel.enable_recording(writer, channel_name="Recorded")
+    producer = synchronized_channel.get_internal_producer()
+    for index in range(3):
+        await producer.send({"index": index})
+    synchronized_channel.disable_recording()
+    await producer.send({"index": 3})
+    writer.close()
+    await producer.synchronized_perform_consumers_queue(1, False, 0)
+    assert received == [0, 1, 2, 3]
+    records = list(util.JournalReader(str(tmp_path)))
+    assert [record.channel_name for record in records] == ["Recorded"] * 3
+    assert [record.data for record in records] == [(({"index": index},), {}) for index in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_record_unpicklable_data(synchronized_channel, tmp_path):
+    received = []
+
+    async def callback(index):
+        received.append(index)
+
+    writer = util.JournalWriter(str(tmp_path))
+    await synchronized_channel.new_consumer(callback)
+    recorder = synchronized_channel.enable_recording(writer)
+    await synchronized_channel.get_internal_producer().send({"index": lambda: None})
+    writer.close()
+    assert recorder.failed_count == 1
+    assert list(util.JournalReader(str(tmp_path))) == []
+
+
+@pytest.mark.asyncio
+async def test_replay_in_synchronized_channel(synchronized_channel, tmp_path):
+    writer = util.JournalWriter(str(tmp_path), segment_size=256)
+    for index in range(20):
+        writer.write(tests.EMPTY_TEST_CHANNEL, (({"index": index},), {}), timestamp=index)
+        writer.write("Other", (({"index": -1},), {}), timestamp=index)
+    writer.close()
+    performed = []
+
+    async def first_callback(index):
+        performed.append(("first", index))
+
+    async def second_callback(index):
+        performed.append(("second", index))
+
+    await synchronized_channel.new_consumer(first_callback)
+    await synchronized_channel.new_consumer(second_callback)
+    replay_producer = bridges.JournalReplayProducer(synchronized_channel, util.JournalReader(str(tmp_path)))
+    await replay_producer.run()
+    assert await replay_producer.replay() == 20
+    assert replay_producer.replayed_count == 20
+    assert performed == [(name, index) for index in range(20) for name in ("first", "second")]
+
+
+@pytest.mark.asyncio
+async def test_replay_in_recording_channel(synchronized_channel, tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    recorder = synchronized_channel.enable_recording(writer)
+    internal_producer = synchronized_channel.get_internal_producer()
+    for index in range(3):
+        await internal_producer.send({"index": index})
+    writer.flush()
+    performed = []
+
+    async def callback(index):
+        performed.append(index)
+
+    await synchronized_channel.new_consumer(callback)
+    replay_producer = bridges.JournalReplayProducer(synchronized_channel, util.JournalReader(str(tmp_path)))
+    assert await replay_producer.replay() == 3
+    assert performed == [0, 1, 2]
+    # replayed data are not recorded again and the internal producer is recorded after replaying
+    assert writer.written_count == 3
+    assert internal_producer in recorder.producers
+    await internal_producer.send({"index": 3})
+    writer.close()
+    assert writer.written_count == 4
+
+
+@pytest.mark.asyncio
+async def test_replay_speed(synchronized_channel, tmp_path):
+    writer = util.JournalWriter(str(tmp_path))
+    for index in range(3):
+        writer.write(tests.EMPTY_TEST_CHANNEL, (({"index": index},), {}), timestamp=100 + index)
+    writer.close()
+    performed = []
+
+    async def callback(index):
+        performed.append(index)
+
+    await synchronized_channel.new_consumer(callback)
+    replay_producer = bridges.JournalReplayProducer(
+        synchronized_channel, util.JournalReader(str(tmp_path)), speed=20
+    )
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    assert await replay_producer.replay() == 3
+    assert loop.time() - started_at >= 0.09
+    assert performed == [0, 1, 2]
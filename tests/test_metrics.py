@@ -0,0 +1,151 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import async_channel.util.metrics as metrics
+import tests
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    channel.disable_metrics()
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_histogram():
+    histogram = util.Histogram()
+    assert histogram.snapshot() == {"count": 0, "mean": 0, "max": 0, "p50": 0, "p99": 0}
+    for _ in range(99):
+        histogram.record(0.000003)
+    histogram.record(0.5)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["max"] == 0.5
+    assert snapshot["p50"] == 0.000004
+    assert snapshot["p99"] == 0.000004
+    assert histogram.percentile(100) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_by_default(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    assert synchronized_channel.metrics is None
+    assert synchronized_channel.get_metrics_snapshot() is None
+    assert not metrics.is_metered(consumer)
+    assert not metrics.is_metered(consumer.queue)
+    assert not metrics.is_metered(producer)
+    assert channels.ChannelInstances.instance().get_metrics_snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_enable_and_disable_metrics(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    consumer_class = consumer.__class__
+    synchronized_channel.enable_metrics()
+    assert metrics.is_metered(consumer)
+    assert metrics.is_metered(consumer.queue)
+    assert metrics.is_metered(producer)
+    assert isinstance(consumer, consumer_class)
+    assert str(consumer) == f"{consumer_class.__name__} with callback: empty_test_callback"
+
+    synchronized_channel.disable_metrics()
+    assert consumer.__class__ is consumer_class
+    assert consumer.queue.__class__ is asyncio.Queue
+    assert not metrics.is_metered(producer)
+    assert not hasattr(consumer, "metrics")
+
+
+@pytest.mark.asyncio
+async def test_metrics_snapshot(synchronized_channel):
+    synchronized_channel.enable_metrics()
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    for _ in range(3):
+        await producer.send({})
+    snapshot = synchronized_channel.get_metrics_snapshot()
+    assert snapshot["name"] == tests.EMPTY_TEST_CHANNEL
+    assert snapshot["sent_count"] == 3
+    assert snapshot["consumed_count"] == 0
+    assert snapshot["queue_depth"] == 3
+    assert snapshot["consumers"][0]["peak_queue_depth"] == 3
+
+    await producer.synchronized_perform_consumers_queue(
+        async_channel.ChannelConsumerPriorityLevels.HIGH.value, True, 1
+    )
+    snapshot = synchronized_channel.get_metrics_snapshot()
+    assert snapshot["consumed_count"] == 3
+    assert snapshot["queue_depth"] == 0
+    consumer_snapshot = snapshot["consumers"][0]
+    assert consumer_snapshot["consumer"] == str(consumer)
+    assert consumer_snapshot["peak_queue_depth"] == 3
+    assert consumer_snapshot["dwell_time"]["count"] == 3
+    assert consumer_snapshot["callback_time"]["count"] == 3
+    assert channels.ChannelInstances.instance().get_metrics_snapshot() == {
+        tests.EMPTY_TEST_CHANNEL: snapshot
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_exceptions_count(synchronized_channel):
+    async def failing_callback():
+        raise ValueError("failing")
+
+    synchronized_channel.enable_metrics()
+    consumer = await synchronized_channel.new_consumer(failing_callback)
+    await consumer.queue.put({})
+    with pytest.raises(ValueError):
+        await consumer.perform(consumer.queue.get_nowait())
+    assert synchronized_channel.get_metrics_snapshot()["exceptions_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_batch_consumer(synchronized_channel):
+    async def batch_callback(batch):
+        pass
+
+    synchronized_channel.enable_metrics()
+    consumer = await synchronized_channel.new_consumer(
+        batch_callback, consumer_class=consumers.BatchConsumer
+    )
+    await consumer.perform_batch([{}, {}])
+    assert synchronized_channel.get_metrics_snapshot()["consumed_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_removed_consumer(synchronized_channel):
+    synchronized_channel.enable_metrics()
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    await consumer.perform({})
+    await synchronized_channel.remove_consumer(consumer)
+    assert consumer.__class__ is tests.EmptyTestConsumer
+    snapshot = synchronized_channel.get_metrics_snapshot()
+    assert snapshot["consumed_count"] == 1
+    assert snapshot["consumers"] == []
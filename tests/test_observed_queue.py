@@ -0,0 +1,68 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import async_channel.queues as queues
+
+
+def test_observe_put_and_get():
+    queue = asyncio.Queue()
+    calls = []
+
+    def put_observer():
+        calls.append(("put", queue.qsize()))
+
+    def get_observer():
+        calls.append(("get", queue.qsize()))
+
+    assert queues.observe_put(queue, put_observer)
+    assert queues.observe_get(queue, get_observer)
+    assert queues.is_observed(queue)
+    queue.put_nowait(1)
+    assert queue.get_nowait() == 1
+    assert calls == [("put", 1), ("get", 0)]
+
+    queues.unobserve_get(queue, get_observer)
+    queue.put_nowait(2)
+    queue.get_nowait()
+    assert calls == [("put", 1), ("get", 0), ("put", 1)]
+    queues.unobserve_put(queue, put_observer)
+    assert not queues.is_observed(queue)
+    assert "_put" not in vars(queue)
+
+
+def test_observers_removing_themselves():
+    queue = asyncio.Queue()
+    calls = []
+
+    def first_observer():
+        calls.append("first")
+        queues.unobserve_put(queue, first_observer)
+
+    def second_observer():
+        calls.append("second")
+
+    queues.observe_put(queue, first_observer)
+    queues.observe_put(queue, second_observer)
+    queue.put_nowait(1)
+    queue.put_nowait(2)
+    assert calls == ["first", "second", "second"]
+
+
+def test_only_asyncio_queues_can_be_observed():
+    reader = queues.RingBuffer(2).create_reader()
+    assert not queues.observe_put(reader, lambda: None)
+    assert not queues.is_observed(reader)
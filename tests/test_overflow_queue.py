@@ -0,0 +1,93 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel
+import async_channel.channels as channels
+import async_channel.queues as queues
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    queue = queues.OverflowQueue(2, async_channel.QueueOverflowPolicies.DROP_OLDEST)
+    for index in range(4):
+        await queue.put(index)
+    assert queue.dropped_count == 2
+    assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+    queue.task_done()
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+
+
+@pytest.mark.asyncio
+async def test_drop_newest():
+    queue = queues.OverflowQueue(2, async_channel.QueueOverflowPolicies.DROP_NEWEST)
+    for index in range(4):
+        await queue.put(index)
+    assert queue.dropped_count == 2
+    assert [queue.get_nowait(), queue.get_nowait()] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_raise():
+    queue = queues.OverflowQueue(1, async_channel.QueueOverflowPolicies.RAISE)
+    await queue.put(0)
+    with pytest.raises(asyncio.QueueFull):
+        await queue.put(1)
+    assert queue.dropped_count == 1
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_block():
+    queue = queues.OverflowQueue(1, async_channel.QueueOverflowPolicies.BLOCK)
+    await queue.put(0)
+    put_task = asyncio.create_task(queue.put(1))
+    await tests.wait_asyncio_next_cycle()
+    assert not put_task.done()
+    assert queue.get_nowait() == 0
+    await asyncio.wait_for(put_task, 1)
+    assert queue.dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_producer_does_not_block_on_full_consumer_queue(synchronized_channel):
+    full_consumer = await synchronized_channel.new_consumer(
+        tests.empty_test_callback,
+        queue=queues.OverflowQueue(1, async_channel.QueueOverflowPolicies.RAISE),
+        priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
+    )
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    for _ in range(3):
+        await asyncio.wait_for(producer.send({}), 1)
+    assert full_consumer.queue.qsize() == 1
+    assert full_consumer.queue.dropped_count == 2
+    assert consumer.queue.qsize() == 3
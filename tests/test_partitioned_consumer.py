@@ -0,0 +1,106 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_partitioned_consumer_requires_partition_key():
+    with pytest.raises(ValueError):
+        consumers.PartitionedConsumer(tests.empty_test_callback)
+
+
+@pytest.mark.asyncio
+async def test_partitioned_consumer_keeps_key_order(test_channel):
+    received = {"BTC": [], "ETH": []}
+
+    async def callback(symbol, index):
+        await asyncio.sleep(0.001 * (3 - index % 3))
+        received[symbol].append(index)
+
+    await test_channel.new_consumer(
+        callback,
+        consumer_class=consumers.SupervisedPartitionedConsumer,
+        partition_key="symbol",
+        partitions_count=4,
+    )
+    producer = test_channel.get_internal_producer()
+    for index in range(10):
+        await producer.send({"symbol": "BTC", "index": index})
+        await producer.send({"symbol": "ETH", "index": index})
+    await asyncio.wait_for(producer.wait_for_processing(), 2)
+    assert received == {"BTC": list(range(10)), "ETH": list(range(10))}
+
+
+@pytest.mark.asyncio
+async def test_partitioned_consumer_processes_keys_concurrently(test_channel):
+    blocked_key_event = asyncio.Event()
+    received = []
+
+    async def callback(key):
+        if key == 0:
+            await blocked_key_event.wait()
+        received.append(key)
+
+    consumer = await test_channel.new_consumer(
+        callback,
+        consumer_class=consumers.SupervisedPartitionedConsumer,
+        partition_key=lambda data: data["key"],
+        partitions_count=2,
+    )
+    producer = test_channel.get_internal_producer()
+    await producer.send({"key": 0})
+    await producer.send({"key": 0})
+    await producer.send({"key": 1})
+    for _ in range(5):
+        await tests.wait_asyncio_next_cycle()
+    assert received == [1]
+    assert consumer.get_partitions_queue_depth() == [1, 0]
+    assert not consumer.idle.is_set()
+
+    blocked_key_event.set()
+    await asyncio.wait_for(producer.wait_for_processing(), 1)
+    assert received == [1, 0, 0]
+    assert consumer.get_partitions_queue_depth() == [0, 0]
+    assert consumer.idle.is_set()
+
+
+@pytest.mark.asyncio
+async def test_partitioned_consumer_partitions(test_channel):
+    consumer = await test_channel.new_consumer(
+        tests.empty_test_callback,
+        consumer_class=consumers.SupervisedPartitionedConsumer,
+        partition_key="symbol",
+    )
+    assert consumer.get_partition_index({"symbol": "BTC"}) == consumer.get_partition_index({"symbol": "BTC"})
+    assert len(consumer.partitions) == len(consumer.partition_tasks) == 8
@@ -0,0 +1,138 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumer as channel_consumer
+import async_channel.enums as enums
+import async_channel.util as util
+import tests
+
+HIGH = enums.ChannelConsumerPriorityLevels.HIGH.value
+MEDIUM = enums.ChannelConsumerPriorityLevels.MEDIUM.value
+OPTIONAL = enums.ChannelConsumerPriorityLevels.OPTIONAL.value
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+async def wait_for_turns(dispatcher, priority_levels):
+    granted = []
+
+    async def wait_for_turn(priority_level):
+        await dispatcher.acquire(priority_level)
+        granted.append(priority_level)
+
+    tasks = [asyncio.create_task(wait_for_turn(priority_level)) for priority_level in priority_levels]
+    await tests.wait_asyncio_next_cycle()
+    for _ in priority_levels:
+        dispatcher.release()
+        await tests.wait_asyncio_next_cycle()
+    await asyncio.gather(*tasks)
+    return granted
+
+
+@pytest.mark.asyncio
+async def test_highest_priority_waiting_consumer_is_served_first():
+    dispatcher = channels.PriorityDispatcher(max_running=1)
+    await dispatcher.acquire(HIGH)
+    assert dispatcher.running_count == 1
+    assert await wait_for_turns(dispatcher, [OPTIONAL, MEDIUM, HIGH]) == [HIGH, MEDIUM, OPTIONAL]
+    assert dispatcher.running_count == 1
+    assert dispatcher.get_waiting_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_lower_priority_levels_do_not_starve():
+    dispatcher = channels.PriorityDispatcher(max_running=1, weights=(2, 1))
+    await dispatcher.acquire(HIGH)
+    assert await wait_for_turns(dispatcher, [HIGH] * 5 + [OPTIONAL] * 2) == [
+        HIGH, HIGH, OPTIONAL, HIGH, HIGH, OPTIONAL, HIGH
+    ]
+    assert dispatcher.get_weight(OPTIONAL) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiting_consumer():
+    dispatcher = channels.PriorityDispatcher(max_running=1)
+    await dispatcher.acquire(HIGH)
+    waiting_task = asyncio.create_task(dispatcher.acquire(OPTIONAL))
+    await tests.wait_asyncio_next_cycle()
+    assert dispatcher.get_waiting_count(OPTIONAL) == 1
+    waiting_task.cancel()
+    await tests.wait_asyncio_next_cycle()
+    assert dispatcher.get_waiting_count() == 0
+
+    # turn given then cancelled before running: the turn is released
+    granted_task = asyncio.create_task(dispatcher.acquire(OPTIONAL))
+    await tests.wait_asyncio_next_cycle()
+    dispatcher.release()
+    granted_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await granted_task
+    assert dispatcher.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_channel_priority_dispatch(test_channel):
+    release_event = asyncio.Event()
+    performed = []
+
+    async def high_callback(index):
+        performed.append(("high", index))
+
+    async def optional_callback(index):
+        performed.append(("optional", index))
+        await release_event.wait()
+
+    dispatcher = test_channel.enable_priority_dispatch(max_running=1)
+    optional_consumer = await test_channel.new_consumer(
+        optional_callback, priority_level=OPTIONAL, consumer_class=channel_consumer.Consumer
+    )
+    assert optional_consumer.dispatcher is dispatcher
+    producer = test_channel.get_internal_producer()
+    await optional_consumer.queue.put({"index": 0})
+    await tests.wait_asyncio_next_cycle()
+    # the optional consumer is running: every other perform call waits for a turn
+    high_consumer = await test_channel.new_consumer(high_callback, consumer_class=channel_consumer.Consumer)
+    await producer.send({"index": 1})
+    await producer.send({"index": 2})
+    for _ in range(3):
+        await tests.wait_asyncio_next_cycle()
+    assert performed == [("optional", 0)]
+
+    release_event.set()
+    for _ in range(10):
+        await tests.wait_asyncio_next_cycle()
+    # the waiting high priority consumer gets the next turn
+    assert performed == [("optional", 0), ("high", 1), ("optional", 1), ("high", 2), ("optional", 2)]
+
+    await test_channel.remove_consumer(high_consumer)
+    assert high_consumer.dispatcher is None
+    test_channel.disable_priority_dispatch()
+    assert test_channel.dispatcher is None
+    assert optional_consumer.dispatcher is None
@@ -0,0 +1,159 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+def square(value):
+    return value * value
+
+
+def sleep_then_return(value, delay):
+    time.sleep(delay)
+    return value
+
+
+def describe_payload(payload):
+    return type(payload).__name__, len(payload), payload[0], payload[-1]
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest_asyncio.fixture
+async def executor():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as process_pool:
+        yield process_pool
+
+
+@pytest.mark.asyncio
+async def test_process_pool_consumer_results(test_channel, executor):
+    results = []
+
+    async def result_callback(result):
+        results.append(result)
+
+    consumer = await test_channel.new_consumer(
+        square,
+        consumer_class=consumers.SupervisedProcessPoolConsumer,
+        result_callback=result_callback,
+        executor=executor,
+    )
+    producer = test_channel.get_internal_producer()
+    for value in range(5):
+        await producer.send({"value": value})
+    await asyncio.wait_for(producer.wait_for_processing(), 10)
+    await consumer.join(1)
+    assert results == [0, 1, 4, 9, 16]
+    assert consumer.in_flight_count == 0
+    assert consumer.idle.is_set()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_consumer_ordered(test_channel, executor):
+    results = []
+
+    async def result_callback(result):
+        results.append(result)
+
+    await test_channel.new_consumer(
+        sleep_then_return,
+        consumer_class=consumers.SupervisedProcessPoolConsumer,
+        result_callback=result_callback,
+        executor=executor,
+        max_in_flight=2,
+    )
+    producer = test_channel.get_internal_producer()
+    await producer.send({"value": 0, "delay": 0.3})
+    await producer.send({"value": 1, "delay": 0})
+    await asyncio.wait_for(producer.wait_for_processing(), 10)
+    assert results == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_consumer_unordered(test_channel, executor):
+    results = []
+
+    async def result_callback(result):
+        results.append(result)
+
+    await test_channel.new_consumer(
+        sleep_then_return,
+        consumer_class=consumers.SupervisedProcessPoolConsumer,
+        result_callback=result_callback,
+        executor=executor,
+        max_in_flight=2,
+        ordered=False,
+    )
+    producer = test_channel.get_internal_producer()
+    await producer.send({"value": 0, "delay": 0.3})
+    await producer.send({"value": 1, "delay": 0})
+    await asyncio.wait_for(producer.wait_for_processing(), 10)
+    assert results == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_consumer_in_flight_limit(test_channel, executor):
+    in_flight_counts = []
+    consumer = None
+
+    async def result_callback(_):
+        in_flight_counts.append(consumer.in_flight_count)
+
+    consumer = await test_channel.new_consumer(
+        square,
+        consumer_class=consumers.SupervisedProcessPoolConsumer,
+        result_callback=result_callback,
+        executor=executor,
+        max_in_flight=1,
+    )
+    producer = test_channel.get_internal_producer()
+    for value in range(3):
+        await producer.send({"value": value})
+    await asyncio.wait_for(producer.wait_for_processing(), 10)
+    assert in_flight_counts == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_consumer_shared_memory(executor):
+    results = []
+
+    async def result_callback(result):
+        results.append(result)
+
+    consumer = consumers.ProcessPoolConsumer(
+        describe_payload, result_callback=result_callback, executor=executor, shared_memory_threshold=16
+    )
+    await consumer.perform({"payload": b"\x01" + bytes(30) + b"\x02"})
+    await consumer.perform({"payload": b"\x03\x04"})
+    assert results == [("memoryview", 32, 1, 2), ("bytes", 2, 3, 4)]
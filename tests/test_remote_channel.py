@@ -0,0 +1,270 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import os
+import stat
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+import async_channel
+import async_channel.bridges as bridges
+import async_channel.channels as channels
+import async_channel.producer as channel_producer
+import async_channel.queues as queues
+import async_channel.util as util
+import tests
+
+
+UNPICKLED = []
+
+
+def mark_unpickled():
+    UNPICKLED.append(True)
+
+
+class UnpickledMarker:
+    def __reduce__(self):
+        return mark_unpickled, ()
+
+
+class FilteredTestProducer(channel_producer.Producer):
+    async def send(self, data):
+        for consumer in self.channel.get_consumer_from_filters({"symbol": data["symbol"]}):
+            await consumer.queue.put(data)
+
+    async def pause(self):
+        pass
+
+    async def resume(self):
+        pass
+
+
+class FilteredTestChannel(channels.Channel):
+    PRODUCER_CLASS = FilteredTestProducer
+    CONSUMER_CLASS = tests.EmptyTestConsumer
+
+
+async def _wait_for(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+@pytest.fixture
+def socket_path():
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "channels.sock")
+
+
+@pytest_asyncio.fixture
+async def server_channel():
+    channels.del_chan(FilteredTestChannel.get_name())
+    channel = await util.create_channel_instance(FilteredTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(FilteredTestChannel.get_name())
+
+
+@pytest_asyncio.fixture
+async def server(socket_path, server_channel):
+    channel_server = bridges.ChannelServer(socket_path, [FilteredTestChannel.get_name()])
+    await channel_server.start()
+    yield channel_server
+    await channel_server.stop()
+
+
+@pytest_asyncio.fixture
+async def remote_channel(socket_path, server):
+    channel = bridges.RemoteChannel(socket_path, FilteredTestChannel.get_name(), reconnect_delay=0.01)
+    await channel.connect()
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+
+
+@pytest.mark.asyncio
+async def test_remote_consumer_receives_matching_data(remote_channel, server_channel):
+    received = []
+
+    async def callback(symbol, price):
+        received.append((symbol, price))
+
+    await remote_channel.new_consumer(callback, consumer_filters={"symbol": "BTC"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 1)
+    assert not remote_channel.is_paused
+    producer = server_channel.get_internal_producer()
+    await producer.send({"symbol": "ETH", "price": 1})
+    await producer.send({"symbol": "BTC", "price": 2})
+    await _wait_for(lambda: received)
+    await asyncio.sleep(0.05)
+    assert received == [("BTC", 2)]
+
+
+@pytest.mark.asyncio
+async def test_remote_consumers_share_data(remote_channel, server_channel):
+    received = []
+
+    async def callback(symbol, price):
+        received.append(price)
+
+    await remote_channel.new_consumer(callback, consumer_filters={"symbol": "BTC"})
+    await remote_channel.new_consumer(callback, consumer_filters={"symbol": "*"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 2)
+    await server_channel.get_internal_producer().send({"symbol": "BTC", "price": 3})
+    await _wait_for(lambda: len(received) == 2)
+    assert received == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_remote_consumer_removal_unsubscribes(remote_channel, server_channel):
+    consumer = await remote_channel.new_consumer(tests.empty_test_callback, consumer_filters={"symbol": "BTC"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 1)
+    await remote_channel.remove_consumer(consumer)
+    await _wait_for(lambda: not server_channel.get_consumers())
+    assert remote_channel.subscriptions_filters == {}
+
+
+@pytest.mark.asyncio
+async def test_frames_are_coalesced_per_tick(remote_channel, server_channel):
+    await remote_channel.new_consumer(tests.empty_test_callback, consumer_filters={"symbol": "BTC"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 1)
+    connection = server_channel.get_consumers()[0].connection
+    writes = []
+    original_write = connection.writer.write
+
+    def counting_write(data):
+        writes.append(data)
+        original_write(data)
+
+    connection.writer.write = counting_write
+    for price in range(3):
+        connection.send_data(0, {"symbol": "BTC", "price": price})
+    await tests.wait_asyncio_next_cycle()
+    assert len(writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_remote_channel_reconnects(socket_path, server, remote_channel, server_channel):
+    received = []
+
+    async def callback(symbol, price):
+        received.append(price)
+
+    await remote_channel.new_consumer(callback, consumer_filters={"symbol": "BTC"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 1)
+    await server.stop()
+    await _wait_for(lambda: remote_channel.is_paused)
+    assert not server_channel.get_consumers()
+
+    await server.start()
+    await _wait_for(lambda: not remote_channel.is_paused)
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 1)
+    await server_channel.get_internal_producer().send({"symbol": "BTC", "price": 4})
+    await _wait_for(lambda: received == [4])
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_unexposed_channel(socket_path, server):
+    channel = bridges.RemoteChannel(socket_path, "Unexposed", reconnect_delay=0.01)
+    await channel.connect()
+    consumer = await channel.new_consumer(tests.empty_test_callback)
+    await asyncio.sleep(0.05)
+    assert channel.get_internal_producer().is_connected
+    await channel.remove_consumer(consumer)
+    await channel.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_socket_permissions(socket_path, server):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    # the process umask is restored
+    umask = os.umask(0o022)
+    os.umask(umask)
+    assert umask != bridges.remote_channel.SOCKET_UMASK
+
+
+@pytest.mark.asyncio
+async def test_server_does_not_unpickle_client_messages(socket_path, server, server_channel):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(bridges.encode_frame(("subscribe", 0, FilteredTestChannel.get_name(), UnpickledMarker())))
+    await writer.drain()
+    assert await asyncio.wait_for(reader.read(), 1) == b""
+    assert UNPICKLED == []
+    assert not server_channel.get_consumers()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_server_closes_connection_on_invalid_subscription(socket_path, server, server_channel):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(bridges.encode_json_frame(["subscribe", 0, FilteredTestChannel.get_name(), "symbol"]))
+    await writer.drain()
+    assert await asyncio.wait_for(reader.read(), 1) == b""
+    assert not server_channel.get_consumers()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_server_closes_connection_on_too_large_frame(socket_path, server, server_channel):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(bridges.framing.FRAME_HEADER.pack(server.max_frame_size + 1))
+    await writer.drain()
+    assert await asyncio.wait_for(reader.read(), 1) == b""
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_server_renews_subscription_with_the_same_id(socket_path, server, server_channel):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    for symbol in ("BTC", "ETH"):
+        writer.write(bridges.encode_json_frame(["subscribe", 0, FilteredTestChannel.get_name(), {"symbol": symbol}]))
+        await writer.drain()
+        await _wait_for(lambda: len(server_channel.get_consumer_from_filters({"symbol": symbol})) == 1)
+    assert len(server_channel.get_consumers()) == 1
+    writer.close()
+    await _wait_for(lambda: not server_channel.get_consumers())
+
+
+@pytest.mark.asyncio
+async def test_remote_consumer_full_queue_drops_data(remote_channel, server_channel):
+    received = []
+
+    async def callback(symbol, price):
+        received.append(price)
+
+    metrics = remote_channel.enable_metrics()
+    full_consumer = await remote_channel.new_consumer(
+        tests.empty_test_callback,
+        consumer_filters={"symbol": "BTC"},
+        queue=queues.OverflowQueue(1, async_channel.QueueOverflowPolicies.RAISE),
+    )
+    await full_consumer.stop()
+    await remote_channel.new_consumer(callback, consumer_filters={"symbol": "BTC"})
+    await _wait_for(lambda: len(server_channel.get_consumers()) == 2)
+    for price in range(3):
+        await server_channel.get_internal_producer().send({"symbol": "BTC", "price": price})
+    await _wait_for(lambda: len(received) == 3)
+    assert full_consumer.queue.dropped_count == 2
+    assert remote_channel.get_internal_producer().is_connected
+    assert metrics.sent_count == 3
+    remote_channel.disable_metrics()
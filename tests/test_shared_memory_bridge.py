@@ -0,0 +1,195 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import pytest
+import pytest_asyncio
+
+import async_channel.bridges as bridges
+import async_channel.channels as channels
+import async_channel.util as util
+import tests
+
+BRIDGED_TEST_CHANNEL = "BridgedTest"
+ATTACH_FROM_ANOTHER_INTERPRETER = """
+import sys
+import async_channel.bridges as bridges
+ring = bridges.SharedMemoryRing.attach(sys.argv[1])
+ring.write([bridges.encode_frame({"index": 0})])
+ring.close()
+"""
+
+
+class BridgedTestChannel(channels.Channel):
+    PRODUCER_CLASS = bridges.SharedMemoryBridgeProducer
+    CONSUMER_CLASS = tests.EmptyTestConsumer
+
+
+def write_in_bridged_channel(ring_name, data_count):
+    asyncio.run(_write_in_bridged_channel(ring_name, data_count))
+
+
+async def _write_in_bridged_channel(ring_name, data_count):
+    ring = bridges.SharedMemoryRing.attach(ring_name)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    consumer = await channel.new_consumer(consumer_class=bridges.SharedMemoryBridgeConsumer, ring=ring)
+    producer = channel.get_internal_producer()
+    for index in range(data_count):
+        await producer.send({"index": index})
+    while consumer.written_count < data_count:
+        await asyncio.sleep(0.01)
+    await channel.stop()
+    ring.close()
+
+
+@pytest.fixture
+def ring():
+    shared_ring = bridges.SharedMemoryRing.create(256)
+    yield shared_ring
+    shared_ring.close()
+
+
+@pytest_asyncio.fixture
+async def bridged_channels(ring):
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channels.del_chan(BRIDGED_TEST_CHANNEL)
+    source_channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    bridged_channel = await util.create_channel_instance(BridgedTestChannel, channels.set_chan)
+    bridge_producer = bridges.SharedMemoryBridgeProducer(bridged_channel, ring)
+    await bridge_producer.run()
+    yield source_channel, bridged_channel
+    for channel in (source_channel, bridged_channel):
+        for consumer in channel.get_consumers():
+            await channel.remove_consumer(consumer)
+        await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channels.del_chan(BRIDGED_TEST_CHANNEL)
+
+
+def test_frame_decoder():
+    decoder = bridges.FrameDecoder()
+    frames = bridges.encode_frame({"a": 1}) + bridges.encode_frame([2, 3])
+    assert decoder.feed(frames[:3]) == []
+    payloads = decoder.feed(frames[3:-1])
+    assert [bridges.decode_payload(payload) for payload in payloads] == [{"a": 1}]
+    assert decoder.get_pending_size() > 0
+    assert [bridges.decode_payload(payload) for payload in decoder.feed(frames[-1:])] == [[2, 3]]
+    assert decoder.get_pending_size() == 0
+
+
+def test_frame_decoder_max_frame_size():
+    decoder = bridges.FrameDecoder(max_frame_size=16)
+    assert len(decoder.feed(bridges.encode_frame(1))) == 1
+    with pytest.raises(ValueError):
+        decoder.feed(bridges.encode_frame("x" * 32)[:4])
+
+
+def test_ring_wraps_around(ring):
+    reader = bridges.SharedMemoryRing.attach(ring.name)
+    try:
+        data = [{"index": index, "payload": "x" * 40} for index in range(20)]
+        received = []
+        frames = [bridges.encode_frame(element) for element in data]
+        while frames:
+            written_count = ring.write(frames)
+            assert written_count
+            frames = frames[written_count:]
+            received += [bridges.decode_payload(payload) for payload in reader.read()]
+        assert received == data
+        assert ring.get_used_size() == 0
+        assert reader.read() == []
+    finally:
+        reader.close()
+
+
+def test_ring_attached_from_another_interpreter(ring):
+    # a separate interpreter doesn't share the owner resource tracker
+    attaching_process = subprocess.run(
+        [sys.executable, "-c", ATTACH_FROM_ANOTHER_INTERPRETER, ring.name],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert attaching_process.returncode == 0, attaching_process.stderr
+    assert "leaked" not in attaching_process.stderr
+    reader = bridges.SharedMemoryRing.attach(ring.name)
+    try:
+        assert [bridges.decode_payload(payload) for payload in reader.read()] == [{"index": 0}]
+    finally:
+        reader.close()
+
+
+def test_ring_full(ring):
+    frame = bridges.encode_frame("x" * 100)
+    assert ring.write([frame, frame, frame]) == 2
+    with pytest.raises(ValueError):
+        ring.write([bridges.encode_frame("x" * 300)])
+
+
+@pytest.mark.asyncio
+async def test_bridge_sends_to_bridged_channel_consumers(bridged_channels, ring):
+    source_channel, bridged_channel = bridged_channels
+    received = []
+
+    async def callback(index, payload):
+        received.append(index)
+
+    await source_channel.new_consumer(consumer_class=bridges.SharedMemoryBridgeConsumer, ring=ring)
+    await bridged_channel.new_consumer(callback)
+    producer = source_channel.get_internal_producer()
+    for index in range(30):
+        await producer.send({"index": index, "payload": "x" * 40})
+    for _ in range(100):
+        if len(received) == 30:
+            break
+        await asyncio.sleep(0.01)
+    assert received == list(range(30))
+
+
+@pytest.mark.asyncio
+async def test_bridge_producer_does_not_read_when_paused(bridged_channels, ring):
+    _, bridged_channel = bridged_channels
+    ring.write([bridges.encode_frame({})])
+    await asyncio.sleep(0.05)
+    assert bridged_channel.is_paused
+    assert ring.get_used_size() > 0
+
+
+@pytest.mark.asyncio
+async def test_bridge_from_another_process(bridged_channels, ring):
+    _, bridged_channel = bridged_channels
+    received = []
+
+    async def callback(index):
+        received.append(index)
+
+    await bridged_channel.new_consumer(callback)
+    process = multiprocessing.get_context("spawn").Process(
+        target=write_in_bridged_channel, args=(ring.name, 10)
+    )
+    process.start()
+    await asyncio.get_running_loop().run_in_executor(None, process.join, 30)
+    assert process.exitcode == 0
+    for _ in range(100):
+        if len(received) == 10:
+            break
+        await asyncio.sleep(0.01)
+    assert received == list(range(10))
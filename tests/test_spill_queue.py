@@ -0,0 +1,142 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import os
+import threading
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.queues as queues
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_spill_and_read_back_in_order():
+    queue = queues.SpillQueue(memory_size=4, batch_size=2)
+    for index in range(10):
+        await queue.put({"index": index})
+    assert queue.qsize() == 10
+    assert not queue.empty()
+    assert not queue.full()
+    assert len(queue._queue) <= 4
+    assert queue.spilled_count == 6
+    assert queue.get_pending_spilled_count() == 6
+    assert queue.spilled_bytes > 0
+    assert [(await queue.get())["index"] for _ in range(10)] == list(range(10))
+    assert queue.empty()
+    assert queue.read_back_count == 6
+    assert queue.read_back_bytes == queue.spilled_bytes
+    assert queue.get_pending_spilled_count() == 0
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_interleaved_put_and_get():
+    queue = queues.SpillQueue(memory_size=3, batch_size=2)
+    received = []
+    for index in range(50):
+        queue.put_nowait(index)
+        if index % 3 == 0:
+            received.append(queue.get_nowait())
+    while not queue.empty():
+        received.append(queue.get_nowait())
+    assert received == list(range(50))
+    assert queue.spilled_count == queue.read_back_count > 0
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_spill_file_is_emptied(tmp_path):
+    queue = queues.SpillQueue(memory_size=2, batch_size=2, directory=str(tmp_path))
+    for index in range(6):
+        queue.put_nowait(index)
+    assert os.fstat(queue._spill_file.fileno()).st_size > 0
+    for _ in range(6):
+        queue.get_nowait()
+    assert os.fstat(queue._spill_file.fileno()).st_size == 0
+    queue.close()
+    assert queue._spill_file is None
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_data_is_kept_in_memory():
+    queue = queues.SpillQueue(memory_size=2, batch_size=2)
+    lock = threading.Lock()
+    for item in (0, lock, 1, 2, 3):
+        queue.put_nowait(item)
+    # 0 is spilled, the lock and the data queued after it are kept in memory
+    assert queue.spilled_count == 1
+    assert queue.unspillable_count == 1
+    assert queue.qsize() == 5
+    assert queue.get_nowait() == 0
+    assert queue.get_nowait() is lock
+    # spilling resumes once the lock has been got
+    queue.put_nowait(4)
+    assert queue.spilled_count == 3
+    assert [queue.get_nowait() for _ in range(4)] == [1, 2, 3, 4]
+    assert queue.empty()
+    queue.close()
+
+
+def test_invalid_memory_size():
+    with pytest.raises(ValueError):
+        queues.SpillQueue(memory_size=0)
+
+
+@pytest.mark.asyncio
+async def test_join():
+    queue = queues.SpillQueue(memory_size=1, batch_size=1)
+    for index in range(3):
+        queue.put_nowait(index)
+    for _ in range(3):
+        queue.get_nowait()
+        queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_stalled_consumer_queue(synchronized_channel):
+    received = []
+
+    async def callback(index):
+        received.append(index)
+
+    consumer = await synchronized_channel.new_consumer(callback, queue=queues.SpillQueue(memory_size=10, batch_size=5))
+    producer = synchronized_channel.get_internal_producer()
+    for index in range(100):
+        await producer.send({"index": index})
+    assert consumer.queue.qsize() == 100
+    assert consumer.queue.spilled_count == 90
+    await producer.synchronized_perform_consumers_queue(1, False, 0)
+    assert received == list(range(100))
+    consumer.queue.close()
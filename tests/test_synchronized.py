@@ -21,6 +21,7 @@ import pytest
 
 import async_channel.channels as channels
 import async_channel.producer as channel_producer
+import async_channel.queues as queues
 import async_channel.util as util
 import tests 
 
@@ -271,3 +272,70 @@ async def test_producer_synchronized_perform_consumers_queue_with_multiple_consu
         assert producer.is_consumers_queue_empty(1)
         assert producer.is_consumers_queue_empty(2)
         assert producer.is_consumers_queue_empty(3)
+
+
+@pytest.mark.asyncio
+async def test_synchronized_perform_consumers_queue_skips_clean_consumers(synchronized_channel):
+    async def callback():
+        pass
+
+    test_consumer_1 = await synchronized_channel.new_consumer(callback)
+    test_consumer_2 = await synchronized_channel.new_consumer(callback)
+
+    producer = SynchronizedProducerTest(channels.get_chan(TEST_SYNCHRONIZED_CHANNEL))
+    await producer.run()
+    tracker = synchronized_channel.dirty_consumers_tracker
+
+    await test_consumer_2.queue.put({})
+    assert tracker.get_dirty_consumers(1) == [test_consumer_2]
+    with mock.patch.object(test_consumer_1, 'join', new=mock.AsyncMock()) as join_1_mock, \
+            mock.patch.object(test_consumer_2, 'join', new=mock.AsyncMock()) as join_2_mock:
+        await producer.synchronized_perform_consumers_queue(1, True, 1)
+        join_1_mock.assert_not_called()
+        join_2_mock.assert_called_once_with(1)
+    assert tracker.get_dirty_consumers(1) == []
+    assert producer.is_consumers_queue_empty(1)
+
+
+@pytest.mark.asyncio
+async def test_synchronized_perform_consumers_queue_performs_refilled_next_consumers(synchronized_channel):
+    calls = []
+
+    async def callback_2():
+        calls.append(2)
+
+    test_consumer_2 = None
+
+    async def callback_1():
+        calls.append(1)
+        await test_consumer_2.queue.put({})
+
+    await synchronized_channel.new_consumer(callback_1)
+    test_consumer_2 = await synchronized_channel.new_consumer(callback_2)
+
+    producer = SynchronizedProducerTest(channels.get_chan(TEST_SYNCHRONIZED_CHANNEL))
+    await producer.run()
+
+    await producer.send({})
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    # test_consumer_2 is performed after test_consumer_1 refilled it
+    assert calls == [1, 2, 2]
+    assert producer.is_consumers_queue_empty(1)
+
+
+@pytest.mark.asyncio
+async def test_is_synchronized_tracks_dirty_consumers():
+    channel = tests.EmptyTestChannel()
+    test_consumer = await channel.new_consumer(tests.empty_test_callback)
+    assert channel.dirty_consumers_tracker is None
+    await test_consumer.queue.put({})
+
+    channel.is_synchronized = True
+    assert channel.is_synchronized
+    assert channel.dirty_consumers_tracker.get_dirty_consumers(1) == [test_consumer]
+
+    channel.is_synchronized = False
+    assert not channel.is_synchronized
+    assert channel.dirty_consumers_tracker is None
+    assert not queues.is_observed(test_consumer.queue)
+    await channel.remove_consumer(test_consumer)
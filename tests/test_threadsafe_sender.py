@@ -0,0 +1,151 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import threading
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+async def _wait_for_buffer_flush(sender):
+    for _ in range(100):
+        if not sender.get_buffer_size() and not sender._is_flush_scheduled:
+            return
+        await tests.wait_asyncio_next_cycle()
+    raise AssertionError("buffer not flushed")
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_requires_enable(synchronized_channel):
+    with pytest.raises(RuntimeError):
+        synchronized_channel.get_internal_producer().send_threadsafe({})
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_from_thread(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    sender = producer.enable_threadsafe_send()
+    assert producer.enable_threadsafe_send() is sender
+
+    def feed():
+        for index in range(1000):
+            assert producer.send_threadsafe({"index": index})
+
+    thread = threading.Thread(target=feed)
+    thread.start()
+    await asyncio.get_running_loop().run_in_executor(None, thread.join)
+    await _wait_for_buffer_flush(sender)
+    assert consumer.queue.qsize() == 1000
+    assert [consumer.queue.get_nowait()["index"] for _ in range(1000)] == list(range(1000))
+    assert sender.put_count == 1000
+    assert sender.dropped_count == 0
+    assert 1 <= sender.wakeups_count < 1000
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_wakes_up_once_per_batch(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    sender = producer.enable_threadsafe_send()
+    for index in range(10):
+        producer.send_threadsafe({"index": index})
+    assert sender.wakeups_count == 1
+    await _wait_for_buffer_flush(sender)
+    assert consumer.queue.qsize() == 10
+    producer.send_threadsafe({})
+    assert sender.wakeups_count == 2
+    await _wait_for_buffer_flush(sender)
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_bounded_buffer(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    sender = producer.enable_threadsafe_send(max_buffer_size=2)
+    assert producer.send_threadsafe({})
+    assert producer.send_threadsafe({})
+    assert not producer.send_threadsafe({})
+    assert not producer.send_threadsafe({}, block=True, timeout=0.01)
+    assert sender.dropped_count == 2
+    await _wait_for_buffer_flush(sender)
+    assert consumer.queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_blocking(synchronized_channel):
+    consumer = await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    producer.enable_threadsafe_send(max_buffer_size=1)
+    results = []
+
+    def feed():
+        for _ in range(3):
+            results.append(producer.send_threadsafe({}, block=True, timeout=5))
+
+    await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(None, feed), 5)
+    await _wait_for_buffer_flush(producer.threadsafe_sender)
+    assert results == [True, True, True]
+    assert consumer.queue.qsize() == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_clears_threadsafe_buffer(synchronized_channel):
+    await synchronized_channel.new_consumer(tests.empty_test_callback)
+    producer = synchronized_channel.get_internal_producer()
+    sender = producer.enable_threadsafe_send()
+    producer.send_threadsafe({})
+    await producer.stop()
+    assert sender.get_buffer_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_send_threadsafe_bound_counts_sent_data():
+    sent = []
+    can_send = asyncio.Event()
+
+    async def send(data):
+        await can_send.wait()
+        sent.append(data)
+
+    sender = util.ThreadSafeSender(send, asyncio.get_running_loop(), max_buffer_size=2)
+    assert sender.put(0)
+    assert sender.put(1)
+    await tests.wait_asyncio_next_cycle()
+    # 0 is being sent: only one buffer slot is left
+    assert sender.get_buffer_size() == 1
+    assert not sender.put(2)
+    can_send.set()
+    await _wait_for_buffer_flush(sender)
+    assert sender.put(3)
+    await _wait_for_buffer_flush(sender)
+    assert sent == [0, 1, 3]
+    assert sender.dropped_count == 1
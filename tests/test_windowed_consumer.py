@@ -0,0 +1,195 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import operator
+
+import pytest
+import pytest_asyncio
+
+import async_channel.channels as channels
+import async_channel.consumers as consumers
+import async_channel.util as util
+import tests
+
+
+@pytest_asyncio.fixture
+async def test_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+@pytest_asyncio.fixture
+async def synchronized_channel():
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+    channel = await util.create_channel_instance(tests.EmptyTestChannel, channels.set_chan, is_synchronized=True)
+    yield channel
+    for consumer in channel.get_consumers():
+        await channel.remove_consumer(consumer)
+    await channel.stop()
+    channels.del_chan(tests.EMPTY_TEST_CHANNEL)
+
+
+def test_window_is_required():
+    with pytest.raises(ValueError):
+        consumers.WindowedConsumer(tests.empty_test_callback)
+    with pytest.raises(ValueError):
+        consumers.WindowedConsumer(tests.empty_test_callback, window_count=2, window_duration=1)
+    with pytest.raises(ValueError):
+        consumers.WindowedConsumer(tests.empty_test_callback, window_count=2, slide=0)
+
+
+@pytest.mark.asyncio
+async def test_tumbling_count_windows(synchronized_channel):
+    windows = []
+
+    async def callback(window):
+        windows.append([data["index"] for data in window])
+
+    consumer = await synchronized_channel.new_consumer(
+        callback, consumer_class=consumers.WindowedConsumer, window_count=3
+    )
+    producer = synchronized_channel.get_internal_producer()
+    for index in range(7):
+        await producer.send({"index": index})
+    await producer.synchronized_perform_consumers_queue(1, False, 0)
+    assert windows == [[0, 1, 2], [3, 4, 5]]
+    await consumer.flush_windows()
+    assert windows == [[0, 1, 2], [3, 4, 5], [6]]
+    assert consumer.windows_count == 3
+    await consumer.flush_windows()
+    assert consumer.windows_count == 3
+
+
+@pytest.mark.asyncio
+async def test_sliding_count_windows(synchronized_channel):
+    windows = []
+
+    async def callback(window):
+        windows.append(window)
+
+    consumer = await synchronized_channel.new_consumer(
+        callback,
+        consumer_class=consumers.WindowedConsumer,
+        window_count=3,
+        slide=2,
+        reducer=lambda total, data: total + data["index"],
+        initial=0,
+    )
+    producer = synchronized_channel.get_internal_producer()
+    for index in range(8):
+        await producer.send({"index": index})
+    await producer.synchronized_perform_consumers_queue(1, False, 0)
+    # windows [0, 1, 2], [2, 3, 4], [4, 5, 6]
+    assert windows == [3, 9, 15]
+    await consumer.flush_windows()
+    # window [5, 6, 7]
+    assert windows == [3, 9, 15, 18]
+
+
+@pytest.mark.asyncio
+async def test_tumbling_time_windows(test_channel):
+    windows = []
+
+    async def callback(window):
+        windows.append(window)
+
+    consumer = await test_channel.new_consumer(
+        callback,
+        consumer_class=consumers.WindowedConsumer,
+        window_duration=0.05,
+        reducer=operator.or_,
+    )
+    loop = asyncio.get_running_loop()
+    # starts right after a window end
+    await asyncio.sleep(0.05 - loop.time() % 0.05 + 0.005)
+    producer = test_channel.get_internal_producer()
+    for index in range(3):
+        await producer.send({"index": index})
+    await tests.wait_asyncio_next_cycle()
+    assert windows == []
+    assert consumer._scheduled_deadline is not None
+    await asyncio.sleep(0.08)
+    assert len(windows) == 1
+    assert windows[0] == {"index": 2}
+    assert consumer._scheduled_deadline is None
+    await asyncio.sleep(0.06)
+    # empty windows are skipped
+    assert consumer.windows_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sliding_time_windows(synchronized_channel):
+    windows = []
+
+    async def callback(window):
+        windows.append([data["index"] for data in window])
+
+    consumer = await synchronized_channel.new_consumer(
+        callback, consumer_class=consumers.WindowedConsumer, window_duration=0.1, slide=0.05
+    )
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(0.05 - loop.time() % 0.05 + 0.005)
+    await consumer.perform({"index": 0})
+    await asyncio.sleep(0.05)
+    await consumer.perform({"index": 1})
+    await consumer.flush_windows()
+    # index 0 is in the windows ending before and after index 1 is received
+    assert windows[0] == [0]
+    assert windows[1:] == [[0, 1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_window_timer_is_shared(test_channel):
+    windowed_consumers = [
+        await test_channel.new_consumer(
+            tests.empty_test_callback, consumer_class=consumers.WindowedConsumer, window_duration=10
+        )
+        for _ in range(5)
+    ]
+    window_timer = consumers.get_window_timer()
+    assert consumers.get_window_timer() is window_timer
+    scheduled_count = window_timer.get_scheduled_count()
+    producer = test_channel.get_internal_producer()
+    for _ in range(3):
+        await producer.send({})
+    await tests.wait_asyncio_next_cycle()
+    assert window_timer.get_scheduled_count() == scheduled_count + len(windowed_consumers)
+    handles = [
+        handle for handle in asyncio.get_running_loop()._scheduled
+        if not handle.cancelled() and handle._callback == window_timer._on_deadline
+    ]
+    assert len(handles) == 1
+
+
+@pytest.mark.asyncio
+async def test_window_callback_exception(test_channel):
+    async def callback(window):
+        raise RuntimeError(window)
+
+    consumer = await test_channel.new_consumer(
+        callback, consumer_class=consumers.WindowedConsumer, window_duration=0.01
+    )
+    await test_channel.get_internal_producer().send({})
+    await asyncio.sleep(0.05)
+    assert consumer.windows_count == 1
+    await test_channel.get_internal_producer().send({})
+    await asyncio.sleep(0.05)
+    assert consumer.windows_count == 2